@@ -1,6 +1,14 @@
-from .contributors import ProcessContributors
-from .models import PersonModel, ReviewModel
-from .parse_issues import ProcessIssues
+import importlib
+
+# The classes below are imported when first used, so that importing
+# pyosmeta (e.g. by a console script that doesn't need them) doesn't load
+# Pydantic, requests, tqdm, ruamel and dotenv
+_LAZY_IMPORTS = {
+    "ProcessContributors": ".contributors",
+    "PersonModel": ".models",
+    "ReviewModel": ".models",
+    "ProcessIssues": ".parse_issues",
+}
 
 # Trick suggested by flake8 maintainer to ensure the imports above don't
 # get flagged as being "unused"
@@ -15,3 +23,16 @@ try:
     from ._version_generated import __version__
 except ImportError:
     __version__ = "unreleased"
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
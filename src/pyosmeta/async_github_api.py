@@ -0,0 +1,342 @@
+"""
+An asyncio counterpart of :class:`pyosmeta.github_api.GitHubAPI`.
+
+:class:`AsyncGitHubAPI` has the same methods for fetching repository
+metadata and user info, as coroutines, so that hundreds of requests can be
+made from one event loop, e.g.::
+
+    async def fetch_all(endpoints):
+        api = AsyncGitHubAPI()
+        metas = await asyncio.gather(
+            *(api.get_repo_meta_github(repo) for repo in endpoints.values())
+        )
+        return dict(zip(endpoints, metas))
+
+or :meth:`AsyncGitHubAPI.get_metrics` fetches every review's metrics like
+:meth:`pyosmeta.github_api.GitHubAPI.get_metrics`::
+
+    reviews = asyncio.run(AsyncGitHubAPI().get_metrics(endpoints, reviews))
+
+Requests are sent with :func:`pyosmeta.instrumentation.http_get` in worker
+threads, so they are instrumented, and recorded or replayed (see
+:mod:`pyosmeta.http_replay`), like the requests of the other scripts. At
+most ``max_concurrency`` requests are in flight at once. All coroutines
+share one token pool and its rate limit budgets: when every token is
+exhausted, they all wait for the rate limit to reset.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Union
+
+import requests
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+
+from .checkpoint import CheckpointJournal
+from .github_api import GitHubAPI, GitHubAPIError
+from .instrumentation import http_get, instrumented, recorder
+from .logging import logger
+from .models import ReviewModel
+from .models.base import RepositoryHost
+from .repository_hosts import (
+    RepositoryBackend,
+    count_workers,
+    submit_repo_metas,
+)
+
+__all__ = ["AsyncGitHubAPI", "GitHubAPIError"]
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncGitHubAPI(GitHubAPI):
+    """Fetch GitHub repository metadata and user info with asyncio.
+
+    Takes the same parameters as :class:`pyosmeta.github_api.GitHubAPI`,
+    and ``max_concurrency``, the maximum number of requests in flight at
+    once. ``_get_response_rest``, ``_get_contrib_count_rest``,
+    ``_get_metrics_rest``, ``get_repo_meta_github``, ``get_metrics`` and
+    ``get_user_info`` are coroutines, and raise the same errors as their ``GitHubAPI``
+    counterparts.
+
+    The client can be used from any event loop, but only one at a time.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        # The event loop the semaphore was created for, and the semaphore
+        self._semaphore: Optional[
+            tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = None
+        # Set while every token's rate limit is exhausted, until it resets
+        self._rate_limit_reset: float = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting requests on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait until the shared rate limit resets, if it's exhausted."""
+        wait = self._rate_limit_reset - time.time()
+        if wait > 0:
+            recorder.record_sleep(wait)
+            await asyncio.sleep(wait)
+
+    async def _request(self, url: str) -> requests.Response:
+        """Make a GET request to the GitHub API, rotating tokens as needed.
+
+        See :meth:`GitHubAPI._request`. Requests wait for a free slot (at
+        most ``max_concurrency`` run at once) and for the rate limit to
+        reset if every token is exhausted.
+        """
+        async with self._get_semaphore():
+            await self._wait_for_rate_limit()
+            budgets = self._tokens_by_headroom()
+            for attempt, budget in enumerate(budgets, start=1):
+                response = await asyncio.to_thread(
+                    http_get, url, retry=attempt > 1, headers=budget.headers
+                )
+                budget.update(response)
+                if not self._retry_with_next_token(response, budgets, attempt):
+                    return response
+                logger.warning(
+                    "GitHub token rate limit exhausted. Retrying "
+                    f"{url} with another token."
+                )
+
+    def handle_rate_limit(self, response):
+        """Make every request wait until the rate limit resets, if
+        ``response`` exhausted it and no token has budget left."""
+        wait = self._rate_limit_wait(response)
+        if wait:
+            self._rate_limit_reset = max(
+                self._rate_limit_reset, time.time() + wait
+            )
+
+    @instrumented("AsyncGitHubAPI._get_response_rest")
+    async def _get_response_rest(self, url: str) -> list[dict[str, Any]]:
+        """Make a GET request to the GitHub REST API.
+        Handles pagination and rate limiting.
+
+        Parameters
+        ----------
+        url : str
+            The API endpoint URL.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            A list of JSON responses from GitHub API requests.
+        """
+        results = []
+        api_endpoint_url = url
+
+        while api_endpoint_url:
+            response = await self._request(api_endpoint_url)
+
+            self._raise_for_run_errors(response, api_endpoint_url)
+            if response.status_code == 403:
+                logger.warning(
+                    "403 Forbidden (permission denied, not rate-limited) "
+                    f"calling {api_endpoint_url}.\n"
+                    f"API Response Text: {response.text}"
+                )
+                break
+
+            response.raise_for_status()
+            results.extend(response.json())
+
+            # Handle pagination & rate limiting
+            api_endpoint_url = response.links.get("next", {}).get("url")
+            self.handle_rate_limit(response)
+
+        return results
+
+    @instrumented("AsyncGitHubAPI._get_contrib_count_rest")
+    async def _get_contrib_count_rest(self, url: dict[str, str]) -> int | None:
+        """Return the count of total contributors to a repository.
+
+        See :meth:`GitHubAPI._get_contrib_count_rest`.
+        """
+        repo_contribs_url = self._repo_url(url, "/contributors")
+        contributors = await self._get_response_rest(repo_contribs_url)
+        return self._count_contributors(contributors, repo_contribs_url)
+
+    @instrumented("AsyncGitHubAPI._get_metrics_rest")
+    async def _get_metrics_rest(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """Get GitHub metadata from the GitHub REST API for a single
+        repository.
+
+        See :meth:`GitHubAPI._get_metrics_rest`.
+        """
+        response = await self._request(self._repo_url(repo_info))
+        return self._parse_metrics_response(response, repo_info)
+
+    @instrumented("AsyncGitHubAPI.get_repo_meta_github")
+    async def get_repo_meta_github(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """Get GitHub metadata for a repository, REST-first.
+
+        See :meth:`GitHubAPI.get_repo_meta_github`.
+
+        Parameters
+        ----------
+        repo_info : dict
+            A dictionary containing the owner and repository name.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            A dictionary containing the specified GitHub metrics for the
+            repository. Returns None if the repository is not found or
+            access is forbidden.
+        """
+        metrics = await self._get_metrics_rest(repo_info)
+        if metrics is not None:
+            metrics["contrib_count"] = await self._get_contrib_count_rest(
+                repo_info
+            )
+
+        return metrics
+
+    async def get_metrics(
+        self,
+        endpoints: dict[str, dict[str, str]],
+        reviews: dict[str, ReviewModel],
+        checkpoint: CheckpointJournal | None = None,
+        backends: dict[RepositoryHost, RepositoryBackend] | None = None,
+    ) -> dict[str, ReviewModel]:
+        """Fetch repository metrics for all reviews.
+
+        See :meth:`GitHubAPI.get_metrics`. GitHub packages are fetched
+        concurrently, at most ``max_concurrency`` at once, while packages
+        on other hosts are fetched by their backend in background threads.
+
+        Parameters
+        ----------
+        endpoints : dict
+            A dictionary mapping package names to their owner and repo-names.
+        reviews : dict
+            A dictionary containing review data.
+        checkpoint : CheckpointJournal, Optional
+            Journal of completed fetches, reused and recorded to.
+        backends : dict, Optional
+            The backend of each repository host other than GitHub.
+
+        Returns
+        -------
+        dict
+            Review data with freshly fetched ``gh_meta`` where the API
+            succeeded, or ``None`` where it did not.
+        """
+        host_jobs = self._host_jobs(endpoints, reviews, checkpoint, backends)
+        with ThreadPoolExecutor(
+            max_workers=count_workers(host_jobs) or 1,
+            thread_name_prefix="pyosmeta-hosts",
+        ) as executor:
+            host_futures = submit_repo_metas(executor, host_jobs)
+            await self._get_github_metrics(endpoints, reviews, checkpoint)
+
+            for future in host_futures:
+                host_metas = await asyncio.wrap_future(future)
+                for pkg_name, new_metadata in host_metas.items():
+                    self._set_metrics(
+                        reviews, pkg_name, new_metadata, checkpoint
+                    )
+
+        return reviews
+
+    async def _get_github_metrics(
+        self,
+        endpoints: dict[str, dict[str, str]],
+        reviews: dict[str, ReviewModel],
+        checkpoint: CheckpointJournal | None,
+    ) -> None:
+        """Fetch the metrics of the GitHub packages concurrently.
+
+        See :meth:`GitHubAPI._get_github_metrics`. Once a ``GitHubAPIError``
+        is raised, no further packages are fetched.
+        """
+        stop_metrics_run = False
+        # Limits packages in flight, so that none start after a stop
+        package_slots = asyncio.Semaphore(self.max_concurrency)
+
+        github_endpoints = {
+            pkg_name: owner_repo
+            for pkg_name, owner_repo in endpoints.items()
+            if reviews[pkg_name].repository_host == RepositoryHost.github
+        }
+        progress = tqdm(
+            total=len(github_endpoints), desc="Fetching repo metadata"
+        )
+
+        async def fetch(pkg_name: str, owner_repo: dict[str, str]) -> None:
+            nonlocal stop_metrics_run
+            if checkpoint is not None and pkg_name in checkpoint:
+                reviews[pkg_name].gh_meta = checkpoint.get(pkg_name)
+                progress.update()
+                return
+
+            new_metadata = None
+            async with package_slots:
+                if not stop_metrics_run:
+                    try:
+                        new_metadata = await self.get_repo_meta_github(
+                            owner_repo
+                        )
+                    except GitHubAPIError as exc:
+                        if not stop_metrics_run:
+                            logger.error(
+                                f"Stopping GitHub metrics run early: {exc} "
+                                "Remaining packages will keep empty gh_meta "
+                                "for gap-fill from previously saved metrics."
+                            )
+                        stop_metrics_run = True
+                    except Exception:
+                        logger.warning(
+                            f"Unexpected error fetching GitHub metrics for "
+                            f"{pkg_name}. Treating this package as a failed "
+                            "fetch.",
+                            exc_info=True,
+                        )
+            self._set_metrics(reviews, pkg_name, new_metadata, checkpoint)
+            progress.update()
+
+        with progress, logging_redirect_tqdm():
+            await asyncio.gather(
+                *(
+                    fetch(pkg_name, owner_repo)
+                    for pkg_name, owner_repo in github_endpoints.items()
+                )
+            )
+
+    @instrumented("AsyncGitHubAPI.get_user_info")
+    async def get_user_info(
+        self, gh_handle: str, name: Optional[str] = None
+    ) -> dict[str, Union[str, Any]]:
+        """Get a single user's information from their GitHub username.
+
+        See :meth:`GitHubAPI.get_user_info`.
+        """
+        url = f"https://api.github.com/users/{gh_handle}"
+        response = await self._request(url)
+
+        if response.status_code == 401:
+            raise ValueError(
+                "Oops, I couldn't authenticate. Please check your token."
+            )
+        return response.json()
@@ -0,0 +1,106 @@
+"""
+A small append-only journal that checkpoints long GitHub API runs.
+
+``update-reviews`` and ``update-contributors`` make hundreds of GitHub API
+calls. If a run stops partway through (e.g. the rate limit runs out), the
+data fetched so far is recorded here so that a ``--resume`` run can reuse
+it rather than fetching everything again.
+
+Each line of the journal is a JSON object::
+
+    {"key": "sunpy", "fetched_at": "2026-10-19T12:00:00+00:00", "data": {...}}
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from .logging import logger
+
+DEFAULT_MAX_AGE = timedelta(hours=24)
+"""How long a checkpointed fetch counts as fresh for a resumed run"""
+
+
+class CheckpointJournal:
+    """Record completed fetches so an interrupted run can be resumed.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the journal file (JSON lines).
+    resume : bool
+        If True, load fetches recorded within ``max_age`` and keep appending
+        to the existing journal. If False, start a new (empty) journal.
+    max_age : timedelta
+        Entries older than this are ignored when resuming.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        resume: bool = False,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        self.path = Path(path)
+        self.max_age = max_age
+        self._entries: dict[str, dict[str, Any]] = {}
+
+        if resume:
+            self._entries = self._load()
+            logger.info(
+                f"Resuming from {len(self._entries)} checkpointed fetches "
+                f"in {self.path}"
+            )
+        else:
+            self.path.write_text("")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Read entries recorded within the refresh window from disk."""
+        if not self.path.exists():
+            return {}
+
+        cutoff = datetime.now(timezone.utc) - self.max_age
+        entries = {}
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    fetched_at = datetime.fromisoformat(entry["fetched_at"])
+                except (json.JSONDecodeError, KeyError, ValueError):
+                    # eg. a partially written last line from a crashed run
+                    logger.warning(
+                        f"Skipping unreadable checkpoint entry in {self.path}"
+                    )
+                    continue
+                if fetched_at >= cutoff:
+                    entries[entry["key"]] = entry["data"]
+        return entries
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the checkpointed data for ``key``, if any."""
+        return self._entries.get(key)
+
+    def record(self, key: str, data: dict[str, Any]) -> None:
+        """Append a completed fetch to the journal.
+
+        The entry is flushed to disk right away so it survives the process
+        being interrupted.
+        """
+        entry = {
+            "key": key,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "data": data,
+        }
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._entries[key] = data
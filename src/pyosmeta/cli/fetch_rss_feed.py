@@ -1,14 +1,45 @@
 import click
 
+from pyosmeta.http_replay import http_cassette
 from pyosmeta.parse_rss import create_rss_feed_stubs
+from pyosmeta.profiling import profile_run
 
 
 @click.command()
 @click.argument("url")
 @click.argument("output_dir")
-def main(url: str, output_dir: str):
+@click.option(
+    "--profile",
+    metavar="DIR",
+    help="Profile the run and write pstats and flamegraph files to this "
+    "directory",
+)
+@click.option(
+    "--record-http",
+    metavar="DIR",
+    help="Record every HTTP response of the run to this directory",
+)
+@click.option(
+    "--replay-http",
+    metavar="DIR",
+    help="Replay the HTTP responses recorded in this directory instead of "
+    "using the network",
+)
+def main(
+    url: str,
+    output_dir: str,
+    profile: str | None,
+    record_http: str | None,
+    replay_http: str | None,
+):
     """Create markdown stubs from an RSS feed URL into a directory."""
-    create_rss_feed_stubs(url, output_dir)
+    if record_http and replay_http:
+        raise click.UsageError(
+            "--record-http and --replay-http can't be used together"
+        )
+    with http_cassette(record_http, replay_http):
+        with profile_run(profile):
+            create_rss_feed_stubs(url, output_dir)
 
 
 if __name__ == "__main__":
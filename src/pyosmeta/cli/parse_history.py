@@ -13,16 +13,40 @@ highlighted as "new" and also for diff's in git.
 
 """
 
+import argparse
 import os
 import pickle
 
-import git
-
 from pyosmeta.constants import CONTRIBUTORS_RAW_URL, CONTRIBUTORS_REL_PATH
 from pyosmeta.file_io import open_yml_file
+from pyosmeta.http_replay import add_cassette_arguments, http_cassette
+from pyosmeta.profiling import profile_run
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="A CLI script to find when contributors were added"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile the run and write pstats and flamegraph files to this "
+        "directory",
+    )
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+
+    with http_cassette(args.record_http, args.replay_http):
+        with profile_run(args.profile):
+            parse_history()
+
+
+def parse_history():
+    """Find the date each contributor was first added to contributors.yml
+    and save them to contrib_dates.pickle."""
+    # GitPython is slow to import and isn't needed for --help
+    import git
+
     web_contribs = open_yml_file(CONTRIBUTORS_RAW_URL)
 
     def find_name(name: str, a_list: dict[str, str]) -> str:
@@ -15,27 +15,57 @@ Output: packages.yml file containing a list of:
  3. basic package stats including stars, etc.
  4. partner information
 
+With ``--under-review``, it also writes under_review.yml: the packages
+whose reviews are in progress, from the same fetch of the review issues.
+
 To run at the CLI: parse_issue_metadata
 """
 
-# TODO: if we export files we might want packages.yml and then under_review.yml
-# thus we'd want to add a second input parameter which was file_name
-# TODO: feature - Create an "under review now" list as well
-
+import argparse
 import pickle
+from datetime import timedelta
 
 from pydantic import ValidationError
 
 from pyosmeta import ProcessIssues
-from pyosmeta.constants import PACKAGES_RAW_URL
-from pyosmeta.file_io import load_website_yml
-from pyosmeta.github_api import GitHubAPI
+from pyosmeta.checkpoint import CheckpointJournal
+from pyosmeta.constants import PACKAGES_REL_PATH, UNDER_REVIEW_REL_PATH
+from pyosmeta.data_sources import WebsiteDataSource, get_data_source
+from pyosmeta.file_io import clean_export_yml
+from pyosmeta.github_api import (
+    DEFAULT_TTL_HOURS,
+    GitHubAPI,
+    MetricsRefreshPolicy,
+)
+from pyosmeta.http_replay import add_cassette_arguments, http_cassette
+from pyosmeta.instrumentation import recorder
 from pyosmeta.logging import logger
+from pyosmeta.metrics_store import MetricsStore
 from pyosmeta.models import ReviewModel
 from pyosmeta.models.base import GhMeta
+from pyosmeta.parse_cache import DEFAULT_PARSE_CACHE, ParseCache
+from pyosmeta.profiling import profile_run
+from pyosmeta.review_sources import (
+    DEFAULT_ISSUE_STORE,
+    IssueStore,
+    ReviewSource,
+)
+from pyosmeta.review_status import (
+    LIFECYCLE_LABELS,
+    ReviewStatus,
+    build_under_review,
+    classify_issues,
+)
+
+# Journal of GitHub metrics fetched so far, used by --resume
+METRICS_CHECKPOINT = "metrics_checkpoint.jsonl"
+# History of GitHub metrics snapshots, appended to on every run
+METRICS_STORE = "metrics_history"
 
 
-def get_existing_gh_meta(url: str = PACKAGES_RAW_URL) -> dict[str, GhMeta]:
+def get_existing_gh_meta(
+    source: WebsiteDataSource | None = None,
+) -> dict[str, GhMeta]:
     """Load the currently published packages.yml and pull out the
     ``gh_meta`` block for each package, keyed by lowercased package name.
 
@@ -44,8 +74,9 @@ def get_existing_gh_meta(url: str = PACKAGES_RAW_URL) -> dict[str, GhMeta]:
 
     Parameters
     ----------
-    url : str
-        URL to the live packages.yml file.
+    source : WebsiteDataSource, Optional
+        Where to read packages.yml from. Defaults to the (cached) live file
+        on GitHub.
 
     Returns
     -------
@@ -56,7 +87,10 @@ def get_existing_gh_meta(url: str = PACKAGES_RAW_URL) -> dict[str, GhMeta]:
     """
     # TODO: fail fast if packages.yml cannot be loaded (separate follow-up).
     try:
-        existing_packages = load_website_yml("package_name", url)
+        source = source or get_data_source()
+        existing_packages = source.read_yml_dict(
+            PACKAGES_REL_PATH, "package_name"
+        )
     except Exception:
         logger.error(
             "Couldn't load the existing packages.yml. Continuing without "
@@ -111,18 +145,160 @@ def update_gh_meta(
     return reviews
 
 
+def add_review_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options used by :func:`update_reviews` (except those shared
+    with the other scripts) to a CLI."""
+    parser.add_argument(
+        "--ttl-hours",
+        type=float,
+        default=DEFAULT_TTL_HOURS,
+        help="Don't refresh GitHub metrics fetched within this many hours "
+        f"(default: {DEFAULT_TTL_HOURS})",
+    )
+    parser.add_argument(
+        "--archived-ttl-days",
+        type=float,
+        default=30,
+        help="Don't refresh GitHub metrics for archived packages fetched "
+        "within this many days (default: 30)",
+    )
+    parser.add_argument(
+        "--metrics-store",
+        default=METRICS_STORE,
+        help="Directory to append this run's GitHub metrics snapshots to "
+        f"(default: {METRICS_STORE})",
+    )
+    parser.add_argument(
+        "--under-review",
+        action="store_true",
+        help="Fetch every review issue, and also write the reviews in "
+        f"progress to {UNDER_REVIEW_REL_PATH}",
+    )
+    parser.add_argument(
+        "--review-sources",
+        nargs="+",
+        metavar="ORG[/REPO]",
+        help="Read review issues from these repositories, or every "
+        "repository of these orgs, in order of precedence (default: "
+        "pyopensci/software-submission)",
+    )
+    parser.add_argument(
+        "--issue-store",
+        nargs="?",
+        const=str(DEFAULT_ISSUE_STORE),
+        metavar="DIR",
+        help="Keep fetched review issues in this directory and only fetch "
+        "the issues updated since the last run "
+        f"(default DIR: {DEFAULT_ISSUE_STORE})",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        nargs="?",
+        const=str(DEFAULT_PARSE_CACHE),
+        metavar="FILE",
+        help="Keep parsed reviews in this file and only parse the issues "
+        "whose body or labels changed since the last run "
+        f"(default FILE: {DEFAULT_PARSE_CACHE})",
+    )
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="A CLI script to update pyOpenSci reviews"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse GitHub metrics fetched in the last 24 hours by an "
+        "interrupted run instead of fetching them again",
+    )
+    add_review_arguments(parser)
+    parser.add_argument(
+        "--website-path",
+        help="Read packages.yml from this local clone of "
+        "pyopensci.github.io instead of downloading it. Warns if the clone "
+        "is behind origin/main, which runs git ls-remote over the network.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile the run and write per-stage pstats and flamegraph "
+        "files to this directory",
+    )
+    parser.add_argument(
+        "--run-report",
+        help="Write a JSON report of the run's stage timings and network "
+        "requests to this file",
+    )
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        with http_cassette(args.record_http, args.replay_http):
+            with profile_run(args.profile):
+                update_reviews(args)
+    finally:
+        if args.run_report:
+            recorder.write_report(args.run_report)
+
+
+def update_reviews(
+    args: argparse.Namespace, save: bool = True
+) -> dict[str, ReviewModel]:
+    """Parse accepted reviews and refresh their GitHub metrics.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The CLI options.
+    save : bool
+        Whether to save the reviews to all_reviews.pickle for
+        update-review-teams.
+
+    Returns
+    -------
+    dict[str, ReviewModel]
+        The reviews, keyed by package name.
+    """
     github_api = GitHubAPI(
         org="pyopensci",
         repo="software-submission",
-        labels=["6/pyOS-approved"],
+        labels=list(LIFECYCLE_LABELS)
+        if args.under_review
+        else ["6/pyOS-approved"],
     )
 
-    process_review = ProcessIssues(github_api)
+    sources = None
+    if args.review_sources:
+        sources = [ReviewSource.parse(spec) for spec in args.review_sources]
+    issue_store = None
+    if args.issue_store:
+        issue_store = IssueStore(args.issue_store)
+    parse_cache = None
+    if args.parse_cache:
+        parse_cache = ParseCache(args.parse_cache)
+    process_review = ProcessIssues(
+        github_api, sources, issue_store, parse_cache=parse_cache
+    )
 
     # Get all issues for approved packages - load as dict
-    issues = process_review.get_issues()
-    accepted_reviews, errors = process_review.parse_issues(issues)
+    with recorder.stage("get-issues"):
+        issues = process_review.get_issues()
+    if args.under_review:
+        # Split the one fetch of every review issue by review status
+        groups = classify_issues(issues)
+        issues = groups[ReviewStatus.ACCEPTED]
+        with recorder.stage("under-review"):
+            under_review = build_under_review(process_review, groups)
+            clean_export_yml(under_review, UNDER_REVIEW_REL_PATH)
+        logger.info(
+            f"Wrote {len(under_review)} reviews in progress to "
+            f"{UNDER_REVIEW_REL_PATH}"
+        )
+    with recorder.stage("parse-issues"):
+        accepted_reviews, errors = process_review.parse_issues(issues)
+    if parse_cache is not None:
+        parse_cache.save()
     if errors:
         logger.error("Errors found when parsing reviews (printed to stdout):")
         for url, error in errors.items():
@@ -136,12 +312,34 @@ def main():
     logger.info("Getting GitHub metrics for all packages...")
     repo_paths = process_review.get_repo_paths(accepted_reviews)
     # Fetch first; gap-fill from packages.yml only where the API left gh_meta empty
-    existing_gh_meta = get_existing_gh_meta()
-    all_reviews = github_api.get_metrics(repo_paths, accepted_reviews)
+    with recorder.stage("load-existing-gh-meta"):
+        existing_gh_meta = get_existing_gh_meta(
+            get_data_source(args.website_path)
+        )
+    # Only refresh stale metrics, stalest first
+    refresh_policy = MetricsRefreshPolicy(
+        ttl=timedelta(hours=args.ttl_hours),
+        archived_ttl=timedelta(days=args.archived_ttl_days),
+    )
+    repo_paths = refresh_policy.plan(
+        repo_paths, accepted_reviews, existing_gh_meta
+    )
+    checkpoint = CheckpointJournal(METRICS_CHECKPOINT, resume=args.resume)
+    with recorder.stage("get-metrics"):
+        all_reviews = github_api.get_metrics(
+            repo_paths, accepted_reviews, checkpoint=checkpoint
+        )
     all_reviews = update_gh_meta(existing_gh_meta, all_reviews)
 
-    with open("all_reviews.pickle", "wb") as f:
-        pickle.dump(all_reviews, f)
+    with recorder.stage("save"):
+        if save:
+            with open("all_reviews.pickle", "wb") as f:
+                pickle.dump(all_reviews, f)
+        MetricsStore(args.metrics_store).append(
+            {name: review.gh_meta for name, review in all_reviews.items()}
+        )
+
+    return all_reviews
 
 
 if __name__ == "__main__":
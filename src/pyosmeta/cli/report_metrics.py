@@ -0,0 +1,76 @@
+"""
+Script that summarizes the packages in packages.yml: star and fork
+distributions, time since the last commit, contributor counts by category
+and partner, and packages that haven't had a commit in a while.
+
+It reads the packages.yml file produced by update-review-teams and doesn't
+call any APIs. It needs numpy (``pip install pyosmeta[report]``).
+
+To run at the CLI: report-metrics
+"""
+
+import argparse
+import json
+import sys
+from datetime import date
+
+from pyosmeta.constants import PACKAGES_REL_PATH
+from pyosmeta.report import (
+    DEFAULT_STALE_DAYS,
+    build_report,
+    load_packages_table,
+    report_to_csv,
+)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="A CLI script to summarize pyOpenSci package metrics"
+    )
+    parser.add_argument(
+        "--packages",
+        default=PACKAGES_REL_PATH,
+        help=f"Path to the packages.yml file (default: {PACKAGES_REL_PATH})",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "csv"],
+        default="json",
+        help="Output format (default: json)",
+    )
+    parser.add_argument(
+        "--output",
+        help="File to write the report to (default: stdout)",
+    )
+    parser.add_argument(
+        "--stale-days",
+        type=int,
+        default=DEFAULT_STALE_DAYS,
+        help="Report packages without a commit in this many days as stale "
+        f"(default: {DEFAULT_STALE_DAYS})",
+    )
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        help="Measure time since the last commit from this YYYY-MM-DD date "
+        "(default: today)",
+    )
+    args = parser.parse_args(argv)
+
+    table = load_packages_table(args.packages)
+    report = build_report(table, as_of=args.as_of, stale_days=args.stale_days)
+
+    if args.format == "csv":
+        output = report_to_csv(report)
+    else:
+        output = json.dumps(report, indent=2) + "\n"
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Script that runs update-reviews, update-contributors and
+update-review-teams in one process.
+
+The reviews and contributors stages don't depend on each other, so they run
+at the same time, and their results are handed to the review-teams stage
+in memory instead of through pickles. All the stages share one HTTP
+session.
+
+A subset of the stages can be run with ``--stages``. A stage whose
+upstream stages aren't run loads their results from the pickles of an
+earlier run, and a stage whose downstream stages aren't run saves its
+pickle for them.
+
+To run at the CLI: pyosmeta run
+"""
+
+import argparse
+
+import requests
+
+from pyosmeta.cli.process_reviews import add_review_arguments, update_reviews
+from pyosmeta.cli.update_contributors import (
+    add_contributor_arguments,
+    update_contributors,
+)
+from pyosmeta.cli.update_review_teams import update_review_teams
+from pyosmeta.http_replay import add_cassette_arguments, http_cassette
+from pyosmeta.instrumentation import recorder, set_http_transport
+from pyosmeta.pipeline import PipelineStage, run_pipeline
+from pyosmeta.profiling import profile_run
+
+STAGE_NAMES = ("reviews", "contributors", "review-teams")
+
+
+def build_stages(
+    args: argparse.Namespace, selected: set[str]
+) -> list[PipelineStage]:
+    """Return the update pipeline's stages.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The CLI options.
+    selected : set[str]
+        The stages that will run. The reviews and contributors stages only
+        save their pickles if review-teams won't run.
+    """
+    save = "review-teams" not in selected
+    return [
+        PipelineStage(
+            "reviews", lambda inputs: update_reviews(args, save=save)
+        ),
+        PipelineStage(
+            "contributors",
+            lambda inputs: update_contributors(args, save=save),
+        ),
+        PipelineStage(
+            "review-teams",
+            lambda inputs: update_review_teams(
+                contribs=inputs.get("contributors"),
+                packages=inputs.get("reviews"),
+            ),
+            depends_on=("reviews", "contributors"),
+        ),
+    ]
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the selected update stages."""
+    selected = set(args.stages or STAGE_NAMES)
+    # Stages running at the same time would profile into each other
+    max_workers = 1 if args.profile else None
+
+    session = None
+    if not (args.record_http or args.replay_http):
+        session = requests.Session()
+        previous = set_http_transport(session)
+    try:
+        run_pipeline(build_stages(args, selected), selected, max_workers)
+    finally:
+        if session is not None:
+            set_http_transport(previous)
+            session.close()
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        prog="pyosmeta", description="pyOpenSci metadata tools"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser(
+        "run",
+        help="Update reviews, contributors and review teams in one process",
+        description="Run update-reviews, update-contributors and "
+        "update-review-teams in one process",
+    )
+    run_parser.add_argument(
+        "--stages",
+        nargs="+",
+        choices=STAGE_NAMES,
+        help="Only run these stages (default: all of them)",
+    )
+    run_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse GitHub data fetched in the last 24 hours by an "
+        "interrupted run instead of fetching it again",
+    )
+    add_review_arguments(run_parser)
+    add_contributor_arguments(run_parser)
+    run_parser.add_argument(
+        "--website-path",
+        help="Read packages.yml and contributors.yml from this local clone "
+        "of pyopensci.github.io instead of downloading them. Warns if the "
+        "clone is behind origin/main, which runs git ls-remote over the "
+        "network.",
+    )
+    run_parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile the run and write per-stage pstats and flamegraph "
+        "files to this directory. The stages run one at a time.",
+    )
+    run_parser.add_argument(
+        "--run-report",
+        help="Write a JSON report of the run's stage timings and network "
+        "requests to this file",
+    )
+    add_cassette_arguments(run_parser)
+    args = parser.parse_args(argv)
+
+    try:
+        with http_cassette(args.record_http, args.replay_http):
+            with profile_run(args.profile):
+                run(args)
+    finally:
+        if args.run_report:
+            recorder.write_report(args.run_report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Script that serves a GitHub webhook endpoint to update reviews as their
+issues change.
+
+Point a webhook for the software-submission repository's ``issues`` events
+at it. Each change to a review issue re-parses only that issue and updates
+all_reviews.pickle (written by update-reviews, which should be run first to
+fetch the packages' GitHub metrics). Once no issue has changed for
+``--debounce`` seconds, packages.yml and contributors.yml are regenerated as
+by update-review-teams.
+
+To run at the CLI: serve-webhooks
+"""
+
+import argparse
+import os
+
+from pyosmeta.cli.update_review_teams import update_review_teams
+from pyosmeta.github_api import GitHubAPI
+from pyosmeta.logging import logger
+from pyosmeta.parse_issues import ProcessIssues
+from pyosmeta.webhooks import (
+    DEFAULT_DEBOUNCE,
+    REVIEWS_PICKLE,
+    ReviewStore,
+    WebhookService,
+)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(
+        description="A CLI script to update pyOpenSci reviews from GitHub "
+        "webhooks"
+    )
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--reviews",
+        default=REVIEWS_PICKLE,
+        help=f"The review store to update (default: {REVIEWS_PICKLE})",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help="Regenerate packages.yml once no review has changed for this "
+        f"many seconds (default: {DEFAULT_DEBOUNCE:g})",
+    )
+    args = parser.parse_args(argv)
+
+    github_api = GitHubAPI(
+        org="pyopensci",
+        repo="software-submission",
+        labels=["6/pyOS-approved"],
+    )
+    service = WebhookService(
+        ProcessIssues(github_api),
+        ReviewStore(args.reviews),
+        lambda reviews: update_review_teams(packages=reviews),
+        # Set the same secret on the webhook on GitHub
+        secret=os.environ.get("GITHUB_WEBHOOK_SECRET"),
+        debounce=args.debounce,
+    )
+    if service.secret is None:
+        logger.warning(
+            "GITHUB_WEBHOOK_SECRET isn't set, so webhook deliveries aren't "
+            "verified"
+        )
+
+    server = service.make_server(args.host, args.port)
+    logger.info(f"Listening for webhooks on {args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,91 +17,185 @@ from pydantic import ValidationError
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from pyosmeta.constants import CONTRIB_REPOS, CONTRIBUTORS_RAW_URL
+from pyosmeta.checkpoint import CheckpointJournal
+from pyosmeta.constants import CONTRIB_REPOS, CONTRIBUTORS_REL_PATH
 from pyosmeta.contributors import ProcessContributors
-from pyosmeta.file_io import create_paths, load_pickle, open_yml_file
+from pyosmeta.data_sources import CachedHTTPSource, get_data_source
+from pyosmeta.file_io import create_paths, load_pickle
 from pyosmeta.github_api import GitHubAPI
+from pyosmeta.http_replay import add_cassette_arguments, http_cassette
+from pyosmeta.instrumentation import recorder
 from pyosmeta.logging import logger
 from pyosmeta.models import PersonModel
+from pyosmeta.profiling import profile_run
+
+# Journal of GitHub user info fetched so far, used by --resume
+CONTRIBS_CHECKPOINT = "contribs_checkpoint.jsonl"
+
+
+def get_user_info(
+    gh_user: str,
+    process_contribs: ProcessContributors,
+    checkpoint: CheckpointJournal,
+) -> dict:
+    """Return GitHub user info, reusing a checkpointed fetch if available."""
+    if gh_user in checkpoint:
+        return dict(checkpoint.get(gh_user))
+    user_info = process_contribs.return_user_info(gh_user)
+    checkpoint.record(gh_user, user_info)
+    return dict(user_info)
+
+
+def add_contributor_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options used by :func:`update_contributors` (except those
+    shared with the other scripts) to a CLI."""
+    parser.add_argument(
+        "--update",
+        type=str,
+        help="Force update contrib info from GitHub for every contributor",
+    )
 
 
 def main():
-    update_dates = False
-    update_all = False
     parser = argparse.ArgumentParser(
         description="A CLI script to update pyOpenSci contributors"
     )
+    add_contributor_arguments(parser)
     parser.add_argument(
-        "--update",
-        type=str,
-        help="Force update contrib info from GitHub for every contributor",
+        "--resume",
+        action="store_true",
+        help="Reuse GitHub user info fetched in the last 24 hours by an "
+        "interrupted run instead of fetching it again",
+    )
+    parser.add_argument(
+        "--website-path",
+        help="Read contributors.yml from this local clone of "
+        "pyopensci.github.io instead of downloading it",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile the run and write per-stage pstats and flamegraph "
+        "files to this directory",
+    )
+    parser.add_argument(
+        "--run-report",
+        help="Write a JSON report of the run's stage timings and network "
+        "requests to this file",
     )
+    add_cassette_arguments(parser)
     args = parser.parse_args()
+
+    try:
+        with http_cassette(args.record_http, args.replay_http):
+            with profile_run(args.profile):
+                update_contributors(args)
+    finally:
+        if args.run_report:
+            recorder.write_report(args.run_report)
+
+
+def update_contributors(
+    args: argparse.Namespace, save: bool = True
+) -> dict[str, PersonModel]:
+    """Combine contributors from the website and the all-contributors bot
+    files.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The CLI options.
+    save : bool
+        Whether to save the contributors to all_contribs.pickle for
+        update-review-teams.
+
+    Returns
+    -------
+    dict[str, PersonModel]
+        The contributors, keyed by lowercased GitHub username.
+    """
+    update_dates = False
+    update_all = False
     update_value = args.update
+    checkpoint = CheckpointJournal(CONTRIBS_CHECKPOINT, resume=args.resume)
 
     if update_value:
         update_all = True
 
     json_files = create_paths(CONTRIB_REPOS)
 
-    # Get existing contribs from pyopensci.github.io repo (website data)
-    web_contribs = open_yml_file(CONTRIBUTORS_RAW_URL)
-
-    # Populate all existing contribs into model objects
-    all_contribs = {}
-    for a_contrib in tqdm(web_contribs, desc="Processing all-contribs"):
-        username = a_contrib["github_username"]
-        tqdm.write(f"Processing {username}")
-        with logging_redirect_tqdm():
-            try:
-                all_contribs[username.lower()] = PersonModel(**a_contrib)
-            except ValidationError:
-                logger.error(f"Error processing {username}", exc_info=True)
+    with recorder.stage("load-contributors"):
+        # Get existing contribs from pyopensci.github.io repo (website data)
+        web_contribs = get_data_source(args.website_path).read_yml(
+            CONTRIBUTORS_REL_PATH
+        )
+
+        # Populate all existing contribs into model objects
+        all_contribs = {}
+        for a_contrib in tqdm(web_contribs, desc="Processing all-contribs"):
+            username = a_contrib["github_username"]
+            tqdm.write(f"Processing {username}")
+            with logging_redirect_tqdm():
+                try:
+                    all_contribs[username.lower()] = PersonModel(**a_contrib)
+                except ValidationError:
+                    logger.error(f"Error processing {username}", exc_info=True)
 
     # Create a list of all contributors across repositories
     github_api = GitHubAPI()
-    process_contribs = ProcessContributors(github_api, json_files)
-    bot_all_contribs = process_contribs.combine_json_data()
-
-    for key, users in tqdm(
-        bot_all_contribs.items(),
-        desc="Updating contrib types and searching for new users",
-    ):
-        for gh_user in users:
-            # Find and populate data for any new contributors
-            if gh_user not in all_contribs.keys():
-                logger.info(f"Missing {gh_user}, adding them now")
-                new_contrib = process_contribs.return_user_info(gh_user)
-                new_contrib["date_added"] = datetime.now().strftime("%Y-%m-%d")
-                all_contribs[gh_user] = PersonModel(**new_contrib)
-
-            # Update contribution type list for all users
-            all_contribs[gh_user].add_unique_value("contributor_type", key)
+    process_contribs = ProcessContributors(
+        github_api, json_files, http_cache=CachedHTTPSource()
+    )
+    with recorder.stage("combine-json-data"):
+        bot_all_contribs = process_contribs.combine_json_data()
+
+    with recorder.stage("new-contributors"):
+        for key, users in tqdm(
+            bot_all_contribs.items(),
+            desc="Updating contrib types and searching for new users",
+        ):
+            for gh_user in users:
+                # Find and populate data for any new contributors
+                if gh_user not in all_contribs.keys():
+                    logger.info(f"Missing {gh_user}, adding them now")
+                    new_contrib = get_user_info(
+                        gh_user, process_contribs, checkpoint
+                    )
+                    new_contrib["date_added"] = datetime.now().strftime(
+                        "%Y-%m-%d"
+                    )
+                    all_contribs[gh_user] = PersonModel(**new_contrib)
+
+                # Update contribution type list for all users
+                all_contribs[gh_user].add_unique_value("contributor_type", key)
 
     if update_all:
-        for user in tqdm(all_contribs.keys(), dec="Updating all user info"):
-            tqdm.write("Updating all user info from github for {user}")
-            new_gh_data = process_contribs.return_user_info(user)
-
-            # TODO: turn this into a small update method
-            existing = all_contribs[user].model_dump()
-
-            for key, item in new_gh_data.items():
-                if key == "mastodon":
-                    # Mastodon isn't available in the GH api yet
-                    continue
-                # Don't replace the Name value from GitHub if there is a name
-                # already listed in the contributors.yml file.
-                # This allows for users to manually update their names and it
-                # won't be overwritten. This also means an update on GitHub will
-                # not be updated here which for now is ok. Not everyone has their
-                # name listed on GH.
-                if key == "name" and existing[key]:
-                    continue
-                else:
-                    existing[key] = item
-
-            all_contribs[user] = PersonModel(**existing)
+        with recorder.stage("update-all"):
+            for user in tqdm(
+                all_contribs.keys(), desc="Updating all user info"
+            ):
+                tqdm.write(f"Updating all user info from github for {user}")
+                new_gh_data = get_user_info(user, process_contribs, checkpoint)
+
+                # TODO: turn this into a small update method
+                existing = all_contribs[user].model_dump()
+
+                for key, item in new_gh_data.items():
+                    if key == "mastodon":
+                        # Mastodon isn't available in the GH api yet
+                        continue
+                    # Don't replace the Name value from GitHub if there is a name
+                    # already listed in the contributors.yml file.
+                    # This allows for users to manually update their names and it
+                    # won't be overwritten. This also means an update on GitHub will
+                    # not be updated here which for now is ok. Not everyone has their
+                    # name listed on GH.
+                    if key == "name" and existing[key]:
+                        continue
+                    else:
+                        existing[key] = item
+
+                all_contribs[user] = PersonModel(**existing)
 
     # One time only - add contrib added date
     if update_dates:
@@ -116,8 +210,12 @@ def main():
                 )
 
     # Export to pickle which supports updates after parsing reviews
-    with open("all_contribs.pickle", "wb") as f:
-        pickle.dump(all_contribs, f)
+    if save:
+        with recorder.stage("save"):
+            with open("all_contribs.pickle", "wb") as f:
+                pickle.dump(all_contribs, f)
+
+    return all_contribs
 
 
 if __name__ == "__main__":
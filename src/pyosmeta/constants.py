@@ -17,6 +17,8 @@ WEBSITE_DATA_RAW_URL = (
 
 CONTRIBUTORS_REL_PATH = "data/contributors.yml"
 PACKAGES_REL_PATH = "data/packages.yml"
+# Written by update-reviews --under-review
+UNDER_REVIEW_REL_PATH = "data/under_review.yml"
 
 CONTRIBUTORS_RAW_URL = f"{WEBSITE_DATA_RAW_URL}contributors.yml"
 PACKAGES_RAW_URL = f"{WEBSITE_DATA_RAW_URL}packages.yml"
@@ -1,20 +1,42 @@
+import contextvars
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple
 
-import requests
-
 from .constants import REPO_CONTRIB_TYPES
+from .data_sources import CachedHTTPSource
 from .github_api import GitHubAPI
+from .instrumentation import http_get, instrumented
 from .logging import logger
 
+COMBINED_JSON_MAX_AGE = 15 * 60
+"""Seconds for which combined json data is reused, long enough for one run"""
+
+# Combined contrib-type -> users mappings and when they were built, keyed by
+# the json files they were built from, so later stages in the same run don't
+# fetch them again. Entries expire, so long-running processes (e.g.
+# serve-webhooks) pick up changes to the files.
+_combined_json_data: dict[
+    tuple[str, ...], tuple[float, dict[str, list[str]]]
+] = {}
+
 
 @dataclass
 class ProcessContributors:
     """A class that contains some basic methods to support populating and
     updating contributor data."""
 
-    def __init__(self, github_api: GitHubAPI, json_files: List) -> None:
+    def __init__(
+        self,
+        github_api: GitHubAPI,
+        json_files: List,
+        http_cache: Optional[CachedHTTPSource] = None,
+        max_workers: int = 8,
+        timeout: float = 30,
+        max_age: float = COMBINED_JSON_MAX_AGE,
+    ) -> None:
         """
         Parameters
         ----------
@@ -23,10 +45,24 @@ class ProcessContributors:
         json_files : list
             A list of string objects each of which represents a URL to a JSON
             file to be parsed
+        http_cache : CachedHTTPSource, Optional
+            If provided, json files are read through this cache so unchanged
+            files aren't downloaded again.
+        max_workers : int
+            How many json files to fetch at once.
+        timeout : float
+            Request timeout in seconds when no ``http_cache`` is used.
+        max_age : float
+            Seconds for which combined json data built in this process
+            (e.g. by an earlier stage of the run) is reused.
         """
 
         self.github_api = github_api
         self.json_files = json_files
+        self.http_cache = http_cache
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_age = max_age
 
         self.update_keys = [
             "twitter",
@@ -89,18 +125,21 @@ class ProcessContributors:
                 return contrib_type
         return "community"
 
-    # Possibly github it is a get request but it says json path
+    @instrumented("ProcessContributors.load_json")
     def load_json(self, json_path: str) -> dict:
         """
-        Helper function that deserializes a json file to a dict.
+        Helper function that deserializes a json file at a URL to a dict.
 
+        Raises
+        ------
+        requests.RequestException
+            If the file can't be downloaded (and isn't cached).
         """
-        try:
-            response = requests.get(json_path)
-        except Exception:
-            logger.error(
-                f"Error loading json file: {json_path}", exec_info=True
-            )
+        if self.http_cache is not None:
+            return json.loads(self.http_cache.read_url(json_path))
+
+        response = http_get(json_path, timeout=self.timeout)
+        response.raise_for_status()
         return json.loads(response.text)
 
     def process_json_file(self, json_file: str) -> Tuple[str, List]:
@@ -128,29 +167,67 @@ class ProcessContributors:
 
         return contrib_type, all_users
 
-    def combine_json_data(self) -> dict:
+    def _try_process_json_file(
+        self, json_file: str
+    ) -> Optional[Tuple[str, List]]:
+        try:
+            return self.process_json_file(json_file)
+        except Exception:
+            logger.error(f"Oops - can't process: {json_file}", exc_info=True)
+            return None
+
+    def combine_json_data(self, refresh: bool = False) -> dict:
         """Deserialize and clean a list of json file url's.
 
         Parses a list of json file  urls representing all-contributor bot
-        json files.
+        json files. The files are fetched concurrently, and the result is
+        reused by later calls for the same files in this process for
+        ``max_age`` seconds.
+
+        Parameters
+        ----------
+        refresh : bool
+            If True, fetch the files again even if they were recently
+            combined in this process.
 
         Returns
         -------
             Dictionary containing json data for all contributors across
             the website
         """
+        cache_key = tuple(self.json_files)
+        built_at, cached = _combined_json_data.get(cache_key, (None, None))
+        if (
+            not refresh
+            and cached is not None
+            and time.monotonic() - built_at < self.max_age
+        ):
+            return {key: list(users) for key, users in cached.items()}
+
         # Create an empty dictionary to hold the combined data
         combined_data = {}
 
-        for json_file in self.json_files:
-            # Process the JSON file and add the data to the combined dictionary
-            try:
-                key, users = self.process_json_file(json_file)
-                combined_data[key] = users
-            except Exception:
-                logger.error(
-                    f"Oops - can't process: {json_file}", exc_info=True
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Run each fetch in a copy of this context so the requests count
+            # towards the current run stage
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self._try_process_json_file,
+                    json_file,
                 )
+                for json_file in self.json_files
+            ]
+            for future in futures:
+                result = future.result()
+                if result is not None:
+                    key, users = result
+                    combined_data[key] = users
+
+        _combined_json_data[cache_key] = (
+            time.monotonic(),
+            {key: list(users) for key, users in combined_data.items()},
+        )
         return combined_data
 
     def return_user_info(
@@ -0,0 +1,302 @@
+"""
+Where to read the pyOpenSci website data files from.
+
+``update-contributors`` and ``update-reviews`` start from the currently
+published ``contributors.yml`` and ``packages.yml``. These live in the
+``data/`` directory of the pyopensci.github.io repo and can be read from:
+
+* :class:`LocalCheckoutSource` - a local clone of the website repo. Nothing
+  is downloaded; the clone's HEAD is compared to the remote branch to warn
+  when it is out of date.
+* :class:`CachedHTTPSource` - raw.githubusercontent.com, with the last
+  download cached on disk. Conditional requests (``If-None-Match`` /
+  ``If-Modified-Since``) mean an unchanged file isn't downloaded again.
+  The same cache is used for other raw files, e.g. ``.all-contributorsrc``.
+"""
+
+import hashlib
+import json
+import subprocess
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from ruamel.yaml import YAML
+
+from .constants import WEBSITE_DATA_RAW_URL
+from .file_io import _list_to_dict
+from .instrumentation import http_get, instrumented
+from .logging import logger
+
+DEFAULT_CACHE_DIR = Path(".pyosmeta_cache") / "http"
+"""Where :class:`CachedHTTPSource` keeps downloaded files"""
+
+
+def _load_yml(text: str) -> Any:
+    """Deserialize YAML text."""
+    yaml = YAML(typ="safe", pure=True)
+    return yaml.load(text)
+
+
+class WebsiteDataSource(ABC):
+    """Read data files from the pyopensci.github.io repo."""
+
+    @abstractmethod
+    def read_text(self, rel_path: str) -> str:
+        """Return the contents of a file in the website repo.
+
+        Parameters
+        ----------
+        rel_path : str
+            Path relative to the repo root, e.g. ``data/packages.yml``.
+        """
+
+    def read_yml(self, rel_path: str) -> Any:
+        """Open & deserialize a YAML file from the website repo.
+
+        Parameters
+        ----------
+        rel_path : str
+            Path relative to the repo root, e.g. ``data/packages.yml``.
+
+        Returns
+        -------
+            The structured data in the YAML file.
+        """
+        return _load_yml(self.read_text(rel_path))
+
+    def read_yml_dict(self, rel_path: str, key: str) -> dict[str, Any]:
+        """Open a website YAML list and key each item by ``key``.
+
+        Parameters
+        ----------
+        rel_path : str
+            Path relative to the repo root, e.g. ``data/packages.yml``.
+        key : str
+            The (lowercased) item value to key the dictionary by.
+        """
+        return _list_to_dict(self.read_yml(rel_path), key)
+
+
+class LocalCheckoutSource(WebsiteDataSource):
+    """Read website data from a local clone of pyopensci.github.io.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the root of the clone.
+    remote : str
+        The git remote to compare the clone against.
+    branch : str
+        The remote branch the website is published from.
+    check_freshness : bool
+        If True, warn (once) when the clone is behind the remote branch,
+        i.e. the local data may be out of date. This runs ``git ls-remote``,
+        which contacts the remote.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        remote: str = "origin",
+        branch: str = "main",
+        check_freshness: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        if not self.path.is_dir():
+            raise ValueError(f"Website checkout not found: {self.path}")
+        self.remote = remote
+        self.branch = branch
+        self._check_freshness = check_freshness
+
+    def _git(self, *args: str) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(self.path), *args],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True,
+        )
+        return result.stdout.strip()
+
+    def local_head(self) -> str:
+        """Return the commit sha checked out locally."""
+        return self._git("rev-parse", "HEAD")
+
+    def remote_head(self) -> str:
+        """Return the commit sha of the remote branch."""
+        output = self._git(
+            "ls-remote", self.remote, f"refs/heads/{self.branch}"
+        )
+        return output.split()[0] if output else ""
+
+    def contains(self, commit: str) -> bool:
+        """Return whether a commit is HEAD or one of its ancestors.
+
+        A commit that hasn't been fetched isn't contained.
+        """
+        result = subprocess.run(
+            [
+                "git",
+                "-C",
+                str(self.path),
+                "merge-base",
+                "--is-ancestor",
+                commit,
+                "HEAD",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+        return result.returncode == 0
+
+    def is_stale(self) -> bool | None:
+        """Check whether the clone is behind the remote branch.
+
+        A clone that's ahead of the remote branch (e.g. with local commits)
+        isn't stale.
+
+        Returns
+        -------
+        bool or None
+            True if the remote branch has commits that HEAD doesn't, False
+            if it doesn't, and None if it couldn't be checked (eg. offline
+            or not a git repo).
+        """
+        try:
+            local, remote = self.local_head(), self.remote_head()
+        except (OSError, subprocess.SubprocessError):
+            logger.warning(
+                f"Couldn't check whether {self.path} is up to date with "
+                f"{self.remote}/{self.branch}."
+            )
+            return None
+        if not remote:
+            return None
+        return local != remote and not self.contains(remote)
+
+    def read_text(self, rel_path: str) -> str:
+        if self._check_freshness:
+            self._check_freshness = False
+            if self.is_stale():
+                logger.warning(
+                    f"{self.path} isn't up to date with "
+                    f"{self.remote}/{self.branch}. Pull it to use the "
+                    "latest website data."
+                )
+        return (self.path / rel_path).read_text()
+
+
+class CachedHTTPSource(WebsiteDataSource):
+    """Download website data, reusing the cached copy if it hasn't changed.
+
+    Parameters
+    ----------
+    base_url : str
+        URL of the website repo's ``data/`` directory on
+        raw.githubusercontent.com.
+    cache_dir : str or Path
+        Directory to cache downloaded files in.
+    timeout : float
+        Request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str = WEBSITE_DATA_RAW_URL,
+        cache_dir: str | Path = DEFAULT_CACHE_DIR,
+        timeout: float = 30,
+    ) -> None:
+        self.base_url = base_url
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+
+    def _url(self, rel_path: str) -> str:
+        # base_url already points at data/, where all website data lives
+        return self.base_url + rel_path.removeprefix("data/")
+
+    def _cache_paths(self, url: str) -> tuple[Path, Path]:
+        parts = urlsplit(url)
+        body = self.cache_dir / parts.netloc / parts.path.lstrip("/")
+        return body, body.with_name(body.name + ".meta.json")
+
+    def read_text(self, rel_path: str) -> str:
+        return self.read_url(self._url(rel_path))
+
+    @instrumented("CachedHTTPSource.read_url")
+    def read_url(self, url: str) -> str:
+        """Return the contents of ``url``, downloading it only if changed.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the file to read.
+
+        Returns
+        -------
+        str
+            The file contents. If the download fails, the cached copy is
+            returned (if there is one).
+        """
+        body_path, meta_path = self._cache_paths(url)
+
+        headers = {}
+        meta = {}
+        if body_path.exists() and meta_path.exists():
+            meta = json.loads(meta_path.read_text())
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = http_get(url, headers=headers, timeout=self.timeout)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except requests.RequestException:
+            if body_path.exists():
+                logger.warning(
+                    f"Couldn't download {url}. Using the cached copy in "
+                    f"{body_path}.",
+                    exc_info=True,
+                )
+                return body_path.read_text()
+            raise
+
+        if response.status_code == 304:
+            logger.info(f"{url} hasn't changed. Using the cached copy.")
+            return body_path.read_text()
+
+        sha256 = hashlib.sha256(response.text.encode()).hexdigest()
+        if sha256 != meta.get("sha256"):
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            body_path.write_text(response.text)
+        meta_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "sha256": sha256,
+                }
+            )
+        )
+        return response.text
+
+
+def get_data_source(
+    website_path: str | Path | None = None,
+) -> WebsiteDataSource:
+    """Return the website data source to use for a run.
+
+    Parameters
+    ----------
+    website_path : str or Path, Optional
+        Path to a local clone of pyopensci.github.io. If not provided,
+        files are downloaded (and cached) from GitHub.
+    """
+    if website_path:
+        return LocalCheckoutSource(website_path)
+    return CachedHTTPSource()
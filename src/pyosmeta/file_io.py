@@ -1,11 +1,12 @@
 import pickle
-import urllib.request
 from typing import Dict, List, Union
 
+import requests
 import ruamel.yaml
 from ruamel.yaml import YAML
 
 from .constants import RAW_BASE_URL
+from .instrumentation import http_get, instrumented
 from .logging import logger
 
 
@@ -67,6 +68,7 @@ def load_website_yml(key: str, url: str):
     return _list_to_dict(yml_list, key)
 
 
+@instrumented("open_yml_file")
 def open_yml_file(file_path: str) -> dict:
     """Open & deserialize YAML file to dictionary.
 
@@ -83,10 +85,11 @@ def open_yml_file(file_path: str) -> dict:
     # TODO: this used to be self.web_yml so i'll need to reorganized
     # the contrib class
     try:
-        with urllib.request.urlopen(file_path) as f:
-            yaml = YAML(typ="safe", pure=True)
-            return yaml.load(f)
-    except urllib.error.URLError:
+        response = http_get(file_path, timeout=30)
+        response.raise_for_status()
+        yaml = YAML(typ="safe", pure=True)
+        return yaml.load(response.content)
+    except requests.RequestException:
         logger.error(f"Oops - can find the url: {file_path}", exc_info=True)
 
 
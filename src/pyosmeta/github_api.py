@@ -9,9 +9,12 @@ available
 numbers, stars and more "health & stability" related metrics
 """
 
+import math
 import os
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 
 import requests
@@ -22,17 +25,161 @@ from tqdm.contrib.logging import logging_redirect_tqdm
 from pyosmeta.models import ReviewModel
 from pyosmeta.models.base import GhMeta, RepositoryHost
 
+from .checkpoint import CheckpointJournal
+from .instrumentation import http_get, instrumented, recorder
 from .logging import logger
+from .repository_hosts import (
+    GitLabBackend,
+    RepositoryBackend,
+    count_workers,
+    default_backends,
+    submit_repo_metas,
+)
 
 
 class GitHubAPIError(Exception):
     """Raised for GitHub API errors that affect the whole metrics run.
 
     Covers an invalid/expired token (401) and a fully exhausted rate limit
-    (403 with ``X-RateLimit-Remaining: 0``).
+    (403 with ``X-RateLimit-Remaining: 0`` for every available token).
     """
 
 
+def _header_int(response, header: str) -> int | None:
+    """Return an integer response header, or None if missing or invalid."""
+    try:
+        return int(response.headers.get(header))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class TokenBudget:
+    """The rate limit budget of a single GitHub token.
+
+    The budget is updated from the ``X-RateLimit-*`` headers of every
+    response made with the token. ``remaining`` is None until the token has
+    been used.
+    """
+
+    token: str = field(repr=False)
+    remaining: int | None = None
+    reset: int = 0
+    headers: dict[str, str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.headers = {"Authorization": f"Bearer {self.token}"}
+
+    def headroom(self, now: float) -> float:
+        """Requests left for this token at ``now``.
+
+        A token that hasn't been used yet, or whose rate limit window has
+        reset since it was last used, has unlimited headroom.
+        """
+        if self.remaining is None or (self.reset and now >= self.reset):
+            return math.inf
+        return self.remaining
+
+    def update(self, response) -> None:
+        """Record the budget reported in a response made with this token."""
+        remaining = _header_int(response, "X-RateLimit-Remaining")
+        if remaining is not None:
+            self.remaining = remaining
+            self.reset = _header_int(response, "X-RateLimit-Reset") or 0
+            if remaining <= 0:
+                # Don't trust a reset time that's already passed (eg. clock
+                # skew) to mean an exhausted token has budget again
+                self.reset = max(self.reset, int(time.time()) + 1)
+
+
+DEFAULT_TTL_HOURS = 20
+"""Hours for which fetched metrics count as fresh, below the daily cadence"""
+
+
+@dataclass
+class MetricsRefreshPolicy:
+    """Decide which packages need their GitHub metrics refreshed.
+
+    Metrics fetched within ``ttl`` are kept as they are. Archived
+    (``active=False``) packages rarely change, so they use the much longer
+    ``archived_ttl``. Everything else is refreshed stalest-first so that a
+    limited rate limit budget goes to the most out-of-date metrics.
+
+    The default ``ttl`` is shorter than the nightly run cadence: metrics
+    fetched partway through yesterday's run are less than 24 hours old when
+    today's run starts, and must still be refreshed.
+    """
+
+    ttl: timedelta = timedelta(hours=DEFAULT_TTL_HOURS)
+    archived_ttl: timedelta = timedelta(days=30)
+
+    @staticmethod
+    def last_fetched(gh_meta: GhMeta | None) -> datetime | None:
+        """Return when the metrics were fetched, or None if unknown."""
+        if gh_meta is None or not gh_meta.fetched_at:
+            return None
+        try:
+            fetched = datetime.fromisoformat(gh_meta.fetched_at)
+        except ValueError:
+            return None
+        if fetched.tzinfo is None:
+            fetched = fetched.replace(tzinfo=timezone.utc)
+        return fetched
+
+    def plan(
+        self,
+        endpoints: dict[str, dict[str, str]],
+        reviews: dict[str, ReviewModel],
+        existing_gh_meta: dict[str, GhMeta],
+        now: datetime | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """Return the endpoints to refresh, stalest first.
+
+        Packages whose previously saved metrics are still fresh are left out
+        of the returned endpoints and get those metrics set on their review.
+
+        Parameters
+        ----------
+        endpoints : dict
+            A dictionary mapping package names to their owner and repo-names.
+        reviews : dict
+            A dictionary containing review data.
+        existing_gh_meta : dict
+            Previously saved metrics, keyed by lowercased package name.
+        now : datetime, Optional
+            The current time (UTC). Defaults to now.
+
+        Returns
+        -------
+        dict
+            The endpoints of packages to refresh, least recently fetched
+            (or never fetched) first.
+        """
+        now = now or datetime.now(timezone.utc)
+        never = datetime.min.replace(tzinfo=timezone.utc)
+
+        stale = []
+        for pkg_name, owner_repo in endpoints.items():
+            previous = existing_gh_meta.get(pkg_name.lower())
+            fetched = self.last_fetched(previous)
+            ttl = self.ttl if reviews[pkg_name].active else self.archived_ttl
+            if fetched is not None and now - fetched < ttl:
+                reviews[pkg_name].gh_meta = previous
+                continue
+            stale.append((fetched or never, pkg_name, owner_repo))
+
+        logger.info(
+            f"Refreshing GitHub metrics for {len(stale)} of "
+            f"{len(endpoints)} packages."
+        )
+        stale.sort(key=lambda item: item[0])
+        return {pkg_name: owner_repo for _, pkg_name, owner_repo in stale}
+
+
+# `fetched_at` isn't from the API; it's set when the metrics are fetched.
+GH_META_LOCAL_FIELDS = ("fetched_at",)
+
+
 @dataclass
 class GitHubAPI:
     """
@@ -44,7 +191,10 @@ class GitHubAPI:
     """
 
     # `contrib_count` is populated separately from the contributors REST endpoint.
-    GH_META_REQUIRED_FIELDS = tuple(GhMeta.model_fields.keys())
+    GH_META_LOCAL_FIELDS = GH_META_LOCAL_FIELDS
+    GH_META_REQUIRED_FIELDS = tuple(
+        key for key in GhMeta.model_fields if key not in GH_META_LOCAL_FIELDS
+    )
     GH_META_REST_FIELD_MAP = {
         "name": "name",
         "description": "description",
@@ -71,6 +221,7 @@ class GitHubAPI:
         """
         return {
             "required_fields": cls.GH_META_REQUIRED_FIELDS,
+            "local_fields": cls.GH_META_LOCAL_FIELDS,
             "rest_field_map": cls.GH_META_REST_FIELD_MAP,
             "contrib_source": cls.GH_META_CONTRIB_SOURCE,
             "last_commit_source": cls.GH_META_LAST_COMMIT_SOURCE,
@@ -83,6 +234,8 @@ class GitHubAPI:
         labels: list[str] | None = None,
         endpoint_type: str = "issues",
         after_date: str = None,
+        token: str | None = None,
+        tokens: list[str] | None = None,
     ):
         """
         Initialize a GitHub client object that handles interfacing with the
@@ -99,6 +252,17 @@ class GitHubAPI:
         endpoint_type : str
             The end point type to hit (pull request -- pulls or issues).
             Default is "issues".
+        after_date : str, Optional
+            Only return issues updated after this date (YYYY-MM-DD).
+        token : str, Optional
+            GitHub token to use for this client. If neither ``token`` nor
+            ``tokens`` is provided, tokens are read from the GITHUB_TOKEN
+            and GITHUB_TOKENS (comma-separated) environment variables (or a
+            .env file) the first time they're needed.
+        tokens : list of strings, Optional
+            A pool of GitHub tokens. Each request uses the token with the
+            most rate limit headroom, and a request that exhausts one
+            token's rate limit is retried with another.
         """
 
         self.org: str | None = org
@@ -108,11 +272,68 @@ class GitHubAPI:
         # ISO 8601 format YYYY-MM-DDTHH:MM:SSZ.
         # using the api since query which represents updated at not created_at
         self.after_date: str = after_date
+        # Resolved once and reused for every request made by this client
+        self._tokens: list[str] | None = tokens or ([token] if token else None)
+        self._token_pool: list[TokenBudget] | None = None
+
+    def _get_token_pool(self) -> list[TokenBudget]:
+        """Return the budgets of all tokens available to this client.
+
+        Tokens are only looked up the first time they're needed (or not at
+        all if they were passed to the client), since loading the .env file
+        means reading it from disk.
+
+        Raises
+        ------
+        KeyError
+            If no tokens were given and the GITHUB_TOKEN environment variable
+            is not found.
+        """
+        if self._token_pool is None:
+            tokens = self._tokens
+            if not tokens:
+                load_dotenv()
+                tokens = [
+                    os.environ.get("GITHUB_TOKEN", ""),
+                    *os.environ.get("GITHUB_TOKENS", "").split(","),
+                ]
+                # Drop empty values and duplicates, keeping the order
+                tokens = list(dict.fromkeys(t.strip() for t in tokens))
+                tokens = [token for token in tokens if token]
+            if not tokens:
+                raise KeyError(
+                    "Oops! A GITHUB_TOKEN environment variable wasn't found."
+                )
+            self._token_pool = [TokenBudget(token) for token in tokens]
+        return self._token_pool
+
+    def _tokens_by_headroom(self) -> list[TokenBudget]:
+        """Return all tokens, the one with the most headroom first."""
+        now = time.time()
+        return sorted(
+            self._get_token_pool(),
+            key=lambda budget: budget.headroom(now),
+            reverse=True,
+        )
+
+    def _select_token(self) -> TokenBudget:
+        """Return the token with the most rate limit headroom."""
+        return self._tokens_by_headroom()[0]
+
+    def _has_spare_token(self) -> bool:
+        """Return True if any token still has rate limit budget left."""
+        now = time.time()
+        return any(
+            budget.headroom(now) > 0 for budget in self._token_pool or []
+        )
 
     def get_token(self) -> str | None:
         """Fetches the GitHub API key from the users environment. If running
         local from an .env file.
 
+        If the client has a pool of tokens, this returns the token with the
+        most rate limit headroom.
+
         Returns
         -------
         str
@@ -123,14 +344,60 @@ class GitHubAPI:
         KeyError
             If the GITHUB_TOKEN environment variable is not found.
         """
-        load_dotenv()
-        try:
-            return os.environ["GITHUB_TOKEN"]
-        except KeyError:
-            raise KeyError(
-                "Oops! A GITHUB_TOKEN environment variable wasn't found."
+        return self._select_token().token
+
+    @property
+    def auth_headers(self) -> dict[str, str]:
+        """Authorization headers for the token with the most headroom."""
+        return self._select_token().headers
+
+    def _request(self, url: str) -> requests.Response:
+        """Make a GET request to the GitHub API, rotating tokens as needed.
+
+        The request is made with the token that has the most rate limit
+        headroom. If that token's rate limit is exhausted (403), the request
+        is retried with the next token that still has budget left. Once all
+        tokens are exhausted, the 403 response is returned for the caller to
+        handle.
+
+        Parameters
+        ----------
+        url : str
+            The API endpoint URL.
+
+        Returns
+        -------
+        requests.Response
+            The response from the GitHub API.
+        """
+        budgets = self._tokens_by_headroom()
+        for attempt, budget in enumerate(budgets, start=1):
+            response = http_get(url, retry=attempt > 1, headers=budget.headers)
+            budget.update(response)
+            if not self._retry_with_next_token(response, budgets, attempt):
+                return response
+            logger.warning(
+                "GitHub token rate limit exhausted. Retrying "
+                f"{url} with another token."
             )
 
+    def _retry_with_next_token(
+        self,
+        response: requests.Response,
+        budgets: list[TokenBudget],
+        attempt: int,
+    ) -> bool:
+        """Return True if a request made with ``budgets[attempt - 1]``
+        exhausted its rate limit and the next token still has budget."""
+        exhausted = response.status_code == 403 and (
+            self._is_rate_limit_exhausted(response)
+        )
+        return (
+            exhausted
+            and attempt < len(budgets)
+            and budgets[attempt].headroom(time.time()) > 0
+        )
+
     @property
     def api_endpoint(self) -> str:
         """Create the API endpoint url
@@ -189,6 +456,22 @@ class GitHubAPI:
         except (TypeError, ValueError):
             return "unknown"
 
+    def _raise_for_run_errors(self, response, url: str) -> None:
+        """Raise a ``GitHubAPIError`` if a response means the run can't go
+        on: a 401, or a 403 from an exhausted rate limit."""
+        if response.status_code == 401:
+            raise GitHubAPIError(
+                f"401 Unauthorized calling {url}. Check that GITHUB_TOKEN "
+                "is valid, unexpired, and has the correct scopes."
+            )
+        if response.status_code == 403 and self._is_rate_limit_exhausted(
+            response
+        ):
+            raise GitHubAPIError(
+                f"403 rate limit exhausted calling {url}. Resets at "
+                f"{self._format_rate_limit_reset(response)}."
+            )
+
     def handle_rate_limit(self, response):
         """
         Handle rate limiting by waiting until the rate limit resets.
@@ -202,15 +485,26 @@ class GitHubAPI:
         -----
         This method checks the remaining rate limit in the response headers.
         If the remaining requests are exhausted, it calculates the time
-        until the rate limit resets and sleeps accordingly.
+        until the rate limit resets and sleeps accordingly. If the client
+        has another token with budget left, it doesn't sleep since the next
+        request will use that token.
         """
+        sleep_time = self._rate_limit_wait(response)
+        if sleep_time:
+            recorder.record_sleep(sleep_time)
+            time.sleep(sleep_time)
+
+    def _rate_limit_wait(self, response) -> float:
+        """Return how long to wait for the rate limit to reset after
+        ``response`` (0 if there's budget left on any token)."""
         if "X-RateLimit-Remaining" in response.headers:
             remaining_requests = int(response.headers["X-RateLimit-Remaining"])
-            if remaining_requests <= 0:
+            if remaining_requests <= 0 and not self._has_spare_token():
                 reset_time = int(response.headers["X-RateLimit-Reset"])
-                sleep_time = max(reset_time - time.time(), 0) + 1
-                time.sleep(sleep_time)
+                return max(reset_time - time.time(), 0) + 1
+        return 0
 
+    @instrumented("GitHubAPI._get_response_rest")
     def _get_response_rest(self, url: str) -> list[dict[str, Any]]:
         """Make a GET request to the GitHub REST API.
         Handles pagination and rate limiting.
@@ -229,24 +523,10 @@ class GitHubAPI:
         api_endpoint_url = url
 
         while api_endpoint_url:
-            response = requests.get(
-                api_endpoint_url,
-                headers={"Authorization": f"token {self.get_token()}"},
-            )
+            response = self._request(api_endpoint_url)
 
-            if response.status_code == 401:
-                raise GitHubAPIError(
-                    f"401 Unauthorized calling {api_endpoint_url}. Check "
-                    "that GITHUB_TOKEN is valid, unexpired, and has the "
-                    "correct scopes."
-                )
+            self._raise_for_run_errors(response, api_endpoint_url)
             if response.status_code == 403:
-                if self._is_rate_limit_exhausted(response):
-                    raise GitHubAPIError(
-                        f"403 rate limit exhausted calling "
-                        f"{api_endpoint_url}. Resets at "
-                        f"{self._format_rate_limit_reset(response)}."
-                    )
                 logger.warning(
                     "403 Forbidden (permission denied, not rate-limited) "
                     f"calling {api_endpoint_url}.\n"
@@ -267,20 +547,31 @@ class GitHubAPI:
         self,
         endpoints: dict[str, dict[str, str]],
         reviews: dict[str, ReviewModel],
+        checkpoint: CheckpointJournal | None = None,
+        backends: dict[RepositoryHost, RepositoryBackend] | None = None,
     ) -> dict[str, ReviewModel]:
         """
-        Fetch GitHub metrics for all reviews using provided repo name and owner.
-        Does not work on GitLab currently.
+        Fetch repository metrics for all reviews using provided repo name and
+        owner.
+
+        GitHub packages are fetched in the order of ``endpoints`` (see
+        ``MetricsRefreshPolicy.plan`` to only refresh stale packages).
+        Packages on other hosts (GitLab, Codeberg, Bitbucket) are fetched
+        by their host's backend (see :mod:`pyosmeta.repository_hosts`) in
+        background threads at the same time.
 
         On success, sets ``review.gh_meta`` from the API response (date fields
-        are cleaned via the ``GhMeta`` model). On failure, leaves ``gh_meta``
+        are cleaned via the ``GhMeta`` model) along with the time it was
+        fetched. On failure, leaves ``gh_meta``
         as ``None`` so a separate merge step can gap-fill from previously
         published packages.yml data.
 
-        If a ``GitHubAPIError`` is raised (401 or exhausted rate-limit 403),
-        further API fetches for remaining packages are stopped
-        (``stop_metrics_run``). Those packages keep ``gh_meta=None`` for the
-        merge step to fill.
+        If the client has a pool of tokens, requests fail over to another
+        token when one token's rate limit is exhausted. If a
+        ``GitHubAPIError`` is raised (401, or exhausted rate-limit 403 for
+        every token), further API fetches for remaining GitHub packages are
+        stopped (``stop_metrics_run``). Those packages keep ``gh_meta=None``
+        for the merge step to fill.
 
         Parameters:
         ----------
@@ -288,6 +579,13 @@ class GitHubAPI:
             A dictionary mapping package names to their owner and repo-names.
         reviews : dict
             A dictionary containing review data.
+        checkpoint : CheckpointJournal, Optional
+            Journal of completed fetches. Packages already in the journal
+            (from a resumed run) reuse the recorded metrics instead of
+            calling the API, and each successful fetch is recorded.
+        backends : dict, Optional
+            The backend of each repository host other than GitHub. Defaults
+            to ``repository_hosts.default_backends()``.
 
         Returns:
         -------
@@ -295,19 +593,90 @@ class GitHubAPI:
             Review data with freshly fetched ``gh_meta`` where the API
             succeeded, or ``None`` where it did not.
         """
+        host_jobs = self._host_jobs(endpoints, reviews, checkpoint, backends)
+        with ThreadPoolExecutor(
+            max_workers=count_workers(host_jobs) or 1,
+            thread_name_prefix="pyosmeta-hosts",
+        ) as executor:
+            host_futures = submit_repo_metas(executor, host_jobs)
+            self._get_github_metrics(endpoints, reviews, checkpoint)
+
+            for future in host_futures:
+                for pkg_name, new_metadata in future.result().items():
+                    self._set_metrics(
+                        reviews, pkg_name, new_metadata, checkpoint
+                    )
+
+        return reviews
+
+    def _host_jobs(
+        self,
+        endpoints: dict[str, dict[str, str]],
+        reviews: dict[str, ReviewModel],
+        checkpoint: CheckpointJournal | None,
+        backends: dict[RepositoryHost, RepositoryBackend] | None,
+    ) -> dict[str, tuple[RepositoryBackend, dict[str, str]]]:
+        """Return the packages to fetch from hosts other than GitHub, with
+        their backend.
+
+        Packages already in the checkpoint get their recorded metrics set
+        instead.
+        """
+        if backends is None:
+            backends = default_backends(self)
+
+        host_jobs = {}
+        for pkg_name, owner_repo in endpoints.items():
+            host = reviews[pkg_name].repository_host
+            if host == RepositoryHost.github:
+                continue
+            if checkpoint is not None and pkg_name in checkpoint:
+                reviews[pkg_name].gh_meta = checkpoint.get(pkg_name)
+            elif host in backends:
+                host_jobs[pkg_name] = (backends[host], owner_repo)
+            else:
+                logger.warning(
+                    f"Unsupported repository host for {pkg_name}: {host}"
+                )
+        return host_jobs
+
+    @staticmethod
+    def _set_metrics(
+        reviews: dict[str, ReviewModel],
+        pkg_name: str,
+        new_metadata: dict[str, Any] | None,
+        checkpoint: CheckpointJournal | None,
+    ) -> None:
+        """Set a package's freshly fetched metrics, if the fetch succeeded."""
+        if new_metadata is not None:
+            new_metadata["fetched_at"] = (
+                datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+            )
+            reviews[pkg_name].gh_meta = new_metadata
+            if checkpoint is not None:
+                checkpoint.record(pkg_name, new_metadata)
+
+    def _get_github_metrics(
+        self,
+        endpoints: dict[str, dict[str, str]],
+        reviews: dict[str, ReviewModel],
+        checkpoint: CheckpointJournal | None,
+    ) -> None:
+        """Fetch the metrics of the GitHub packages, one at a time."""
         # If True, metrics run should stop further API fetches
         stop_metrics_run = False
 
+        github_endpoints = {
+            pkg_name: owner_repo
+            for pkg_name, owner_repo in endpoints.items()
+            if reviews[pkg_name].repository_host == RepositoryHost.github
+        }
         for pkg_name, owner_repo in tqdm(
-            endpoints.items(), desc="Fetching repo metadata"
+            github_endpoints.items(), desc="Fetching repo metadata"
         ):
             with logging_redirect_tqdm():
-                review = reviews[pkg_name]
-                if review.repository_host != RepositoryHost.github:
-                    logger.warning(
-                        f"Unsupported repository host for {pkg_name}: "
-                        f"{review.repository_host}"
-                    )
+                if checkpoint is not None and pkg_name in checkpoint:
+                    reviews[pkg_name].gh_meta = checkpoint.get(pkg_name)
                     continue
 
                 new_metadata = None
@@ -330,11 +699,9 @@ class GitHubAPI:
                         )
                         new_metadata = None
 
-                if new_metadata is not None:
-                    reviews[pkg_name].gh_meta = new_metadata
-
-        return reviews
+                self._set_metrics(reviews, pkg_name, new_metadata, checkpoint)
 
+    @instrumented("GitHubAPI._get_contrib_count_rest")
     def _get_contrib_count_rest(self, url: str) -> int | None:
         """
         Returns the count of total contributors to a repository.
@@ -361,17 +728,23 @@ class GitHubAPI:
         logged, and the method returns None.
         """
         # https://api.github.com/repos/{owner}/{repo}/contributors
-        repo_contribs_url = f"https://api.github.com/repos/{url['owner']}/{url['repo_name']}/contributors"
+        repo_contribs_url = self._repo_url(url, "/contributors")
         contributors = self._get_response_rest(repo_contribs_url)
+        return self._count_contributors(contributors, repo_contribs_url)
 
+    @staticmethod
+    def _count_contributors(
+        contributors: list[dict[str, Any]], url: str
+    ) -> int | None:
         if not contributors:
             logger.warning(
-                f"Repository not found: {repo_contribs_url}. Did the repo URL change?"
+                f"Repository not found: {url}. Did the repo URL change?"
             )
             return None
 
         return len(contributors)
 
+    @instrumented("GitHubAPI._get_metrics_rest")
     def _get_metrics_rest(
         self, repo_info: dict[str, str]
     ) -> dict[str, Any] | None:
@@ -399,12 +772,30 @@ class GitHubAPI:
         If the repository is not found or access is forbidden, this method
         returns None.
         """
+        url = self._repo_url(repo_info)
+        return self._parse_metrics_response(self._request(url), repo_info)
+
+    @staticmethod
+    def _repo_url(repo_info: dict[str, str], path: str = "") -> str:
+        return (
+            "https://api.github.com/repos/"
+            f"{repo_info['owner']}/{repo_info['repo_name']}{path}"
+        )
+
+    def _parse_metrics_response(
+        self, response: requests.Response, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """Return the GhMeta-compatible metrics in a GET /repos/{owner}/{repo}
+        response, or None if the repository wasn't found or is forbidden.
+
+        Raises
+        ------
+        GitHubAPIError
+            On a 401, or a 403 from an exhausted rate limit.
+        """
         owner = repo_info["owner"]
         repo_name = repo_info["repo_name"]
-        url = f"https://api.github.com/repos/{owner}/{repo_name}"
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-
-        response = requests.get(url, headers=headers)
+        self._raise_for_run_errors(response, self._repo_url(repo_info))
 
         if response.status_code == 200:
             repo_data = response.json()
@@ -422,17 +813,7 @@ class GitHubAPI:
                 f"Repository not found: {owner}/{repo_name}. Did the repo URL change?"
             )
             return None
-        elif response.status_code == 401:
-            raise GitHubAPIError(
-                f"401 Unauthorized calling {url}. Check that GITHUB_TOKEN "
-                "is valid, unexpired, and has the correct scopes."
-            )
         elif response.status_code == 403:
-            if self._is_rate_limit_exhausted(response):
-                raise GitHubAPIError(
-                    f"403 rate limit exhausted calling {url}. Resets at "
-                    f"{self._format_rate_limit_reset(response)}."
-                )
             logger.warning(
                 "403 Forbidden (permission denied, not rate-limited) for "
                 f"repository: {owner}/{repo_name}.\n"
@@ -445,6 +826,7 @@ class GitHubAPI:
             )
             return None
 
+    @instrumented("GitHubAPI.get_repo_meta_github")
     def get_repo_meta_github(
         self, repo_info: dict[str, str]
     ) -> dict[str, Any] | None:
@@ -480,8 +862,25 @@ class GitHubAPI:
     def get_repo_meta_gitlab(
         self, repo_info: dict[str, str]
     ) -> dict[str, Any] | None:
-        raise NotImplementedError
+        """Get GitLab metadata for a repository.
+
+        See :class:`pyosmeta.repository_hosts.GitLabBackend`.
+
+        Parameters
+        ----------
+        repo_info : dict
+            A dictionary containing the owner (including any subgroups) and
+            repository name.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            A dictionary containing the ``GhMeta`` metrics for the
+            repository, or None if it wasn't found.
+        """
+        return GitLabBackend().get_repo_meta(repo_info)
 
+    @instrumented("GitHubAPI.get_user_info")
     def get_user_info(
         self, gh_handle: str, name: Optional[str] = None
     ) -> dict[str, Union[str, Any]]:
@@ -504,8 +903,7 @@ class GitHubAPI:
         """
 
         url = f"https://api.github.com/users/{gh_handle}"
-        headers = {"Authorization": f"Bearer {self.get_token()}"}
-        response = requests.get(url, headers=headers)
+        response = self._request(url)
 
         if response.status_code == 401:
             raise ValueError(
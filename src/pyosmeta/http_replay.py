@@ -0,0 +1,230 @@
+"""
+Record the HTTP requests of a run and replay them offline.
+
+Every network call pyosmeta makes (GitHub REST, doi.org, the website's raw
+YAML files, ``.all-contributorsrc`` files, the RSS feed and URL checks)
+goes through :func:`pyosmeta.instrumentation.http_get` (or ``http_head``,
+for link probes). An
+:class:`HTTPCassette` in ``"record"`` mode sends those requests as usual
+and saves every response, and one in ``"replay"`` mode answers them from
+the saved responses without touching the network::
+
+    cassette/
+        requests.jsonl  # one line per response: URL, status, headers, body
+                        # (the URL of a HEAD request starts with "HEAD ")
+        bodies/         # response bodies, named by their sha256
+
+A recorded run can then be replayed end to end, reproducibly and without
+network latency, e.g. to benchmark or profile the parsing and export cost::
+
+    update-reviews --record-http cassette/
+    update-reviews --replay-http cassette/ --profile profile/
+
+Several scripts (e.g. ``update-reviews``, ``update-contributors`` and
+``update-review-teams``) can record into the same cassette.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Literal, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .instrumentation import set_http_transport
+from .logging import logger
+
+Mode = Literal["record", "replay"]
+
+# Not sent when recording, so that every recorded response has a body and
+# replays don't depend on the state of a local HTTP cache
+CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class ReplayMissError(requests.ConnectionError):
+    """A request that isn't in the cassette was made while replaying.
+
+    It's a ``ConnectionError``, so the run handles it like any other
+    network failure.
+    """
+
+
+def request_key(url: str, params: Any = None) -> str:
+    """Return the URL a request is recorded under, including its query."""
+    if not params:
+        return url
+    return requests.Request("GET", url, params=params).prepare().url
+
+
+class HTTPCassette:
+    """Record HTTP responses to a directory, or replay them from it.
+
+    Parameters
+    ----------
+    path : str or Path
+        The cassette directory. It's created when recording.
+    mode : {"record", "replay"}
+        Whether to record the responses of real requests, or to replay
+        recorded responses.
+
+    Notes
+    -----
+    A URL requested more than once is replayed with its responses in the
+    order they were recorded, repeating the last one once they run out.
+    Request headers (including the GitHub token) aren't recorded.
+    """
+
+    def __init__(self, path: str | Path, mode: Mode) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self._index_path = self.path / "requests.jsonl"
+        self._bodies_path = self.path / "bodies"
+        self._lock = threading.Lock()
+        self._entries: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._previous = None
+
+        if mode == "record":
+            self._bodies_path.mkdir(parents=True, exist_ok=True)
+        elif not self._index_path.exists():
+            raise FileNotFoundError(
+                f"There's no recorded run to replay in {self.path}"
+            )
+        else:
+            with open(self._index_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["url"]].append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send (or replay) a request; called like ``requests.get``."""
+        return self._request("get", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send (or replay) a request; called like ``requests.head``."""
+        return self._request("head", url, **kwargs)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        full_url = request_key(url, kwargs.get("params"))
+        # GET requests are recorded under their URL alone
+        key = full_url if method == "get" else f"{method.upper()} {full_url}"
+        if self.mode == "replay":
+            return self._replay(key, full_url)
+        return self._record(method, key, url, **kwargs)
+
+    def _record(
+        self, method: str, key: str, url: str, **kwargs
+    ) -> requests.Response:
+        headers = {
+            name: value
+            for name, value in (kwargs.pop("headers", None) or {}).items()
+            if name not in CONDITIONAL_HEADERS
+        }
+        try:
+            response = getattr(requests, method)(
+                url, headers=headers, **kwargs
+            )
+        except requests.RequestException as err:
+            self._save({"url": key, "error": type(err).__name__})
+            raise
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        body_path = self._bodies_path / sha256
+        if not body_path.exists():
+            body_path.write_bytes(response.content)
+        self._save(
+            {
+                "url": key,
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "encoding": response.encoding,
+                "body": sha256,
+            }
+        )
+        return response
+
+    def _save(self, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[entry["url"]].append(entry)
+            with open(self._index_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def _replay(self, key: str, url: str) -> requests.Response:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise ReplayMissError(f"{key} wasn't recorded in {self.path}")
+            entry = entries.popleft() if len(entries) > 1 else entries[0]
+
+        if "error" in entry:
+            raise requests.ConnectionError(
+                f"{entry['error']} while recording {key}"
+            )
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = entry["encoding"]
+        response._content = (self._bodies_path / entry["body"]).read_bytes()
+        return response
+
+    def __enter__(self) -> "HTTPCassette":
+        self._previous = set_http_transport(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        set_http_transport(self._previous)
+        if self.mode == "record":
+            logger.info(f"Recorded {len(self)} HTTP responses to {self.path}")
+
+
+def http_cassette(
+    record: Optional[str | Path] = None, replay: Optional[str | Path] = None
+) -> ContextManager:
+    """Record or replay the HTTP requests made in this context.
+
+    Parameters
+    ----------
+    record : str or Path, Optional
+        Record the responses to this cassette directory.
+    replay : str or Path, Optional
+        Replay the responses recorded in this cassette directory.
+
+    If neither is given, requests are sent as usual.
+    """
+    if record is not None and replay is not None:
+        raise ValueError("Can't record and replay HTTP requests at once")
+    if record is not None:
+        return HTTPCassette(record, "record")
+    if replay is not None:
+        return HTTPCassette(replay, "replay")
+    return nullcontext()
+
+
+def add_cassette_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--record-http`` and ``--replay-http`` options to a CLI."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--record-http",
+        metavar="DIR",
+        help="Record every HTTP response of the run to this directory",
+    )
+    group.add_argument(
+        "--replay-http",
+        metavar="DIR",
+        help="Replay the HTTP responses recorded in this directory instead "
+        "of using the network",
+    )
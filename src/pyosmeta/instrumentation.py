@@ -0,0 +1,378 @@
+"""
+Measure where a run spends its time and network requests.
+
+The network entry points (e.g. ``GitHubAPI._get_response_rest`` or
+``check_url``) are wrapped with :func:`instrumented`, and every HTTP request
+they make goes through :func:`http_get`. The CLI scripts wrap each step of
+the run in :meth:`RunRecorder.stage`. Everything is recorded by the
+module-level :data:`recorder`, which can write a JSON run report::
+
+    {
+      "started_at": "2026-10-19T12:00:00+00:00",
+      "wall_seconds": 95.2,
+      "stages": {"get-metrics": {"wall_seconds": 80.1, "cpu_seconds": 2.3,
+                                 "network_seconds": 77.0, "requests": 412,
+                                 ...}},
+      "endpoints": {"GitHubAPI._get_metrics_rest": {"calls": 206,
+                                                    "requests": 412, ...}}
+    }
+"""
+
+import bisect
+import contextvars
+import functools
+import inspect
+import json
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+import requests
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+
+_current_endpoint: contextvars.ContextVar[Optional[str]] = (
+    contextvars.ContextVar("pyosmeta_endpoint", default=None)
+)
+_current_stage: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "pyosmeta_stage", default=None
+)
+
+
+# Replaces the requests module in http_get and http_head, e.g. to record or
+# replay requests (see pyosmeta.http_replay)
+_http_transport: Optional[Any] = None
+
+
+def _bucket_label(bound: float) -> str:
+    return "+inf" if bound == float("inf") else f"le_{bound}"
+
+
+class EndpointStats:
+    """Calls and HTTP requests made through one network entry point."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.requests = 0
+        self.retries = 0
+        self.bytes = 0
+        self.rate_limit_units = 0
+        self.status_codes: dict[str, int] = {}
+        self.latency_histogram = [0] * len(LATENCY_BUCKETS)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 6),
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "rate_limit_units": self.rate_limit_units,
+            "status_codes": dict(sorted(self.status_codes.items())),
+            "latency_histogram": {
+                _bucket_label(bound): count
+                for bound, count in zip(
+                    LATENCY_BUCKETS, self.latency_histogram
+                )
+            },
+        }
+
+
+class StageStats:
+    """Wall, CPU and network time spent in one stage of a run."""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.network_seconds = 0.0
+        self.sleep_seconds = 0.0
+        self.requests = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "network_seconds": round(self.network_seconds, 6),
+            "sleep_seconds": round(self.sleep_seconds, 6),
+            "requests": self.requests,
+        }
+
+
+class RunRecorder:
+    """Collect per-endpoint and per-stage measurements for a run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stage_listeners: list[Callable[[Optional[str]], None]] = []
+        self.reset()
+
+    def add_stage_listener(
+        self, listener: Callable[[Optional[str]], None]
+    ) -> None:
+        """Call ``listener`` with the new stage name whenever the current
+        stage changes (None once no stage is running)."""
+        self._stage_listeners.append(listener)
+
+    def remove_stage_listener(
+        self, listener: Callable[[Optional[str]], None]
+    ) -> None:
+        self._stage_listeners.remove(listener)
+
+    def _notify_stage(self, name: Optional[str]) -> None:
+        for listener in self._stage_listeners:
+            listener(name)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far and restart the run clock."""
+        with self._lock:
+            self.started_at = datetime.now(timezone.utc)
+            self._start = time.perf_counter()
+            self.endpoints: dict[str, EndpointStats] = {}
+            self.stages: dict[str, StageStats] = {}
+
+    def _endpoint(self, name: Optional[str]) -> EndpointStats:
+        return self.endpoints.setdefault(name or "other", EndpointStats())
+
+    def _stage(self, name: Optional[str]) -> Optional[StageStats]:
+        return self.stages.setdefault(name, StageStats()) if name else None
+
+    def record_call(self, endpoint: str, seconds: float, error: bool) -> None:
+        """Record one call of a network entry point."""
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.calls += 1
+            stats.errors += error
+            stats.seconds += seconds
+
+    def record_request(
+        self,
+        seconds: float,
+        response: Optional[requests.Response] = None,
+        nbytes: Optional[int] = None,
+        status: Optional[int] = None,
+        retry: bool = False,
+    ) -> None:
+        """Record one HTTP request made by the current entry point.
+
+        Parameters
+        ----------
+        seconds : float
+            How long the request took.
+        response : requests.Response, Optional
+            The response, if the request didn't fail. Its size, status and
+            GitHub rate limit usage are recorded.
+        nbytes, status : int, Optional
+            The response size and status, if the request wasn't made with
+            ``requests``.
+        retry : bool
+            Whether this request retries an earlier one.
+        """
+        rate_limited = False
+        if response is not None:
+            status = response.status_code
+            # A streamed response's body isn't read here, since it may not
+            # be downloaded at all (e.g. by link probes)
+            if (
+                nbytes is None
+                and getattr(response, "_content", None) is not False
+            ):
+                content = getattr(response, "content", None)
+                if isinstance(content, bytes):
+                    nbytes = len(content)
+            headers = getattr(response, "headers", None)
+            rate_limited = isinstance(headers, Mapping) and (
+                "X-RateLimit-Remaining" in headers
+            )
+
+        with self._lock:
+            stats = self._endpoint(_current_endpoint.get())
+            stats.requests += 1
+            stats.retries += retry
+            stats.bytes += nbytes or 0
+            stats.rate_limit_units += rate_limited
+            key = "error" if status is None else str(status)
+            stats.status_codes[key] = stats.status_codes.get(key, 0) + 1
+            bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+            stats.latency_histogram[bucket] += 1
+
+            stage = self._stage(_current_stage.get())
+            if stage is not None:
+                stage.requests += 1
+                stage.network_seconds += seconds
+
+    def record_sleep(self, seconds: float) -> None:
+        """Record time spent waiting (e.g. for a rate limit to reset)."""
+        with self._lock:
+            stage = self._stage(_current_stage.get())
+            if stage is not None:
+                stage.sleep_seconds += seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage of the run.
+
+        Requests made while the stage is running (including from worker
+        threads started with a copy of the current context) count towards
+        the stage.
+        """
+        token = _current_stage.set(name)
+        self._notify_stage(name)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            _current_stage.reset(token)
+            self._notify_stage(_current_stage.get())
+            with self._lock:
+                stats = self._stage(name)
+                stats.runs += 1
+                stats.wall_seconds += time.perf_counter() - wall
+                stats.cpu_seconds += time.process_time() - cpu
+
+    def report(self) -> dict[str, Any]:
+        """Return the run report as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(),
+                "wall_seconds": round(time.perf_counter() - self._start, 6),
+                "stages": {
+                    name: stats.to_dict()
+                    for name, stats in self.stages.items()
+                },
+                "endpoints": {
+                    name: stats.to_dict()
+                    for name, stats in sorted(self.endpoints.items())
+                },
+            }
+
+    def write_report(self, path: str | Path) -> None:
+        """Write the run report to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
+
+
+recorder = RunRecorder()
+"""The recorder used by pyosmeta's network entry points and CLI scripts"""
+
+
+def instrumented(endpoint: str) -> Callable:
+    """Decorate a network entry point so its calls are recorded.
+
+    HTTP requests made during the call are attributed to ``endpoint``. If
+    the call is nested in another entry point (e.g. ``load_json`` reading
+    through the HTTP cache), they're attributed to the outermost one.
+    Coroutine functions are timed until they finish.
+
+    Parameters
+    ----------
+    endpoint : str
+        The name to report the entry point under.
+    """
+
+    @contextmanager
+    def record() -> Iterator[None]:
+        token = None
+        if _current_endpoint.get() is None:
+            token = _current_endpoint.set(endpoint)
+        start = time.perf_counter()
+        error = True
+        try:
+            yield
+            error = False
+        finally:
+            if token is not None:
+                _current_endpoint.reset(token)
+            recorder.record_call(endpoint, time.perf_counter() - start, error)
+
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with record():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with record():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def set_http_transport(transport: Optional[Any]) -> Optional[Any]:
+    """Make :func:`http_get` and :func:`http_head` send requests with
+    ``transport``.
+
+    Parameters
+    ----------
+    transport : object, Optional
+        An object with ``get`` and ``head`` methods called like
+        ``requests.get`` and ``requests.head``, e.g. a ``requests.Session``.
+        If None, the ``requests`` module is used.
+
+    Returns
+    -------
+    object or None
+        The previous transport.
+    """
+    global _http_transport
+    previous, _http_transport = _http_transport, transport
+    return previous
+
+
+def _send(
+    method: str, url: str, retry: bool, kwargs: dict[str, Any]
+) -> requests.Response:
+    start = time.perf_counter()
+    transport = requests if _http_transport is None else _http_transport
+    try:
+        response = getattr(transport, method)(url, **kwargs)
+    except Exception:
+        recorder.record_request(time.perf_counter() - start, retry=retry)
+        raise
+    recorder.record_request(
+        time.perf_counter() - start, response=response, retry=retry
+    )
+    return response
+
+
+def http_get(url: str, retry: bool = False, **kwargs) -> requests.Response:
+    """Make a GET request with ``requests.get`` and record it.
+
+    The request is sent with the transport set by
+    :func:`set_http_transport`, if there is one.
+
+    Parameters
+    ----------
+    url : str
+        The URL to request.
+    retry : bool
+        Whether this request retries an earlier one.
+    **kwargs
+        Passed on to ``requests.get``.
+    """
+    return _send("get", url, retry, kwargs)
+
+
+def http_head(url: str, retry: bool = False, **kwargs) -> requests.Response:
+    """Make a HEAD request with ``requests.head`` and record it.
+
+    See :func:`http_get`.
+    """
+    return _send("head", url, retry, kwargs)
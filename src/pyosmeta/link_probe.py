@@ -0,0 +1,204 @@
+"""
+Check whether links resolve without downloading them.
+
+Documentation homepages, archives and contributor websites only need to be
+checked for whether they resolve. :class:`LinkProber` sends a ``HEAD``
+request for each link, following redirects, so that no body is downloaded.
+Some servers reject ``HEAD`` requests (e.g. with a 405), so those links are
+checked again with a ``GET`` request for the first byte only
+(``Range: bytes=0-0``), whose body isn't read.
+
+Requests have short connect and read timeouts, and each host gets at most
+``max_per_host`` requests at once, at least ``min_interval`` seconds apart,
+so that checking many links on one host (e.g. ``github.io``) stays polite.
+:meth:`LinkProber.probe_many` checks many links at once::
+
+    results = LinkProber().probe_many(urls)
+    broken = [url for url, result in results.items() if not result]
+"""
+
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from .instrumentation import http_get, http_head
+from .rate_limit import HostRateLimiter
+
+HEAD_REJECTED_STATUSES = frozenset({400, 403, 404, 405, 501})
+"""Statuses after which a HEAD request is retried as a ranged GET"""
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """The outcome of checking a link.
+
+    A result is true if the link resolved.
+
+    Parameters
+    ----------
+    url : str
+        The link that was checked.
+    ok : bool
+        Whether the link resolved (with a status below 400).
+    status : int, Optional
+        The final response's status, or None if the request failed.
+    final_url : str, Optional
+        The URL the link redirected to, or None if the request failed.
+    redirects : tuple[str]
+        The URLs of each redirect followed, in order.
+    latency : float
+        Seconds spent checking the link, including any fallback request.
+    method : str
+        The method of the last request, ``HEAD`` or ``GET``.
+    error : str, Optional
+        The name of the error, if the request failed.
+    """
+
+    url: str
+    ok: bool
+    status: Optional[int] = None
+    final_url: Optional[str] = None
+    redirects: tuple[str, ...] = ()
+    latency: float = 0.0
+    method: str = "HEAD"
+    error: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+
+class LinkProber:
+    """Check links with HEAD requests, falling back to ranged GETs.
+
+    Parameters
+    ----------
+    connect_timeout : float
+        Seconds to wait for a connection.
+    read_timeout : float
+        Seconds to wait for a response once connected.
+    max_per_host : int
+        The maximum number of requests to one host at once.
+    min_interval : float
+        The minimum number of seconds between two requests to one host.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 5,
+        read_timeout: float = 10,
+        max_per_host: int = 2,
+        min_interval: float = 0.0,
+    ) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self._limiters: dict[str, HostRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, url: str) -> HostRateLimiter:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._limiters:
+                self._limiters[host] = HostRateLimiter(
+                    self.max_per_host, self.min_interval
+                )
+            return self._limiters[host]
+
+    def _request(self, method: str, url: str) -> requests.Response:
+        with self._limiter(url).slot():
+            if method == "HEAD":
+                return http_head(
+                    url, allow_redirects=True, timeout=self.timeout
+                )
+            response = http_get(
+                url,
+                headers={"Range": "bytes=0-0"},
+                stream=True,
+                timeout=self.timeout,
+            )
+            # Don't download the body if the server ignored the range
+            response.close()
+            return response
+
+    def probe(self, url: str) -> ProbeResult:
+        """Check whether a link resolves.
+
+        Parameters
+        ----------
+        url : str
+            The link to check.
+
+        Returns
+        -------
+        ProbeResult
+            The outcome, which is true if the link resolved.
+        """
+        start = time.perf_counter()
+        method = "HEAD"
+        try:
+            response = self._request(method, url)
+            if response.status_code in HEAD_REJECTED_STATUSES:
+                method = "GET"
+                response = self._request(method, url)
+        except requests.RequestException as err:
+            return ProbeResult(
+                url,
+                ok=False,
+                latency=time.perf_counter() - start,
+                method=method,
+                error=type(err).__name__,
+            )
+
+        return ProbeResult(
+            url,
+            ok=response.status_code < 400,
+            status=response.status_code,
+            final_url=response.url or url,
+            redirects=tuple(r.url for r in response.history),
+            latency=time.perf_counter() - start,
+            method=method,
+        )
+
+    def probe_many(
+        self, urls: Iterable[str], max_workers: int = 16
+    ) -> dict[str, ProbeResult]:
+        """Check many links at once.
+
+        Parameters
+        ----------
+        urls : iterable of str
+            The links to check. Each distinct link is checked once.
+        max_workers : int
+            The number of links checked at the same time, across all hosts.
+
+        Returns
+        -------
+        dict[str, ProbeResult]
+            The outcome of each link.
+        """
+        urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyosmeta-links"
+        ) as executor:
+            futures = [
+                # Pass the recorder's current stage on to the worker threads
+                executor.submit(
+                    contextvars.copy_context().run, self.probe, url
+                )
+                for url in urls
+            ]
+            return {url: future.result() for url, future in zip(urls, futures)}
+
+
+_default_prober = LinkProber()
+
+
+def probe_url(url: str) -> ProbeResult:
+    """Check whether a link resolves with a shared :class:`LinkProber`."""
+    return _default_prober.probe(url)
@@ -0,0 +1,300 @@
+"""
+An append-only, columnar history of package GitHub metrics.
+
+``update-reviews`` overwrites ``gh_meta`` in packages.yml on every run. To
+keep the history, each run appends a snapshot of every package's metrics
+to a :class:`MetricsStore`, a directory with one binary file per column::
+
+    metrics_history/
+        packages.txt          # package names; a package's id is its line
+        snapshot_at.bin       # int64, seconds since the epoch (UTC)
+        package_id.bin        # int32
+        stargazers_count.bin  # int64, -1 if missing
+        ...
+
+Each column file is a packed array of fixed-size values, so appending a
+snapshot only appends a few bytes to each file, and a column can be read
+without reading the others. A package's snapshots are always appended in
+time order, so queries find a time range in each package's rows by
+bisection.
+"""
+
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .github_api import MetricsRefreshPolicy
+from .logging import logger
+from .models import GhMeta
+
+MISSING = -1
+"""Stored in place of a missing count or date"""
+
+# Column name -> array typecode
+COLUMNS = {
+    "snapshot_at": "q",
+    "package_id": "i",
+    "stargazers_count": "q",
+    "forks_count": "q",
+    "watchers_count": "q",
+    "open_issues_count": "q",
+    "contrib_count": "q",
+    "last_commit": "i",  # days since the epoch
+}
+COUNT_COLUMNS = (
+    "stargazers_count",
+    "forks_count",
+    "watchers_count",
+    "open_issues_count",
+    "contrib_count",
+)
+EPOCH_DAY = date(1970, 1, 1)
+
+
+class MetricsSnapshot(NamedTuple):
+    """A package's GitHub metrics at a point in time."""
+
+    package_name: str
+    snapshot_at: datetime
+    stargazers_count: Optional[int]
+    forks_count: Optional[int]
+    watchers_count: Optional[int]
+    open_issues_count: Optional[int]
+    contrib_count: Optional[int]
+    last_commit: Optional[date]
+
+
+def _to_timestamp(when: datetime) -> int:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return int(when.timestamp())
+
+
+def _to_day(value: Optional[str]) -> int:
+    try:
+        return (date.fromisoformat(value) - EPOCH_DAY).days
+    except (TypeError, ValueError):
+        return MISSING
+
+
+class MetricsStore:
+    """Append-only columnar store of GhMeta snapshots.
+
+    Parameters
+    ----------
+    path : str or Path
+        The store directory. It's created if it doesn't exist.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._names_path = self.path / "packages.txt"
+
+        self._names: list[str] = []
+        if self._names_path.exists():
+            self._names = self._names_path.read_text().splitlines()
+        self._ids = {name: i for i, name in enumerate(self._names)}
+
+        self._columns = {
+            column: self._read_column(column) for column in COLUMNS
+        }
+        self._repair()
+
+        # package id -> row numbers and their snapshot times, oldest first
+        self._rows_by_package: dict[int, list[int]] = {}
+        self._times_by_package: dict[int, list[int]] = {}
+        snapshot_at = self._columns["snapshot_at"]
+        for row, package_id in enumerate(self._columns["package_id"]):
+            self._index_row(package_id, row, snapshot_at[row])
+
+    def _index_row(self, package_id: int, row: int, timestamp: int) -> None:
+        rows = self._rows_by_package.setdefault(package_id, [])
+        times = self._times_by_package.setdefault(package_id, [])
+        rows.append(row)
+        times.append(timestamp)
+
+    def _column_path(self, column: str) -> Path:
+        return self.path / f"{column}.bin"
+
+    def _read_column(self, column: str) -> array:
+        values = array(COLUMNS[column])
+        path = self._column_path(column)
+        if path.exists():
+            with open(path, "rb") as f:
+                data = f.read()
+            # Ignore a partially written trailing value
+            usable = len(data) - len(data) % values.itemsize
+            values.frombytes(data[:usable])
+        return values
+
+    def _repair(self) -> None:
+        """Drop rows that weren't written to every column.
+
+        This only happens if a previous append was interrupted.
+        """
+        n_rows = min(len(values) for values in self._columns.values())
+        for column, values in self._columns.items():
+            del values[n_rows:]
+            path = self._column_path(column)
+            size = n_rows * values.itemsize
+            if path.exists() and path.stat().st_size != size:
+                logger.warning(f"Dropping incomplete metrics rows in {path}")
+                os.truncate(path, size)
+
+    def __len__(self) -> int:
+        return len(self._columns["snapshot_at"])
+
+    def packages(self) -> list[str]:
+        """Return the names of all packages with snapshots."""
+        return list(self._names)
+
+    def _package_id(self, package_name: str) -> int:
+        package_name = package_name.lower()
+        if package_name not in self._ids:
+            self._ids[package_name] = len(self._names)
+            self._names.append(package_name)
+            with open(self._names_path, "a") as f:
+                f.write(package_name + "\n")
+        return self._ids[package_name]
+
+    def last_snapshot_at(self, package_name: str) -> Optional[datetime]:
+        """Return when a package's most recent snapshot was taken."""
+        rows = self._rows_by_package.get(self._ids.get(package_name.lower()))
+        if not rows:
+            return None
+        timestamp = self._columns["snapshot_at"][rows[-1]]
+        return datetime.fromtimestamp(timestamp, timezone.utc)
+
+    def append(
+        self,
+        gh_metas: dict[str, Optional[GhMeta]],
+        snapshot_at: Optional[datetime] = None,
+    ) -> int:
+        """Append a snapshot of each package's metrics.
+
+        Each snapshot is timestamped with the metrics' ``fetched_at`` time.
+        Metrics that are already stored (i.e. not fetched since the
+        package's last snapshot) are skipped.
+
+        Metrics without a (valid) ``fetched_at``, e.g. legacy packages.yml
+        entries used to gap-fill a failed fetch, are only stored as a
+        package's first snapshot, timestamped ``snapshot_at``. Otherwise the
+        same old counts would be appended again on every run.
+
+        Parameters
+        ----------
+        gh_metas : dict[str, GhMeta]
+            Metrics keyed by package name. Packages without metrics are
+            skipped.
+        snapshot_at : datetime, Optional
+            The time to record for metrics without a ``fetched_at``
+            timestamp. Defaults to now.
+
+        Returns
+        -------
+        int
+            The number of snapshots appended.
+        """
+        default_at = snapshot_at or datetime.now(timezone.utc)
+        new_rows: dict[str, list[int]] = {column: [] for column in COLUMNS}
+
+        for package_name, gh_meta in gh_metas.items():
+            if gh_meta is None:
+                continue
+            fetched_at = MetricsRefreshPolicy.last_fetched(gh_meta)
+            last = self.last_snapshot_at(package_name)
+            if last is not None and (
+                fetched_at is None
+                or _to_timestamp(fetched_at) <= _to_timestamp(last)
+            ):
+                continue
+            taken_at = fetched_at or default_at
+
+            package_id = self._package_id(package_name)
+            new_rows["snapshot_at"].append(_to_timestamp(taken_at))
+            new_rows["package_id"].append(package_id)
+            for column in COUNT_COLUMNS:
+                value = getattr(gh_meta, column)
+                new_rows[column].append(MISSING if value is None else value)
+            new_rows["last_commit"].append(_to_day(gh_meta.last_commit))
+
+        n_new = len(new_rows["snapshot_at"])
+        if not n_new:
+            return 0
+
+        first_row = len(self)
+        for column, values in new_rows.items():
+            values = array(COLUMNS[column], values)
+            with open(self._column_path(column), "ab") as f:
+                values.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+            self._columns[column].extend(values)
+        for row, (package_id, timestamp) in enumerate(
+            zip(new_rows["package_id"], new_rows["snapshot_at"]), first_row
+        ):
+            self._index_row(package_id, row, timestamp)
+
+        logger.info(f"Saved {n_new} metrics snapshots to {self.path}")
+        return n_new
+
+    def _snapshot(self, row: int) -> MetricsSnapshot:
+        counts = {
+            column: self._columns[column][row] for column in COUNT_COLUMNS
+        }
+        last_commit = self._columns["last_commit"][row]
+        return MetricsSnapshot(
+            package_name=self._names[self._columns["package_id"][row]],
+            snapshot_at=datetime.fromtimestamp(
+                self._columns["snapshot_at"][row], timezone.utc
+            ),
+            **{
+                column: None if value == MISSING else value
+                for column, value in counts.items()
+            },
+            last_commit=(
+                None
+                if last_commit == MISSING
+                else date.fromordinal(EPOCH_DAY.toordinal() + last_commit)
+            ),
+        )
+
+    def query(
+        self,
+        package_name: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> list[MetricsSnapshot]:
+        """Return snapshots, optionally for one package and a time range.
+
+        Parameters
+        ----------
+        package_name : str, Optional
+            Only return this package's snapshots. Defaults to all packages.
+        start, end : datetime, Optional
+            Only return snapshots taken at or after ``start`` and before
+            ``end``.
+
+        Returns
+        -------
+        list[MetricsSnapshot]
+            The snapshots, oldest first.
+        """
+        if package_name is not None:
+            package_ids = [self._ids.get(package_name.lower())]
+        else:
+            package_ids = list(self._rows_by_package)
+
+        in_range = []
+        for package_id in package_ids:
+            rows = self._rows_by_package.get(package_id, [])
+            times = self._times_by_package.get(package_id, [])
+            lo = bisect_left(times, _to_timestamp(start)) if start else 0
+            hi = bisect_left(times, _to_timestamp(end)) if end else len(times)
+            in_range.append(zip(times[lo:hi], rows[lo:hi]))
+        return [self._snapshot(row) for _, row in heapq.merge(*in_range)]
@@ -1,10 +1,14 @@
-from pyosmeta.models.base import (
-    GhMeta,
-    PersonModel,
-    ReviewModel,
-    ReviewUser,
-    UrlValidatorMixin,
-)
+import importlib
+
+# The models are imported when first used, so that importing
+# pyosmeta.models.github doesn't also build the review models
+_LAZY_IMPORTS = {
+    "UrlValidatorMixin": "pyosmeta.models.base",
+    "PersonModel": "pyosmeta.models.base",
+    "GhMeta": "pyosmeta.models.base",
+    "ReviewModel": "pyosmeta.models.base",
+    "ReviewUser": "pyosmeta.models.base",
+}
 
 __all__ = [
     "UrlValidatorMixin",
@@ -13,3 +17,15 @@ __all__ = [
     "ReviewModel",
     "ReviewUser",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
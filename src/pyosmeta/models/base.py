@@ -6,7 +6,8 @@ This module also includes a convenience class for URL validation.
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, Set, Union
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Set, Union
 
 from pydantic import (
     AliasChoices,
@@ -40,6 +41,22 @@ class RepositoryHost(str, Enum):
     codeberg = "codeberg"
     bitbucket = "bitbucket"
 
+    @classmethod
+    def from_domain(cls, domain: str) -> "RepositoryHost":
+        """Determine the repository host from a domain name.
+
+        Falls back to a substring match so that anything containing a known
+        domain (e.g. a malformed URL) still maps to its host.
+        """
+        domain = domain.lower().removeprefix("www.")
+        host = REPOSITORY_HOST_DOMAINS.get(domain)
+        if host is not None:
+            return host
+        for known_domain, host in REPOSITORY_HOST_DOMAINS.items():
+            if known_domain in domain:
+                return host
+        return cls.other
+
     @classmethod
     def from_url(cls, url: str) -> "RepositoryHost":
         """Determine the repository host from a given URL.
@@ -54,19 +71,10 @@ class RepositoryHost(str, Enum):
         RepositoryHost
             The corresponding RepositoryHost enum value.
         """
-        if "github.com" in url:
-            return cls.github
-        elif "gitlab.com" in url:
-            return cls.gitlab
-        elif "codeberg.org" in url:
-            return cls.codeberg
-        elif "bitbucket.org" in url:
-            return cls.bitbucket
-        else:
-            return cls.other
+        return parse_repository_url(url).host
 
     def parse_url(self, url: str) -> tuple[str, str]:
-        """Parse the URL to extract the repository host name.
+        """Parse the URL to extract the repository owner and name.
 
         Parameters
         ----------
@@ -78,12 +86,118 @@ class RepositoryHost(str, Enum):
         tuple[str, str]
             The owner and repository name.
         """
-        match = re.match(r"https?://[^/]+/([^/]+)/([^/]+)", url)
-        if match:
-            owner, repo = match.group(1), match.group(2)
-            return owner, repo
-        else:
+        parsed = parse_repository_url(url)
+        if parsed.owner is None:
             raise ValueError(f"Could not parse owner/repo from URL: {url}")
+        return parsed.owner, parsed.repo
+
+
+REPOSITORY_HOST_DOMAINS: dict[str, RepositoryHost] = {
+    "github.com": RepositoryHost.github,
+    "gitlab.com": RepositoryHost.gitlab,
+    "codeberg.org": RepositoryHost.codeberg,
+    "bitbucket.org": RepositoryHost.bitbucket,
+}
+"""Domain of each supported repository host"""
+
+REPOSITORY_URL = re.compile(
+    r"^(?:[a-z+]+://)?(?:[^@/\s]+@)?(?P<domain>[^/:\s]+)(?::\d*)?[/:]"
+    r"(?P<path>[^?#\s]*)",
+    re.IGNORECASE,
+)
+"""
+Split a repository URL into its domain and path.
+
+Handles http(s) URLs, URLs without a scheme and ``git@host:owner/repo``
+ssh remotes. Query strings and fragments are dropped.
+"""
+
+GITLAB_LEGACY_ROUTES = frozenset(
+    {
+        "blame",
+        "blob",
+        "branches",
+        "commit",
+        "commits",
+        "compare",
+        "issues",
+        "merge_requests",
+        "pipelines",
+        "raw",
+        "releases",
+        "tags",
+        "tree",
+        "wikis",
+    }
+)
+"""Project pages GitLab also serves without the ``/-/`` separator"""
+
+
+class RepositoryUrl(NamedTuple):
+    """A repository URL parsed into its host, owner and repository name.
+
+    ``owner`` and ``repo`` are None if they couldn't be parsed from the URL.
+    For GitLab, ``owner`` includes any subgroups (e.g. ``group/subgroup``).
+    """
+
+    host: RepositoryHost
+    owner: str | None
+    repo: str | None
+
+
+@lru_cache(maxsize=1024)
+def parse_repository_url(url: str) -> RepositoryUrl:
+    """Parse a repository URL once into its host, owner and repo name.
+
+    Each review's repository link is needed both to set
+    ``ReviewModel.repository_host`` and to build the API endpoints for its
+    metrics, so results are cached and shared between the two.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the repository.
+
+    Returns
+    -------
+    RepositoryUrl
+        The parsed repository URL.
+
+    Examples
+    --------
+    >>> parse_repository_url("https://github.com/pyOpenSci/pyosMeta.git")
+    RepositoryUrl(host=<RepositoryHost.github: 'github'>, owner='pyOpenSci', repo='pyosMeta')
+
+    >>> parse_repository_url("https://gitlab.com/group/subgroup/repo/-/tree/main")
+    RepositoryUrl(host=<RepositoryHost.gitlab: 'gitlab'>, owner='group/subgroup', repo='repo')
+    """
+    match = REPOSITORY_URL.match(url.strip())
+    if not match:
+        return RepositoryUrl(RepositoryHost.from_domain(url), None, None)
+
+    host = RepositoryHost.from_domain(match.group("domain"))
+    path = match.group("path")
+    if host == RepositoryHost.gitlab:
+        # GitLab puts everything after the project path behind a /-/
+        # separator, and projects can be nested in (sub)groups
+        path = path.split("/-/", 1)[0]
+    segments = [segment for segment in path.split("/") if segment]
+    if host == RepositoryHost.gitlab:
+        # Older links (e.g. /group/repo/tree/main) have no /-/ separator.
+        # The project path is at least group/repo, so routes start after it.
+        for i in range(2, len(segments)):
+            if segments[i] in GITLAB_LEGACY_ROUTES:
+                segments = segments[:i]
+                break
+    if len(segments) < 2:
+        return RepositoryUrl(host, None, None)
+
+    if host == RepositoryHost.gitlab:
+        owner, repo = "/".join(segments[:-1]), segments[-1]
+    else:
+        # Other hosts only have owner/repo; ignore eg. /tree/main
+        owner, repo = segments[0], segments[1]
+    return RepositoryUrl(host, owner, repo.removesuffix(".git"))
 
 
 class UrlValidatorMixin:
@@ -259,6 +373,9 @@ class GhMeta(BaseModel, UrlValidatorMixin):
     # Optional in case the rest call fails and we don't have new metrics
     contrib_count: Optional[int] = None
     last_commit: str
+    # When these metrics were fetched from the API (ISO 8601 timestamp in
+    # UTC). Missing for metrics saved before this was tracked.
+    fetched_at: Optional[str] = None
 
     @field_validator(
         "last_commit",
@@ -274,9 +391,24 @@ class GhMeta(BaseModel, UrlValidatorMixin):
 
         return clean_date(a_date)
 
+    @field_validator("fetched_at", mode="before")
+    @classmethod
+    def serialize_fetched_at(cls, fetched_at: Any) -> Optional[str]:
+        """YAML loaders may return an unquoted timestamp as a datetime."""
+        if isinstance(fetched_at, datetime):
+            return fetched_at.isoformat()
+        return fetched_at
+
 
 class ReviewUser(BaseModel):
-    """Minimal model of a github user, used in several places in review parsing"""
+    """Minimal model of a github user, used in several places in review parsing
+
+    ReviewUsers are immutable because parsed users are memoized and the same
+    instance is shared by every review that user appears in. Use
+    ``model_copy(update=...)`` to get an updated user.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str | None
     github_username: str
@@ -347,15 +479,10 @@ class ReviewModel(BaseModel):
         """Clean a manually added datetime that is added to a review by an
         editor when the review package is accepted.
 
+        Uses the general clean_date function, which also handles the
+        month-day-year dates found in older review templates.
         """
-        if a_date is None or a_date in ["missing", "TBD"]:
-            return "missing"
-        else:
-            new_date = a_date.replace("/", "-").split("-")
-            if len(new_date[0]) == 4:
-                return f"{new_date[0]}-{new_date[1]}-{new_date[2]}"
-            else:
-                return f"{new_date[2]}-{new_date[0]}-{new_date[1]}"
+        return clean_date(a_date)
 
     @field_validator(
         "package_name",
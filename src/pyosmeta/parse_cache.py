@@ -0,0 +1,177 @@
+"""
+Reuse the reviews parsed from issues that haven't changed.
+
+Parsing a review issue (its header, categories and the ``ReviewModel``
+validation, which resolves DOIs and checks links) is the slowest part of
+``update-reviews`` after the GitHub requests. A :class:`ParseCache` keeps
+the review parsed from each issue, keyed by a hash of the issue's URL, body
+and labels. :meth:`pyosmeta.parse_issues.ProcessIssues.parse_issue` returns
+the cached review for an issue whose key hasn't changed, so a full rebuild
+only parses the issues that were edited.
+
+The cache is tied to the parser: a hash of the source of
+``parse_issues.py``, the models and the parsing utilities. When any of them
+changes, the cache is emptied.
+
+Parsing also resolves DOIs and checks links over the network, so entries
+expire after ``max_age``, and reviews whose archive or JOSS DOI couldn't be
+resolved (e.g. doi.org was down) aren't cached at all.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import time
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from .logging import logger
+from .models import ReviewModel
+from .models.github import Issue, Labels
+
+DEFAULT_PARSE_CACHE = Path(".pyosmeta_cache") / "parsed_reviews.pickle"
+"""Where the ``--parse-cache`` option keeps parsed reviews by default"""
+
+PACKAGE_DIR = Path(__file__).parent
+
+PARSER_SOURCES = (
+    "parse_issues.py",
+    "utils_parse.py",
+    "utils_clean.py",
+    "models/*.py",
+)
+"""The files (relative to the package) whose code parses reviews"""
+
+DEFAULT_MAX_AGE = timedelta(days=7)
+"""How long a parsed review is reused before its links are checked again"""
+
+DOI_FIELDS = ("archive", "joss")
+"""Review fields resolved from DOIs to the record they point to"""
+
+UNRESOLVED_DOI = re.compile(r"^https?://(dx\.)?doi\.org/", re.IGNORECASE)
+"""A doi.org link left as is because the DOI couldn't be resolved"""
+
+ISSUE_METADATA_FIELDS = ("created_at", "updated_at", "closed_at")
+"""Review fields copied from the issue, which change without the body"""
+
+
+@lru_cache(maxsize=1)
+def parser_version() -> str:
+    """Return a hash of the source of the code that parses reviews."""
+    digest = hashlib.sha256()
+    for pattern in PARSER_SOURCES:
+        for path in sorted(PACKAGE_DIR.glob(pattern)):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def issue_key(issue: Issue) -> str:
+    """Return the hash an issue's review is cached under."""
+    labels = sorted(
+        label.name if isinstance(label, Labels) else label
+        for label in issue.labels
+    )
+    digest = hashlib.sha256()
+    for part in (str(issue.url), issue.body or "", *labels):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Reviews parsed from issues, keyed by :func:`issue_key`.
+
+    Parameters
+    ----------
+    path : str or Path, Optional
+        The pickle file. It's loaded if it exists and was written by the
+        same parser. If None, reviews are only cached in memory.
+    max_age : timedelta
+        How long a cached review is reused.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str | Path] = None,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_age = max_age
+        # When each review was cached, and the pickled review, so that every
+        # hit returns a new copy
+        self._entries: dict[str, tuple[float, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+
+        if self.path is not None and self.path.exists():
+            try:
+                with open(self.path, "rb") as f:
+                    saved = pickle.load(f)
+            except (pickle.UnpicklingError, EOFError, AttributeError):
+                logger.warning(f"Ignoring unreadable parse cache {self.path}")
+            else:
+                if saved.get("version") == parser_version():
+                    now = time.time()
+                    self._entries = {
+                        key: entry
+                        for key, entry in saved["entries"].items()
+                        if now - entry[0] <= max_age.total_seconds()
+                    }
+                else:
+                    logger.info(
+                        "The review parser changed. Parsing every review "
+                        "again."
+                    )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, issue: Issue) -> Optional[ReviewModel]:
+        """Return the review parsed from an unchanged issue, or None."""
+        entry = self._entries.get(issue_key(issue))
+        if (
+            entry is None
+            or time.time() - entry[0] > self.max_age.total_seconds()
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        review = pickle.loads(entry[1])
+        return review.model_copy(
+            update={
+                field: getattr(issue, field) for field in ISSUE_METADATA_FIELDS
+            }
+        )
+
+    def put(self, issue: Issue, review: ReviewModel) -> None:
+        """Cache the review parsed from an issue, unless one of its DOIs
+        couldn't be resolved."""
+        for field in DOI_FIELDS:
+            value = getattr(review, field)
+            if value and UNRESOLVED_DOI.match(value):
+                logger.info(
+                    f"Not caching {review.package_name}: its {field} DOI "
+                    f"wasn't resolved ({value})"
+                )
+                return
+        self._entries[issue_key(issue)] = (time.time(), pickle.dumps(review))
+
+    def save(self) -> None:
+        """Write the cache, replacing the file atomically."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(
+                {"version": parser_version(), "entries": self._entries}, f
+            )
+        os.replace(tmp_path, self.path)
+        logger.info(
+            f"Parsed {self.misses} reviews, reused {self.hits} unchanged "
+            f"reviews from {self.path}"
+        )
@@ -1,7 +1,8 @@
 import re
 import traceback
 from dataclasses import dataclass
-from typing import Any, List, Union
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Union
 
 from pydantic import ValidationError
 from tqdm import tqdm
@@ -13,7 +14,13 @@ from pyosmeta.models.github import Issue, Labels, LabelType
 
 from .github_api import GitHubAPI
 from .logging import logger
-from .utils_clean import clean_date_accepted_key
+from .parse_cache import ParseCache
+from .review_sources import (
+    DEFAULT_MAX_WORKERS,
+    IssueStore,
+    ReviewSource,
+    fetch_source_issues,
+)
 from .utils_parse import parse_user_names
 
 KEYED_STRING = re.compile(r"\s*(?P<key>\S*?)\s*:\s*(?P<value>.*)\s*")
@@ -27,6 +34,52 @@ Examples:
     {'key': 'Astropy', 'value': 'Link coming soon to standards'}
 """
 
+HEADER_BOLD_KEY = re.compile(r"^\*\*(.*?:)\*\*")
+"""Match a header key wrapped in markdown bold, e.g. ``**Package Name:**``"""
+
+HEADER_FIELD_SEP = re.compile(r"(?<!/):")
+"""Match the colon separating a header key from its value (not a url colon)"""
+
+HEADER_KEY_ALIASES: dict[str, str] = {
+    "joss_doi": "joss",
+}
+"""
+Canonical names for header keys that have changed across review templates.
+
+Some issues use ``JOSS DOI`` and others ``JOSS`` for the JOSS archive field.
+"""
+
+HEADER_KEY_PREFIX_ALIASES: tuple[tuple[str, str], ...] = (
+    ("date_accepted", "date_accepted"),
+)
+"""
+Canonical names for header keys that are matched on their prefix.
+
+Our templates have used ``Date accepted``, ``Date accepted (month/day/year)``
+and ``Date accepted (month-day-year)`` since 2019, so anything after the
+prefix is dropped.
+"""
+
+REVIEW_ROLE_FIELDS = ("submitting", "editor", "eic", "reviewer", "maintainers")
+"""Substrings that mark a header key as a review role (one or more users)"""
+
+
+@lru_cache(maxsize=256)
+def _canonical_key(key: str) -> str:
+    """
+    Put a raw header key into its canonical form.
+
+    Keys are lowercased, spaces are replaced with underscores and
+    template-specific variants are mapped through the alias tables.
+    Review templates only use a few dozen distinct keys, so the result
+    is cached rather than recomputed for every line of every issue.
+    """
+    key = key.lower().replace(" ", "_")
+    for prefix, alias in HEADER_KEY_PREFIX_ALIASES:
+        if key.startswith(prefix):
+            return alias
+    return HEADER_KEY_ALIASES.get(key, key)
+
 
 @dataclass
 class ProcessIssues:
@@ -35,7 +88,25 @@ class ProcessIssues:
     metadata about each package.
     """
 
-    def __init__(self, github_api: GitHubAPI):
+    # Parser method used for each known (canonical) header field. Keys that
+    # aren't listed here are resolved once by ``_resolve_field_parser`` and
+    # then cached, so each line of a header is a single dict lookup.
+    HEADER_FIELD_PARSERS = {
+        "submitting_author": "get_contributor_data",
+        "all_current_maintainers": "get_contributor_data",
+        "editor": "get_contributor_data",
+        "eic": "get_contributor_data",
+        "reviewers": "get_contributor_data",
+    }
+
+    def __init__(
+        self,
+        github_api: GitHubAPI,
+        sources: Optional[list[ReviewSource]] = None,
+        issue_store: Optional[IssueStore] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parse_cache: Optional[ParseCache] = None,
+    ):
         """
         Initialize a process issues instance.
 
@@ -43,9 +114,33 @@ class ProcessIssues:
         ----------
         github_api : str
             Instantiated instance of a GitHubAPI object
+        sources : list[ReviewSource], Optional
+            Repositories (or orgs) to read review issues from, in order of
+            precedence (see :mod:`pyosmeta.review_sources`). Defaults to
+            the ``github_api`` client's org and repo.
+        issue_store : IssueStore, Optional
+            Keeps the fetched issues so that later runs only fetch the
+            issues updated since.
+        max_workers : int
+            The number of source repositories fetched at the same time.
+        parse_cache : ParseCache, Optional
+            Keeps the parsed reviews so that issues whose body and labels
+            haven't changed aren't parsed again.
         """
 
         self.github_api = github_api
+        if sources is None and issue_store is not None:
+            sources = [ReviewSource(github_api.org, github_api.repo)]
+        self.sources = sources
+        self.issue_store = issue_store
+        self.max_workers = max_workers
+        self.parse_cache = parse_cache
+        # Precedence of each source repository, keyed by its API URL
+        self._source_ranks: dict[str, int] = {}
+        self._field_parsers: dict[str, Callable[[str], Any]] = {
+            key: getattr(self, method)
+            for key, method in self.HEADER_FIELD_PARSERS.items()
+        }
 
     def get_issues(self) -> list[Issue]:
         """
@@ -63,10 +158,21 @@ class ProcessIssues:
         We add a filter here to labels because the github api defaults to
         grabbing issues with ALL using an and operator labels in a list. We
         need to use an OR as a selector.
+
+        If the instance has ``sources``, the issues of all of their
+        repositories are returned.
         """
 
-        url = self.github_api.api_endpoint
-        issues = self.github_api._get_response_rest(url)
+        if self.sources is None:
+            url = self.github_api.api_endpoint
+            issues = self.github_api._get_response_rest(url)
+        else:
+            issues, self._source_ranks = fetch_source_issues(
+                self.github_api,
+                self.sources,
+                self.issue_store,
+                self.max_workers,
+            )
 
         # Filter issues according to label query value
         labels = self.github_api.labels
@@ -80,16 +186,10 @@ class ProcessIssues:
 
     def _is_review_role(self, string: str) -> bool:
         """
-        Returns true if starts with any of the 3 items below.
+        Returns true if the string contains any of the REVIEW_ROLE_FIELDS.
         """
-        return any(
-            [
-                substr in string.lower()
-                for substr in (
-                    ("submitting", "editor", "eic", "reviewer", "maintainers")
-                )
-            ]
-        )
+        string = string.lower()
+        return any(substr in string for substr in REVIEW_ROLE_FIELDS)
 
     def _remove_extra_chars(self, a_str: str) -> str:
         """Helper to strip unwanted characters from text"""
@@ -121,30 +221,21 @@ class ProcessIssues:
         colon, returning key-value pairs of unprocessed header fields.
 
         Since values are heterogeneous, don't do any processing here,
-        but keys can be preprocessed into a canonical form
+        but keys are put into a canonical form (see ``_canonical_key``)
         """
-        lines = header.split("\n")
         meta = {}
-        for line in lines:
+        for line in header.split("\n"):
             # remove asterisks around keys
-            line = line.strip()
-            line = re.sub(r"^\*\*(.*?:)\*\*", r"\1", line)
+            line = HEADER_BOLD_KEY.sub(r"\1", line.strip())
 
             # split on first occurrence of non-url colon
-            line_split = re.split(r"(?<!/):", line, 1)
+            line_split = HEADER_FIELD_SEP.split(line, 1)
             if len(line_split) == 1:
                 # not a field (eg blank, etc.)
                 continue
 
-            # keeping in expanded form rather than a dict comprehension for now
-            # in case any additional preprocessing needed.
-            # strip trailing/leading whitespace
-            line_split = [line.strip() for line in line_split]
             key, val = line_split
-            # put key in canonical form
-            key = key.lower().replace(" ", "_")
-
-            meta[key] = val
+            meta[_canonical_key(key.strip())] = val.strip()
         return meta
 
     def _combine_reviewers(self, meta: dict) -> dict:
@@ -196,7 +287,6 @@ class ProcessIssues:
         Putting all in one method for now, but individual steps should be split
         out for testing and maintainability if this gets too big ;)
         """
-        meta = clean_date_accepted_key(meta)
         meta["issue_link"] = str(meta.get("url", "")).replace(
             "https://api.github.com/repos/", "https://github.com/"
         )
@@ -209,10 +299,6 @@ class ProcessIssues:
         meta["partners"] = self.get_categories(
             body, "## Community Partnerships", 3, keyed=True, optional=True
         )
-        if "joss_doi" in meta:
-            # Normalize the JOSS archive field. Some issues use `JOSS DOI` others `JOSS`
-            meta["joss"] = meta.pop("joss_doi")
-
         return meta
 
     def _postprocess_labels(self, meta: dict) -> dict:
@@ -240,18 +326,31 @@ class ProcessIssues:
             meta["active"] = False
         return meta
 
+    def _clean_field_value(self, val: str) -> str:
+        """Default header field parser: remove markdown formatting"""
+        return val.strip("*").strip("__")
+
+    def _resolve_field_parser(self, key: str) -> Callable[[str], Any]:
+        """
+        Pick the parser for a header field that isn't in HEADER_FIELD_PARSERS.
+
+        Review roles that aren't listed explicitly (eg. older templates with
+        different role names) are still parsed as users.
+        """
+        if self._is_review_role(key):
+            return self.get_contributor_data
+        return self._clean_field_value
+
     def _parse_field(self, key: str, val: str) -> Any:
         """
         Method dispatcher for parsing specific header fields.
-        If none found, return value unchanged.
+        If none found, return value with markdown formatting removed.
         """
-        if self._is_review_role(key):
-            return self.get_contributor_data(val)
-        # elif False:
-        # add other conditions here for special processing of fields..
-        #   pass
-        else:
-            return val.strip("*").strip("__")  # remove markdown formatting
+        parser = self._field_parsers.get(key)
+        if parser is None:
+            parser = self._resolve_field_parser(key)
+            self._field_parsers[key] = parser
+        return parser(val)
 
     def parse_issue(self, issue: Issue | str) -> ReviewModel:
         """
@@ -261,6 +360,15 @@ class ProcessIssues:
             The issue to parse! if a string, assume we are getting the issue body,
             which prevents us from doing some postprocessing steps
         """
+        if isinstance(issue, Issue) and self.parse_cache is not None:
+            review = self.parse_cache.get(issue)
+            if review is None:
+                review = self._parse_issue(issue)
+                self.parse_cache.put(issue, review)
+            return review
+        return self._parse_issue(issue)
+
+    def _parse_issue(self, issue: Issue | str) -> ReviewModel:
         if isinstance(issue, Issue):
             issue_body = issue.body
         else:
@@ -321,13 +429,30 @@ class ProcessIssues:
         """
 
         reviews = {}
+        precedence = {}
         errors = {}
         for issue in tqdm(issues, desc="Processing reviews"):
             tqdm.write(f"Processing review {issue.title}")
             with logging_redirect_tqdm():
                 try:
                     review = self.parse_issue(issue)
-                    reviews[review.package_name] = review
+                    name = review.package_name
+                    if name in reviews and (
+                        precedence[name] < self._precedence(issue)
+                    ):
+                        logger.warning(
+                            f"{name} is also reviewed in {issue.url}. "
+                            f"Keeping the review in {reviews[name].issue_link}."
+                        )
+                        continue
+                    if name in reviews:
+                        logger.warning(
+                            f"{name} is also reviewed in "
+                            f"{reviews[name].issue_link}. Keeping the review "
+                            f"in {issue.url}."
+                        )
+                    reviews[name] = review
+                    precedence[name] = self._precedence(issue)
                 except ValidationError as e:
                     logger.error(
                         f"Error processing review {issue.title}. Skipping this review.",
@@ -339,6 +464,16 @@ class ProcessIssues:
 
         return reviews, errors
 
+    def _precedence(self, issue: Issue) -> tuple[int, float]:
+        """Sort key of the issues reviewing the same package: the issue
+        that sorts first is kept.
+
+        Issues from sources listed first come first, then the most
+        recently updated issues.
+        """
+        rank = self._source_ranks.get(str(issue.repository_url).lower(), 0)
+        return rank, -issue.updated_at.timestamp()
+
     def get_contributor_data(
         self, line: str
     ) -> Union[ReviewUser, List[ReviewUser], None]:
@@ -357,7 +492,8 @@ class ProcessIssues:
             maintainer(s).
         """
         users = line.split(",")
-        models = [parse_user_names(username=user) for user in users]
+        # strip so that eg. "@user" and " @user" share one memoized parse
+        models = [parse_user_names(user.strip()) for user in users]
         models = [model for model in models if model is not None]
         if len(models) == 0:
             return None
@@ -389,6 +525,7 @@ class ProcessIssues:
         for a_package in review_issues.keys():
             repo_url = review_issues[a_package].repository_link
             host = RepositoryHost(review_issues[a_package].repository_host)
+            # Cached from when the review's repository_host was validated
             owner, repo = host.parse_url(repo_url)
             all_repos[a_package] = {"owner": owner, "repo_name": repo}
         return all_repos
@@ -2,12 +2,19 @@ from pathlib import Path
 
 import feedparser
 
+from .instrumentation import http_get, instrumented
 from .utils_clean import slugify
 
 
+@instrumented("parse_rss_feed")
 def parse_rss_feed(url: str) -> list[dict]:
     """Fetch and parse an RSS feed from a URL."""
-    parsed_feed = feedparser.parse(url)
+    if url.startswith(("http://", "https://")):
+        # Like feedparser, an error page parses as a feed without entries
+        response = http_get(url, timeout=30)
+        parsed_feed = feedparser.parse(response.content)
+    else:
+        parsed_feed = feedparser.parse(url)
     # Return in reverse order to ensure oldest first
     return [
         {key: entry.get(key) for key in entry.keys()}
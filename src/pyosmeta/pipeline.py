@@ -0,0 +1,159 @@
+"""
+Run the update stages in one process, as a DAG.
+
+The ``update-reviews``, ``update-contributors`` and ``update-review-teams``
+scripts hand their results to each other through pickles. The
+``pyosmeta run`` command (see :mod:`pyosmeta.cli.run`) instead runs them as
+:class:`PipelineStage` objects with :func:`run_pipeline`. Each stage is
+given the results of the stages it depends on. Stages that don't depend on
+each other (e.g. fetching reviews and contributors) run at the same time.
+"""
+
+import contextvars
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from .logging import logger
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """A step of the pipeline.
+
+    Parameters
+    ----------
+    name : str
+        The stage's name, used to select it and to refer to it in
+        ``depends_on``.
+    run : callable
+        Called with a dict of the results of the stages in ``depends_on``
+        that were run, keyed by stage name. Its return value is the
+        stage's result.
+    depends_on : tuple[str]
+        The stages that must finish before this one starts.
+    """
+
+    name: str
+    run: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+class PipelineError(RuntimeError):
+    """One or more pipeline stages failed."""
+
+
+def _check_stages(stages: list[PipelineStage]) -> None:
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate pipeline stage names: {names}")
+
+    # Depth-first search for cycles
+    by_name = {stage.name: stage for stage in stages}
+    done: set[str] = set()
+
+    def visit(name: str, path: tuple[str, ...]) -> None:
+        if name in path:
+            raise ValueError(f"Pipeline stages form a cycle: {path + (name,)}")
+        if name in done:
+            return
+        for dependency in by_name[name].depends_on:
+            if dependency not in by_name:
+                raise ValueError(
+                    f"Stage {name} depends on unknown stage {dependency}"
+                )
+            visit(dependency, path + (name,))
+        done.add(name)
+
+    for name in names:
+        visit(name, ())
+
+
+def run_pipeline(
+    stages: Iterable[PipelineStage],
+    selected: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """Run pipeline stages, each once its dependencies have finished.
+
+    Parameters
+    ----------
+    stages : iterable of PipelineStage
+        All the stages of the pipeline.
+    selected : iterable of str, Optional
+        The names of the stages to run. Defaults to all of them. A selected
+        stage whose dependencies aren't selected is run without their
+        results.
+    max_workers : int, Optional
+        The number of stages that can run at the same time. Defaults to
+        the number of stages.
+
+    Returns
+    -------
+    dict
+        The result of each stage that was run, keyed by name.
+
+    Raises
+    ------
+    PipelineError
+        If a stage raised an error. Stages that depend on it aren't run,
+        but independent stages finish first.
+    """
+    stages = list(stages)
+    _check_stages(stages)
+    names = {stage.name for stage in stages}
+    if selected is None:
+        selected = names
+    selected = set(selected)
+    if unknown := selected - names:
+        raise ValueError(f"Unknown pipeline stages: {sorted(unknown)}")
+
+    # Only wait for selected dependencies
+    pending = {stage.name: stage for stage in stages if stage.name in selected}
+    results: dict[str, Any] = {}
+    failed: dict[str, BaseException] = {}
+    running: dict[Future, str] = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(pending) or 1,
+        thread_name_prefix="pyosmeta-pipeline",
+    ) as executor:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                dependencies = [d for d in stage.depends_on if d in selected]
+                if any(d in failed for d in dependencies):
+                    logger.error(f"Skipping stage {name}: a dependency failed")
+                    failed[name] = PipelineError(f"{name} was skipped")
+                    del pending[name]
+                elif all(d in results for d in dependencies):
+                    logger.info(f"Starting stage {name}")
+                    inputs = {d: results[d] for d in dependencies}
+                    # Worker threads don't inherit context variables (e.g.
+                    # the recorder's current stage), so pass them on
+                    context = contextvars.copy_context()
+                    future = executor.submit(context.run, stage.run, inputs)
+                    running[future] = name
+                    del pending[name]
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                    logger.info(f"Finished stage {name}")
+                except Exception as err:
+                    logger.error(f"Stage {name} failed", exc_info=True)
+                    failed[name] = err
+
+    if failed:
+        raise PipelineError(
+            f"Pipeline stages failed: {', '.join(sorted(failed))}"
+        ) from next(iter(failed.values()))
+    return results
@@ -0,0 +1,206 @@
+"""
+Profile a CLI run, one profile per stage.
+
+Every console script accepts ``--profile DIR``. The run is profiled with
+``cProfile`` and sampled in the background, and the following is written
+to ``DIR``:
+
+* ``<stage>.pstats`` - a cProfile profile of each run stage (see
+  :meth:`pyosmeta.instrumentation.RunRecorder.stage`); code that runs
+  outside a stage is in ``main.pstats``. Open them with ``pstats`` or
+  ``snakeviz``.
+* ``profile.folded`` - sampled stacks of every thread in the collapsed
+  format read by ``flamegraph.pl`` and speedscope. Each stack starts with
+  the stage and whether the thread was waiting on the network, idle
+  (waiting on a lock or queue) or running on the CPU.
+* ``profile_summary.json`` - for each stage, the sampled network, idle and
+  CPU time, alongside the stage's measured wall, CPU and network time.
+"""
+
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from types import FrameType
+from typing import ContextManager, Iterator, Optional
+
+from .instrumentation import recorder
+from .logging import logger
+
+DEFAULT_INTERVAL = 0.005
+"""Seconds between stack samples"""
+
+# A sample is counted as network wait if its innermost Python frame is in
+# one of these modules (the blocking socket call itself is in C).
+NETWORK_MODULES = ("socket.py", "ssl.py", "selectors.py")
+NETWORK_FUNCTIONS = {"create_connection", "getaddrinfo"}
+# Samples of threads blocked on a lock or queue (e.g. waiting for worker
+# threads) are counted as idle.
+IDLE_MODULES = ("threading.py", "queue.py")
+
+MAIN_STAGE = "main"
+
+
+def _classify(frame: FrameType) -> str:
+    """Return whether a sampled thread was on the network, idle or CPU."""
+    code = frame.f_code
+    module = os.path.basename(code.co_filename)
+    if module in NETWORK_MODULES or code.co_name in NETWORK_FUNCTIONS:
+        return "network"
+    if module in IDLE_MODULES:
+        return "idle"
+    return "cpu"
+
+
+def _folded_stack(frame: FrameType) -> list[str]:
+    """Return a thread's stack, outermost frame first."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(
+            f"{code.co_name} ({os.path.basename(code.co_filename)}"
+            f":{code.co_firstlineno})"
+        )
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+class RunProfiler:
+    """Profile a run per stage and sample stacks for a flamegraph.
+
+    Parameters
+    ----------
+    output_dir : str or Path
+        Directory to write the profiles to. It's created if needed.
+    interval : float
+        Seconds between stack samples.
+    """
+
+    def __init__(
+        self, output_dir: str | Path, interval: float = DEFAULT_INTERVAL
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._active: Optional[cProfile.Profile] = None
+        self._stage = MAIN_STAGE
+        self._samples: Counter[str] = Counter()
+        self._waits: Counter[tuple[str, str]] = Counter()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample, name="pyosmeta-profiler", daemon=True
+        )
+
+    def _switch(self, stage: Optional[str]) -> None:
+        """Profile the code that follows into ``stage``'s profile."""
+        if self._active is not None:
+            self._active.disable()
+        self._stage = stage or MAIN_STAGE
+        self._active = self._profiles.setdefault(
+            self._stage, cProfile.Profile()
+        )
+        self._active.enable()
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            stage = self._stage
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                kind = _classify(frame)
+                self._waits[(stage, kind)] += 1
+                stack = [stage, kind, *_folded_stack(frame)]
+                self._samples[";".join(stack)] += 1
+
+    def start(self) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        recorder.add_stage_listener(self._switch)
+        self._sampler.start()
+        self._switch(None)
+
+    def stop(self) -> None:
+        if self._active is not None:
+            self._active.disable()
+            self._active = None
+        recorder.remove_stage_listener(self._switch)
+        self._stop.set()
+        self._sampler.join()
+        self.write()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return each stage's sampled network wait, idle and CPU time.
+
+        Sampled times are per thread, so with worker threads they can add
+        up to more than the wall time.
+        """
+        stages = recorder.report()["stages"]
+        summary = {}
+        for stage in dict.fromkeys(stage for stage, _ in sorted(self._waits)):
+            summary[stage] = {
+                "sampled_network_wait_seconds": round(
+                    self._waits[(stage, "network")] * self.interval, 6
+                ),
+                "sampled_idle_seconds": round(
+                    self._waits[(stage, "idle")] * self.interval, 6
+                ),
+                "sampled_cpu_seconds": round(
+                    self._waits[(stage, "cpu")] * self.interval, 6
+                ),
+            }
+            if stage in stages:
+                summary[stage] |= {
+                    key: stages[stage][key]
+                    for key in (
+                        "wall_seconds",
+                        "cpu_seconds",
+                        "network_seconds",
+                        "sleep_seconds",
+                    )
+                }
+        return summary
+
+    def write(self) -> None:
+        """Write the pstats, folded stacks and summary files."""
+        for stage, profile in self._profiles.items():
+            profile.dump_stats(self.output_dir / f"{stage}.pstats")
+        with open(self.output_dir / "profile.folded", "w") as f:
+            for stack, count in sorted(self._samples.items()):
+                f.write(f"{stack} {count}\n")
+        with open(self.output_dir / "profile_summary.json", "w") as f:
+            json.dump(self.summary(), f, indent=2)
+            f.write("\n")
+        logger.info(f"Wrote profiles to {self.output_dir}")
+
+
+@contextmanager
+def _profile(output_dir: str | Path) -> Iterator[RunProfiler]:
+    profiler = RunProfiler(output_dir)
+    start = time.perf_counter()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        logger.info(
+            f"Profiled run took {time.perf_counter() - start:.1f} seconds"
+        )
+
+
+def profile_run(output_dir: Optional[str | Path]) -> ContextManager:
+    """Profile the code run in this context into ``output_dir``.
+
+    Parameters
+    ----------
+    output_dir : str or Path, Optional
+        Where to write the profiles. If None, nothing is profiled.
+    """
+    if output_dir is None:
+        return nullcontext()
+    return _profile(output_dir)
@@ -0,0 +1,51 @@
+"""
+Space out and limit the requests made to one host.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from .instrumentation import recorder
+
+
+class HostRateLimiter:
+    """Limit the requests made to one host.
+
+    Parameters
+    ----------
+    max_concurrency : int
+        The maximum number of requests in flight at once.
+    min_interval : float
+        The minimum number of seconds between the start of two requests.
+    """
+
+    def __init__(self, max_concurrency: int = 4, min_interval: float = 0.0):
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        # time.monotonic() before which no request may start
+        self._next_start = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait for a turn to make a request, and hold it in the context."""
+        with self._semaphore:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start)
+                self._next_start += self.min_interval
+            if wait > 0:
+                recorder.record_sleep(wait)
+                time.sleep(wait)
+            yield
+
+    def back_off(self, seconds: float) -> None:
+        """Don't start another request for ``seconds``."""
+        with self._lock:
+            self._next_start = max(
+                self._next_start, time.monotonic() + seconds
+            )
@@ -0,0 +1,279 @@
+"""
+An indexed collection of pyOpenSci contributors.
+
+:class:`ContributorRegistry` holds the ``PersonModel`` for each contributor,
+keyed by lowercased GitHub username, along with reverse indexes that answer
+questions like "who reviewed this package?" or "who joined this month?"
+without scanning every contributor.
+
+The indexes are only kept up to date for changes made through the registry
+(:meth:`ContributorRegistry.upsert`,
+:meth:`ContributorRegistry.add_contribution` and
+:meth:`ContributorRegistry.upsert_review_teams`), so update contributors
+through it rather than modifying the ``PersonModel`` objects directly.
+"""
+
+import bisect
+from collections import defaultdict
+from typing import Callable, Iterable, Iterator, Optional
+
+from tqdm import tqdm
+
+from .logging import logger
+from .models import PersonModel, ReviewModel, ReviewUser
+from .utils_clean import get_clean_user
+
+# The PersonModel fields that list the packages a person supported, and the
+# review role each one represents.
+PACKAGE_ROLE_FIELDS = {
+    "packages_eic": "eic",
+    "packages_editor": "editor",
+    "packages_reviewed": "reviewer",
+    "packages_submitted": "maintainer",
+}
+
+
+class ContributorRegistry:
+    """Contributors keyed by GitHub username, with reverse indexes.
+
+    Parameters
+    ----------
+    people : dict or iterable of PersonModel
+        The initial contributors. A dict (e.g. the ``all_contribs.pickle``
+        data) must be keyed by GitHub username.
+    """
+
+    def __init__(
+        self, people: dict[str, PersonModel] | Iterable[PersonModel] = ()
+    ) -> None:
+        self._people: dict[str, PersonModel] = {}
+        # package -> role -> usernames
+        self._by_package: dict[str, dict[str, set[str]]] = defaultdict(
+            lambda: defaultdict(set)
+        )
+        # contributor_type -> usernames
+        self._by_type: dict[str, set[str]] = defaultdict(set)
+        # (date_added, username), sorted
+        self._by_date_added: list[tuple[str, str]] = []
+
+        if isinstance(people, dict):
+            for gh_user, person in people.items():
+                self.upsert(person, gh_user)
+        else:
+            for person in people:
+                self.upsert(person)
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def __contains__(self, gh_user: str) -> bool:
+        return gh_user.lower() in self._people
+
+    def __getitem__(self, gh_user: str) -> PersonModel:
+        return self._people[gh_user.lower()]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._people)
+
+    def get(self, gh_user: str) -> Optional[PersonModel]:
+        """Return a contributor by GitHub username, if registered."""
+        return self._people.get(gh_user.lower())
+
+    def to_dict(self) -> dict[str, PersonModel]:
+        """Return the contributors keyed by lowercased GitHub username."""
+        return dict(self._people)
+
+    def _index(self, gh_user: str, person: PersonModel) -> None:
+        for field, role in PACKAGE_ROLE_FIELDS.items():
+            for package in getattr(person, field):
+                self._by_package[package][role].add(gh_user)
+        for contrib_type in person.contributor_type:
+            self._by_type[contrib_type].add(gh_user)
+        if person.date_added:
+            bisect.insort(self._by_date_added, (person.date_added, gh_user))
+
+    def _unindex(self, gh_user: str, person: PersonModel) -> None:
+        for field, role in PACKAGE_ROLE_FIELDS.items():
+            for package in getattr(person, field):
+                self._by_package[package][role].discard(gh_user)
+        for contrib_type in person.contributor_type:
+            self._by_type[contrib_type].discard(gh_user)
+        if person.date_added:
+            self._by_date_added.remove((person.date_added, gh_user))
+
+    def upsert(
+        self, person: PersonModel, gh_user: Optional[str] = None
+    ) -> None:
+        """Add a contributor, or replace the existing entry for them.
+
+        Parameters
+        ----------
+        person : PersonModel
+            The contributor.
+        gh_user : str, Optional
+            The username to register them under. Defaults to their
+            ``github_username``.
+        """
+        gh_user = (gh_user or person.github_username).lower()
+        existing = self._people.get(gh_user)
+        if existing is not None:
+            self._unindex(gh_user, existing)
+        self._people[gh_user] = person
+        self._index(gh_user, person)
+
+    def add_contribution(
+        self,
+        gh_user: str,
+        package: str,
+        package_field: str,
+        contributor_types: list[str],
+    ) -> None:
+        """Record that a registered contributor supported a package.
+
+        Parameters
+        ----------
+        gh_user : str
+            The contributor's GitHub username.
+        package : str
+            The package name (stored lowercased).
+        package_field : str
+            The ``PersonModel`` field listing packages for this role,
+            e.g. ``packages_reviewed``.
+        contributor_types : list[str]
+            Contributor types to add for this role, e.g.
+            ``["reviewer", "peer-review"]``.
+        """
+        gh_user = gh_user.lower()
+        package = package.lower()
+        person = self._people[gh_user]
+        person.add_unique_value(package_field, package)
+        person.add_unique_value("contributor_type", contributor_types)
+
+        self._by_package[package][PACKAGE_ROLE_FIELDS[package_field]].add(
+            gh_user
+        )
+        for contrib_type in contributor_types:
+            self._by_type[contrib_type].add(gh_user)
+
+    def people_for_package(
+        self, package: str, role: Optional[str] = None
+    ) -> list[PersonModel]:
+        """Return the people who supported a package.
+
+        Parameters
+        ----------
+        package : str
+            The package name.
+        role : str, Optional
+            Only return people with this role: ``eic``, ``editor``,
+            ``reviewer`` or ``maintainer``. Defaults to any role.
+        """
+        roles = self._by_package.get(package.lower(), {})
+        if role is not None:
+            usernames = roles.get(role, set())
+        else:
+            usernames = set().union(*roles.values())
+        return [self._people[gh_user] for gh_user in sorted(usernames)]
+
+    def roles_for_package(self, package: str) -> dict[str, list[str]]:
+        """Return the usernames of a package's review team by role."""
+        roles = self._by_package.get(package.lower(), {})
+        return {
+            role: sorted(usernames)
+            for role, usernames in roles.items()
+            if usernames
+        }
+
+    def people_by_type(self, contributor_type: str) -> list[PersonModel]:
+        """Return everyone with the given contributor type."""
+        usernames = self._by_type.get(contributor_type, set())
+        return [self._people[gh_user] for gh_user in sorted(usernames)]
+
+    def added_since(self, date_added: str) -> list[PersonModel]:
+        """Return contributors added on or after a date, oldest first.
+
+        Parameters
+        ----------
+        date_added : str
+            A ``YYYY-MM-DD`` date.
+        """
+        start = bisect.bisect_left(self._by_date_added, (date_added, ""))
+        return [
+            self._people[gh_user] for _, gh_user in self._by_date_added[start:]
+        ]
+
+    def upsert_review_teams(
+        self,
+        reviews: dict[str, ReviewModel],
+        contrib_types: dict[str, list],
+        new_person: Callable[[str], Optional[PersonModel]],
+    ) -> dict[str, ReviewModel]:
+        """Add every review team member's contributions in one pass.
+
+        Missing contributors are created with ``new_person``, and review
+        users without a name get the name from their contributor entry.
+
+        Parameters
+        ----------
+        reviews : dict[str, ReviewModel]
+            Accepted reviews keyed by package name.
+        contrib_types : dict[str, list]
+            Maps each ``ReviewModel`` role field to the ``PersonModel``
+            package field and contributor types for that role (see
+            ``ProcessContributors.contrib_types``).
+        new_person : callable
+            Returns a ``PersonModel`` for a GitHub username that isn't
+            registered yet, or None if it can't be created.
+
+        Returns
+        -------
+        dict[str, ReviewModel]
+            The reviews, with review user names filled in.
+        """
+        for pkg_name, review in tqdm(
+            reviews.items(), desc="Processing review teams"
+        ):
+            tqdm.write(f"Processing review team for: {pkg_name}")
+            for role, (package_field, role_types) in contrib_types.items():
+                users = getattr(review, role)
+                if not users:
+                    logger.warning(
+                        f"I can't find a username for {role} under "
+                        f"{pkg_name}. Moving on."
+                    )
+                    continue
+                if isinstance(users, ReviewUser):
+                    users = [users]
+                elif not isinstance(users, list):
+                    raise TypeError(
+                        "Keys in the `contrib_types` map must be a "
+                        "`ReviewUser` or `list[ReviewUser]` in the "
+                        "`ReviewModel`"
+                    )
+
+                updated = []
+                for user in users:
+                    gh_user = get_clean_user(user.github_username)
+                    if gh_user not in self._people:
+                        logger.info(f"Found a new contributor: {gh_user}")
+                        person = new_person(gh_user)
+                        if person is None:
+                            updated.append(user)
+                            continue
+                        self.upsert(person, gh_user)
+                    self.add_contribution(
+                        gh_user, pkg_name, package_field, role_types
+                    )
+                    # ReviewUsers are shared between reviews, so update a copy
+                    if not user.name:
+                        user = user.model_copy(
+                            update={"name": self._people[gh_user].name}
+                        )
+                    updated.append(user)
+
+                if isinstance(getattr(review, role), list):
+                    getattr(review, role)[:] = updated
+                else:
+                    setattr(review, role, updated[0])
+
+        return reviews
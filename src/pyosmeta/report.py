@@ -0,0 +1,287 @@
+"""
+Ecosystem-wide statistics for the packages in ``packages.yml``.
+
+The GitHub metrics (``gh_meta``) and review fields of every package are
+loaded into columnar NumPy arrays (one array per field, one row per
+package), and the aggregates are computed with vectorized operations rather
+than by looping over ``ReviewModel`` objects.
+
+NumPy is an optional dependency, installed with ``pip install
+pyosmeta[report]``.
+"""
+
+import csv
+import io
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError as err:  # pragma: no cover
+    raise ImportError(
+        "The metrics report needs numpy. Install it with "
+        "`pip install pyosmeta[report]`."
+    ) from err
+
+from ruamel.yaml import YAML
+
+# gh_meta count fields summarized in the report
+COUNT_FIELDS = (
+    "stargazers_count",
+    "forks_count",
+    "watchers_count",
+    "open_issues_count",
+    "contrib_count",
+)
+
+DEFAULT_STALE_DAYS = 365
+"""Packages without a commit in this many days are reported as stale"""
+
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+PERCENTILES = (25, 50, 75, 90)
+
+
+def _as_date(value: Any) -> str:
+    """Return a YYYY-MM-DD string NumPy can parse, or NaT."""
+    if isinstance(value, date):
+        return value.isoformat()[:10]
+    if isinstance(value, str) and ISO_DATE.match(value):
+        return value[:10]
+    return "NaT"
+
+
+def _as_count(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+
+@dataclass
+class PackageTable:
+    """Columnar package data: one array per field, one row per package.
+
+    Count columns are floats so that missing metrics can be NaN, and date
+    columns are ``datetime64[D]`` with NaT for missing dates. Categories
+    and partners are stored as (package row, label) pairs.
+    """
+
+    names: np.ndarray
+    active: np.ndarray
+    counts: dict[str, np.ndarray]
+    last_commit: np.ndarray
+    created_at: np.ndarray
+    category_rows: np.ndarray
+    category_labels: np.ndarray
+    partner_rows: np.ndarray
+    partner_labels: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_packages(cls, packages: list[dict[str, Any]]) -> "PackageTable":
+        """Build the table from the deserialized packages.yml list.
+
+        Parameters
+        ----------
+        packages : list[dict]
+            The packages, as loaded from packages.yml.
+        """
+        names, active, last_commit, created_at = [], [], [], []
+        counts: dict[str, list[float]] = {field: [] for field in COUNT_FIELDS}
+        category_rows, category_labels = [], []
+        partner_rows, partner_labels = [], []
+
+        for row, package in enumerate(packages):
+            gh_meta = package.get("gh_meta") or {}
+            names.append(package["package_name"])
+            active.append(package.get("active", True) is not False)
+            for field in COUNT_FIELDS:
+                counts[field].append(_as_count(gh_meta.get(field)))
+            last_commit.append(_as_date(gh_meta.get("last_commit")))
+            created_at.append(_as_date(gh_meta.get("created_at")))
+            for category in package.get("categories") or []:
+                category_rows.append(row)
+                category_labels.append(category)
+            for partner in package.get("partners") or []:
+                partner_rows.append(row)
+                partner_labels.append(partner)
+
+        return cls(
+            names=np.array(names, dtype=str),
+            active=np.array(active, dtype=bool),
+            counts={
+                field: np.array(values, dtype=float)
+                for field, values in counts.items()
+            },
+            last_commit=np.array(last_commit, dtype="datetime64[D]"),
+            created_at=np.array(created_at, dtype="datetime64[D]"),
+            category_rows=np.array(category_rows, dtype=int),
+            category_labels=np.array(category_labels, dtype=str),
+            partner_rows=np.array(partner_rows, dtype=int),
+            partner_labels=np.array(partner_labels, dtype=str),
+        )
+
+
+def load_packages_table(path: str | Path) -> PackageTable:
+    """Load a packages.yml file into a :class:`PackageTable`."""
+    yaml = YAML(typ="safe")
+    with open(path, "r") as f:
+        return PackageTable.from_packages(yaml.load(f) or [])
+
+
+def describe(values: np.ndarray) -> dict[str, Optional[float]]:
+    """Summarize the distribution of a column, ignoring missing values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        A float column; NaN marks a missing value.
+
+    Returns
+    -------
+    dict
+        The count of known values, and their total, mean, min, max and
+        percentiles (None if there are no known values).
+    """
+    known = values[~np.isnan(values)]
+    summary: dict[str, Optional[float]] = {"count": int(known.size)}
+    if not known.size:
+        keys = ["total", "mean", "min", "max"]
+        keys += [f"p{p}" for p in PERCENTILES]
+        return summary | dict.fromkeys(keys)
+
+    summary |= {
+        "total": float(known.sum()),
+        "mean": float(known.mean()),
+        "min": float(known.min()),
+        "max": float(known.max()),
+    }
+    for p, value in zip(PERCENTILES, np.percentile(known, PERCENTILES)):
+        summary[f"p{p}"] = float(value)
+    return summary
+
+
+def group_totals(
+    table: PackageTable, rows: np.ndarray, labels: np.ndarray
+) -> dict[str, dict[str, float]]:
+    """Total the package counts for each label (category or partner).
+
+    Parameters
+    ----------
+    table : PackageTable
+        The package data.
+    rows, labels : np.ndarray
+        (package row, label) pairs, e.g. ``table.category_rows`` and
+        ``table.category_labels``.
+
+    Returns
+    -------
+    dict
+        For each label: the number of packages, and the total stars and
+        contributors across them.
+    """
+    if not labels.size:
+        return {}
+    groups, inverse = np.unique(labels, return_inverse=True)
+    n_packages = np.bincount(inverse, minlength=groups.size)
+    stars = np.nan_to_num(table.counts["stargazers_count"][rows])
+    contribs = np.nan_to_num(table.counts["contrib_count"][rows])
+    total_stars = np.bincount(inverse, weights=stars, minlength=groups.size)
+    total_contribs = np.bincount(
+        inverse, weights=contribs, minlength=groups.size
+    )
+    return {
+        str(group): {
+            "packages": int(n_packages[i]),
+            "stargazers_count": float(total_stars[i]),
+            "contrib_count": float(total_contribs[i]),
+        }
+        for i, group in enumerate(groups)
+    }
+
+
+def build_report(
+    table: PackageTable,
+    as_of: Optional[date] = None,
+    stale_days: int = DEFAULT_STALE_DAYS,
+) -> dict[str, Any]:
+    """Compute ecosystem-wide statistics for the packages.
+
+    Parameters
+    ----------
+    table : PackageTable
+        The package data.
+    as_of : date, Optional
+        The date to measure time since the last commit from. Defaults to
+        today.
+    stale_days : int
+        Packages with no commit in this many days are listed as stale.
+
+    Returns
+    -------
+    dict
+        The report: package counts, the distribution of each gh_meta count
+        and of days since the last commit, totals by category and partner,
+        and the stale packages (stalest first).
+    """
+    as_of = np.datetime64(as_of or date.today(), "D")
+    days_since_commit = (as_of - table.last_commit).astype(float)
+    days_since_commit[np.isnat(table.last_commit)] = np.nan
+
+    # NaN comparisons are False, so packages without a date aren't stale
+    with np.errstate(invalid="ignore"):
+        stale = np.flatnonzero(days_since_commit > stale_days)
+    stale = stale[np.argsort(-days_since_commit[stale], kind="stable")]
+
+    return {
+        "as_of": str(as_of),
+        "packages": {
+            "total": len(table),
+            "active": int(table.active.sum()),
+            "archived": int((~table.active).sum()),
+            "with_gh_meta": int((~np.isnat(table.last_commit)).sum()),
+        },
+        "distributions": {
+            field: describe(values) for field, values in table.counts.items()
+        }
+        | {"days_since_last_commit": describe(days_since_commit)},
+        "by_category": group_totals(
+            table, table.category_rows, table.category_labels
+        ),
+        "by_partner": group_totals(
+            table, table.partner_rows, table.partner_labels
+        ),
+        "stale_packages": [
+            {
+                "package_name": str(table.names[i]),
+                "days_since_last_commit": int(days_since_commit[i]),
+                "active": bool(table.active[i]),
+            }
+            for i in stale
+        ],
+    }
+
+
+def report_to_csv(report: dict[str, Any]) -> str:
+    """Flatten a report into CSV rows of ``section,name,metric,value``."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["section", "name", "metric", "value"])
+    for metric, value in report["packages"].items():
+        writer.writerow(["packages", "", metric, value])
+    for section in ("distributions", "by_category", "by_partner"):
+        for name, metrics in report[section].items():
+            for metric, value in metrics.items():
+                writer.writerow([section, name, metric, value])
+    for package in report["stale_packages"]:
+        writer.writerow(
+            [
+                "stale_packages",
+                package["package_name"],
+                "days_since_last_commit",
+                package["days_since_last_commit"],
+            ]
+        )
+    return out.getvalue()
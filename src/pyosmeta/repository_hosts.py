@@ -0,0 +1,503 @@
+"""
+Fetch repository metrics from GitHub, GitLab, Codeberg and Bitbucket.
+
+Each supported :class:`pyosmeta.models.base.RepositoryHost` has a
+:class:`RepositoryBackend` in :data:`BACKENDS`. A backend fetches a
+repository's metadata from its host's API and returns it with the fields of
+:class:`pyosmeta.models.base.GhMeta`, so that packages on every host are
+exported the same way. Hosts don't all have the same data:
+
+* GitLab has no watchers; like the GitHub REST API, ``watchers_count`` is
+  the number of stars. It has no homepage either, so ``documentation`` is
+  None.
+* Codeberg (Forgejo) doesn't count contributors, so ``contrib_count`` is
+  None, and ``last_commit`` is when the repository was last updated.
+* Bitbucket has no stars; ``stargazers_count`` is the number of watchers.
+  ``contrib_count`` is None.
+
+:func:`fetch_repo_metas` fetches many repositories at once. Every backend
+has its own :class:`HostRateLimiter`, so a slow or rate-limited host
+doesn't hold back the others. A backend's API URL can be changed (e.g. for
+a self-hosted instance, or a local fake server in tests)::
+
+    backend = GitLabBackend(api_url="http://localhost:8000/api/v4")
+"""
+
+import contextvars
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Any, ClassVar, Optional
+from urllib.parse import quote
+
+import requests
+from dotenv import load_dotenv
+
+from .instrumentation import http_get, instrumented
+from .logging import logger
+from .models.base import RepositoryHost
+from .rate_limit import HostRateLimiter
+
+if TYPE_CHECKING:
+    from .github_api import GitHubAPI
+
+MAX_RETRIES = 3
+"""Times a request rate limited with a 429 is retried"""
+
+DEFAULT_RETRY_AFTER = 60.0
+"""Seconds to wait after a 429 without a ``Retry-After`` header"""
+
+
+class RepositoryBackend(ABC):
+    """Fetch repository metrics from one host's API.
+
+    Parameters
+    ----------
+    api_url : str, Optional
+        The root URL of the host's API. Defaults to the class's
+        ``api_url``.
+    token : str, Optional
+        An API token. Defaults to the ``token_env`` environment variable,
+        if it's set; requests are anonymous otherwise.
+    max_concurrency : int, Optional
+        The maximum number of requests to the host in flight at once.
+    min_interval : float, Optional
+        The minimum number of seconds between two requests to the host.
+    """
+
+    host: ClassVar[RepositoryHost]
+    api_url: str = ""
+    token_env: ClassVar[Optional[str]] = None
+    max_concurrency: int = 4
+    min_interval: float = 0.0
+    timeout: float = 30
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        token: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        min_interval: Optional[float] = None,
+    ):
+        if api_url is not None:
+            self.api_url = api_url
+        self.api_url = self.api_url.rstrip("/")
+        if token is None and self.token_env is not None:
+            load_dotenv()
+            token = os.environ.get(self.token_env) or None
+        self.token = token
+        self.rate_limiter = HostRateLimiter(
+            max_concurrency or self.max_concurrency,
+            self.min_interval if min_interval is None else min_interval,
+        )
+
+    def _auth_headers(self) -> dict[str, str]:
+        """Return the headers that authenticate a request with the token."""
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def _get(
+        self, path: str, params: Optional[dict[str, Any]] = None
+    ) -> requests.Response:
+        """Make a GET request to the host's API.
+
+        Parameters
+        ----------
+        path : str
+            A path relative to ``api_url``, or a full URL (e.g. the next
+            page of a paginated response).
+        params : dict, Optional
+            The query parameters.
+
+        Requests wait for the host's rate limiter. A request rate limited
+        with a 429 is retried after its ``Retry-After``, up to
+        ``MAX_RETRIES`` times.
+        """
+        url = path if "://" in path else f"{self.api_url}{path}"
+        headers = self._auth_headers() if self.token else {}
+        for attempt in range(MAX_RETRIES + 1):
+            with self.rate_limiter.slot():
+                response = http_get(
+                    url,
+                    retry=attempt > 0,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                return response
+            try:
+                retry_after = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                retry_after = DEFAULT_RETRY_AFTER
+            logger.warning(
+                f"Rate limited by {self.host.value}. Retrying {url} in "
+                f"{retry_after:.0f}s."
+            )
+            self.rate_limiter.back_off(retry_after)
+        return response
+
+    def _get_json(
+        self,
+        path: str,
+        repo_info: dict[str, str],
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Return a response's JSON, or log why there's none and return
+        None."""
+        response = self._get(path, params)
+        if response.status_code == 200:
+            return response.json()
+
+        repository = f"{repo_info['owner']}/{repo_info['repo_name']}"
+        if response.status_code == 404:
+            logger.warning(
+                f"Repository not found on {self.host.value}: {repository}. "
+                "Did the repo URL change?"
+            )
+        else:
+            logger.warning(
+                f"Unexpected HTTP error: {response.status_code} from "
+                f"{self.host.value} for repository: {repository}"
+            )
+        return None
+
+    @abstractmethod
+    def get_repo_meta(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        """Get a repository's metrics.
+
+        Parameters
+        ----------
+        repo_info : dict
+            The repository's ``owner`` and ``repo_name``.
+
+        Returns
+        -------
+        dict or None
+            The metrics, with the fields of ``GhMeta``, or None if the
+            repository wasn't found or the request failed.
+        """
+
+
+BACKENDS: dict[RepositoryHost, type[RepositoryBackend]] = {}
+"""The backend class of each supported repository host"""
+
+
+def register_backend(
+    backend: type[RepositoryBackend],
+) -> type[RepositoryBackend]:
+    """Class decorator that adds a backend to :data:`BACKENDS`."""
+    BACKENDS[backend.host] = backend
+    return backend
+
+
+@register_backend
+class GitHubBackend(RepositoryBackend):
+    """Fetch repository metrics with a
+    :class:`pyosmeta.github_api.GitHubAPI` client.
+
+    The client rotates its own tokens and waits for its own rate limits, so
+    requests are made one at a time.
+
+    Parameters
+    ----------
+    github_api : GitHubAPI, Optional
+        The client. Defaults to a new ``GitHubAPI``.
+    """
+
+    host = RepositoryHost.github
+    api_url = "https://api.github.com"
+    max_concurrency = 1
+
+    def __init__(self, github_api: Optional["GitHubAPI"] = None, **kwargs):
+        super().__init__(**kwargs)
+        if github_api is None:
+            from .github_api import GitHubAPI
+
+            github_api = GitHubAPI()
+        self.github_api = github_api
+
+    def get_repo_meta(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        with self.rate_limiter.slot():
+            return self.github_api.get_repo_meta_github(repo_info)
+
+
+@register_backend
+class GitLabBackend(RepositoryBackend):
+    """Fetch repository metrics from the GitLab REST API.
+
+    Set a ``GITLAB_TOKEN`` to raise the rate limit. ``owner`` may include
+    subgroups, e.g. ``group/subgroup``.
+    """
+
+    host = RepositoryHost.gitlab
+    api_url = "https://gitlab.com/api/v4"
+    token_env = "GITLAB_TOKEN"
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {"PRIVATE-TOKEN": self.token}
+
+    @staticmethod
+    def _project_path(repo_info: dict[str, str]) -> str:
+        project = f"{repo_info['owner']}/{repo_info['repo_name']}"
+        return f"/projects/{quote(project, safe='')}"
+
+    def _get_contrib_count(self, repo_info: dict[str, str]) -> int | None:
+        """Return the number of contributors, or None if they couldn't all
+        be fetched."""
+        path = f"{self._project_path(repo_info)}/repository/contributors"
+        params: Optional[dict[str, Any]] = {"per_page": 100}
+        count = 0
+        while path:
+            response = self._get(path, params)
+            if response.status_code != 200:
+                logger.warning(
+                    f"Couldn't count the contributors of {path}: "
+                    f"HTTP {response.status_code}"
+                )
+                return None
+            count += len(response.json())
+            # The next page's URL includes the query parameters
+            path = response.links.get("next", {}).get("url")
+            params = None
+        return count
+
+    @instrumented("GitLabBackend.get_repo_meta")
+    def get_repo_meta(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        project = self._get_json(self._project_path(repo_info), repo_info)
+        if project is None:
+            return None
+        return {
+            "name": project.get("name"),
+            "description": project.get("description"),
+            "created_at": project.get("created_at"),
+            "stargazers_count": project.get("star_count", 0),
+            "watchers_count": project.get("star_count", 0),
+            # Missing if the project's issues are disabled
+            "open_issues_count": project.get("open_issues_count", 0),
+            "forks_count": project.get("forks_count", 0),
+            "documentation": None,
+            "contrib_count": self._get_contrib_count(repo_info),
+            "last_commit": project.get("last_activity_at"),
+        }
+
+
+@register_backend
+class CodebergBackend(RepositoryBackend):
+    """Fetch repository metrics from the Codeberg (Forgejo) API.
+
+    Set a ``CODEBERG_TOKEN`` to raise the rate limit.
+    """
+
+    host = RepositoryHost.codeberg
+    api_url = "https://codeberg.org/api/v1"
+    token_env = "CODEBERG_TOKEN"
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {"Authorization": f"token {self.token}"}
+
+    @instrumented("CodebergBackend.get_repo_meta")
+    def get_repo_meta(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        repo = self._get_json(
+            f"/repos/{repo_info['owner']}/{repo_info['repo_name']}", repo_info
+        )
+        if repo is None:
+            return None
+        return {
+            "name": repo.get("name"),
+            "description": repo.get("description"),
+            "created_at": repo.get("created_at"),
+            "stargazers_count": repo.get("stars_count", 0),
+            "watchers_count": repo.get("watchers_count", 0),
+            "open_issues_count": repo.get("open_issues_count", 0),
+            "forks_count": repo.get("forks_count", 0),
+            "documentation": repo.get("website") or None,
+            "contrib_count": None,
+            "last_commit": repo.get("updated_at"),
+        }
+
+
+@register_backend
+class BitbucketBackend(RepositoryBackend):
+    """Fetch repository metrics from the Bitbucket Cloud API.
+
+    Set a ``BITBUCKET_TOKEN`` (an access token) to raise the rate limit.
+    ``owner`` is the repository's workspace.
+    """
+
+    host = RepositoryHost.bitbucket
+    api_url = "https://api.bitbucket.org/2.0"
+    token_env = "BITBUCKET_TOKEN"
+
+    def _get_size(
+        self,
+        path: str,
+        repo_info: dict[str, str],
+        params: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Return the number of items in a paginated collection."""
+        page = self._get_json(
+            path, repo_info, {**(params or {}), "pagelen": 1}
+        )
+        if page is None:
+            return 0
+        return page.get("size", len(page.get("values", [])))
+
+    @instrumented("BitbucketBackend.get_repo_meta")
+    def get_repo_meta(
+        self, repo_info: dict[str, str]
+    ) -> dict[str, Any] | None:
+        path = f"/repositories/{repo_info['owner']}/{repo_info['repo_name']}"
+        repo = self._get_json(path, repo_info)
+        if repo is None:
+            return None
+
+        watchers = self._get_size(f"{path}/watchers", repo_info)
+        open_issues = 0
+        if repo.get("has_issues"):
+            open_issues = self._get_size(
+                f"{path}/issues",
+                repo_info,
+                {"q": 'state="new" OR state="open"'},
+            )
+        return {
+            "name": repo.get("name"),
+            "description": repo.get("description"),
+            "created_at": repo.get("created_on"),
+            "stargazers_count": watchers,
+            "watchers_count": watchers,
+            "open_issues_count": open_issues,
+            "forks_count": self._get_size(f"{path}/forks", repo_info),
+            "documentation": repo.get("website") or None,
+            "contrib_count": None,
+            "last_commit": repo.get("updated_on"),
+        }
+
+
+def default_backends(
+    github_api: Optional["GitHubAPI"] = None,
+) -> dict[RepositoryHost, RepositoryBackend]:
+    """Return a backend for every host in :data:`BACKENDS`.
+
+    Parameters
+    ----------
+    github_api : GitHubAPI, Optional
+        The client of the GitHub backend. Defaults to a new ``GitHubAPI``.
+    """
+    backends = {}
+    for host, backend in BACKENDS.items():
+        if host == RepositoryHost.github:
+            backends[host] = backend(github_api=github_api)
+        else:
+            backends[host] = backend()
+    return backends
+
+
+def _fetch_queue(
+    backend: RepositoryBackend, queue: "SimpleQueue[tuple[str, dict]]"
+) -> dict[str, dict[str, Any] | None]:
+    """Fetch the packages in a queue until it's empty."""
+    results = {}
+    while True:
+        try:
+            pkg_name, repo_info = queue.get_nowait()
+        except Empty:
+            return results
+        try:
+            results[pkg_name] = backend.get_repo_meta(repo_info)
+        except Exception:
+            logger.warning(
+                f"Unexpected error fetching {backend.host.value} metrics "
+                f"for {pkg_name}. Treating this package as a failed fetch.",
+                exc_info=True,
+            )
+            results[pkg_name] = None
+
+
+def submit_repo_metas(
+    executor: Executor,
+    jobs: dict[str, tuple[RepositoryBackend, dict[str, str]]],
+) -> list[Future]:
+    """Submit fetches of the packages' repository metrics to an executor.
+
+    Each backend's packages are fetched by ``max_concurrency`` workers of
+    their own, so packages of different hosts are fetched at the same
+    time, and the executor's threads never all wait for one host.
+
+    Parameters
+    ----------
+    executor : Executor
+        Runs the fetches. Give it a thread for each worker of each backend
+        (see :func:`count_workers`) to run them all at once.
+    jobs : dict
+        The backend and repository ``owner`` and ``repo_name`` of each
+        package, keyed by package name.
+
+    Returns
+    -------
+    list[Future]
+        The workers. Each one's result is a dict of the metrics of the
+        packages it fetched, or None for those that failed.
+    """
+    queues: dict[int, tuple[RepositoryBackend, SimpleQueue]] = {}
+    for pkg_name, (backend, repo_info) in jobs.items():
+        _, queue = queues.setdefault(id(backend), (backend, SimpleQueue()))
+        queue.put((pkg_name, repo_info))
+
+    futures = []
+    for backend, queue in queues.values():
+        for _ in range(
+            min(backend.rate_limiter.max_concurrency, queue.qsize())
+        ):
+            # Pass the recorder's current stage on to the worker threads
+            context = contextvars.copy_context()
+            futures.append(
+                executor.submit(context.run, _fetch_queue, backend, queue)
+            )
+    return futures
+
+
+def count_workers(
+    jobs: dict[str, tuple[RepositoryBackend, dict[str, str]]],
+) -> int:
+    """Return the number of workers :func:`submit_repo_metas` submits."""
+    counts: dict[int, int] = {}
+    limits: dict[int, int] = {}
+    for backend, _ in jobs.values():
+        counts[id(backend)] = counts.get(id(backend), 0) + 1
+        limits[id(backend)] = backend.rate_limiter.max_concurrency
+    return sum(min(limits[key], count) for key, count in counts.items())
+
+
+def fetch_repo_metas(
+    jobs: dict[str, tuple[RepositoryBackend, dict[str, str]]],
+) -> dict[str, dict[str, Any] | None]:
+    """Fetch the repository metrics of many packages concurrently.
+
+    Parameters
+    ----------
+    jobs : dict
+        The backend and repository ``owner`` and ``repo_name`` of each
+        package, keyed by package name.
+
+    Returns
+    -------
+    dict
+        Each package's metrics, or None if the fetch failed.
+    """
+    results: dict[str, dict[str, Any] | None] = {}
+    with ThreadPoolExecutor(
+        max_workers=count_workers(jobs) or 1,
+        thread_name_prefix="pyosmeta-hosts",
+    ) as executor:
+        for future in submit_repo_metas(executor, jobs):
+            results.update(future.result())
+    return results
@@ -0,0 +1,223 @@
+"""
+Fetch review issues from several GitHub repositories at once.
+
+By default, reviews are read from the issues of one repository
+(``pyopensci/software-submission``). :class:`pyosmeta.parse_issues.ProcessIssues`
+can instead read them from a list of :class:`ReviewSource` objects, e.g.
+partner review queues. A source is a repository, or every repository of an
+org. Each repository's issues are paginated separately, and the
+repositories are fetched concurrently.
+
+If the same package is reviewed in more than one source, the review from
+the source listed first is kept. If it's reviewed in more than one issue of
+the same source, the review from the most recently updated issue is kept.
+
+An :class:`IssueStore` keeps the issues fetched from each repository, and
+the latest ``updated_at`` of its issues (its watermark). Later runs only
+ask GitHub for the issues updated since each repository's watermark::
+
+    .pyosmeta_cache/issues/
+        pyopensci__software-submission.json  # {"watermark": ..., "issues": {...}}
+"""
+
+import contextvars
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .logging import logger
+
+if TYPE_CHECKING:
+    from .github_api import GitHubAPI
+
+DEFAULT_ISSUE_STORE = Path(".pyosmeta_cache") / "issues"
+"""Where the ``--issue-store`` option keeps fetched issues by default"""
+
+DEFAULT_MAX_WORKERS = 4
+"""Repositories fetched at the same time"""
+
+
+@dataclass(frozen=True)
+class ReviewSource:
+    """A GitHub repository with review issues, or every repository of an
+    org if ``repo`` is None."""
+
+    org: str
+    repo: Optional[str] = None
+
+    @classmethod
+    def parse(cls, spec: str) -> "ReviewSource":
+        """Parse an ``org/repo`` or ``org`` string.
+
+        Examples
+        --------
+        >>> ReviewSource.parse("pyopensci/software-submission")
+        ReviewSource(org='pyopensci', repo='software-submission')
+        """
+        org, _, repo = spec.strip().strip("/").partition("/")
+        if not org or "/" in repo:
+            raise ValueError(
+                f"Invalid review source {spec!r}. Use ORG or ORG/REPO."
+            )
+        return cls(org, repo or None)
+
+    def __str__(self) -> str:
+        return f"{self.org}/{self.repo}" if self.repo else self.org
+
+
+def repository_url(org: str, repo: str) -> str:
+    """Return a repository's API URL, as in an issue's ``repository_url``."""
+    return f"https://api.github.com/repos/{org}/{repo}".lower()
+
+
+class IssueStore:
+    """The issues fetched from each repository, and each one's watermark.
+
+    Parameters
+    ----------
+    path : str or Path, Optional
+        The directory to keep the issues in, one JSON file per repository.
+        If None, issues are only kept in memory.
+    """
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        self.path = Path(path) if path is not None else None
+        self._repos: dict[str, dict[str, Any]] = {}
+
+    def _file(self, org: str, repo: str) -> Path:
+        return self.path / f"{org}__{repo}.json".lower()
+
+    def _load(self, org: str, repo: str) -> dict[str, Any]:
+        key = f"{org}/{repo}".lower()
+        if key not in self._repos:
+            state = {"watermark": None, "issues": {}}
+            if self.path is not None and self._file(org, repo).exists():
+                try:
+                    state = json.loads(self._file(org, repo).read_text())
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"Ignoring unreadable issue store for {key}"
+                    )
+            self._repos[key] = state
+        return self._repos[key]
+
+    def watermark(self, org: str, repo: str) -> Optional[str]:
+        """Return the latest ``updated_at`` of a repository's issues, or
+        None if none were fetched yet."""
+        return self._load(org, repo)["watermark"]
+
+    def issues(self, org: str, repo: str) -> list[dict[str, Any]]:
+        """Return the issues fetched from a repository."""
+        return list(self._load(org, repo)["issues"].values())
+
+    def update(
+        self, org: str, repo: str, issues: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Add or replace issues of a repository, save the repository's
+        issues and return all of them."""
+        state = self._load(org, repo)
+        for issue in issues:
+            state["issues"][str(issue["number"])] = issue
+            # ISO 8601 timestamps in UTC sort chronologically
+            if state["watermark"] is None or (
+                issue["updated_at"] > state["watermark"]
+            ):
+                state["watermark"] = issue["updated_at"]
+
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            file = self._file(org, repo)
+            tmp_file = file.with_name(file.name + ".tmp")
+            tmp_file.write_text(json.dumps(state))
+            os.replace(tmp_file, file)
+        return list(state["issues"].values())
+
+
+def _submit_all(executor: ThreadPoolExecutor, fn, items: list) -> list:
+    """Run ``fn`` on each item in the executor, and return the results."""
+    futures = [
+        # Pass the recorder's current stage on to the worker threads
+        executor.submit(contextvars.copy_context().run, fn, item)
+        for item in items
+    ]
+    return [future.result() for future in futures]
+
+
+def fetch_source_issues(
+    github_api: "GitHubAPI",
+    sources: list[ReviewSource],
+    store: Optional[IssueStore] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Fetch the issues of every repository of the sources concurrently.
+
+    Parameters
+    ----------
+    github_api : GitHubAPI
+        The client to make the requests with.
+    sources : list[ReviewSource]
+        The sources, in order of precedence.
+    store : IssueStore, Optional
+        If given, only issues updated since each repository's watermark are
+        fetched, and merged into the issues fetched before.
+    max_workers : int
+        The number of repositories fetched at the same time.
+
+    Returns
+    -------
+    issues : list[dict]
+        The issues of all the repositories, as returned by the GitHub API.
+    ranks : dict[str, int]
+        The precedence of each repository (the index of its source), keyed
+        by its API URL (see :func:`repository_url`).
+    """
+    store = store or IssueStore()
+
+    def expand(source: ReviewSource) -> list[str]:
+        if source.repo is not None:
+            return [source.repo]
+        repos = github_api._get_response_rest(
+            f"https://api.github.com/orgs/{source.org}/repos?per_page=100"
+        )
+        return [repo["name"] for repo in repos if repo.get("has_issues")]
+
+    def fetch(org_repo: tuple[str, str]) -> list[dict[str, Any]]:
+        org, repo = org_repo
+        url = (
+            f"https://api.github.com/repos/{org}/{repo}/issues"
+            "?state=all&per_page=100"
+        )
+        watermark = store.watermark(org, repo)
+        if watermark is not None:
+            url += f"&since={watermark}"
+        issues = github_api._get_response_rest(url)
+        logger.info(
+            f"Fetched {len(issues)} issues from {org}/{repo}"
+            + (f" updated since {watermark}" if watermark else "")
+        )
+        return store.update(org, repo, issues)
+
+    ranks: dict[str, int] = {}
+    repos: list[tuple[str, str]] = []
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="pyosmeta-sources"
+    ) as executor:
+        for rank, (source, names) in enumerate(
+            zip(sources, _submit_all(executor, expand, sources))
+        ):
+            for name in names:
+                url = repository_url(source.org, name)
+                # A repository listed in two sources keeps the first rank
+                if url not in ranks:
+                    ranks[url] = rank
+                    repos.append((source.org, name))
+
+        issues = [
+            issue
+            for repo_issues in _submit_all(executor, fetch, repos)
+            for issue in repo_issues
+        ]
+    return issues, ranks
@@ -0,0 +1,160 @@
+"""
+Sort review issues by where they are in the review process.
+
+pyOpenSci's review issues move through numbered lifecycle labels, from
+``0/presubmission`` to ``6/pyOS-approved``. :func:`review_status` maps an
+issue's labels to a :class:`ReviewStatus`, so that one fetch of every review
+issue can be split into the accepted packages (``packages.yml``) and the
+packages under review (``under_review.yml``) by :func:`classify_issues`.
+"""
+
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import ValidationError
+
+from .logging import logger
+from .models import ReviewModel
+from .models.github import Issue, Labels
+from .parse_issues import ProcessIssues
+
+
+class ReviewStatus(str, Enum):
+    """Where a review issue is in the review process, in order."""
+
+    PRESUBMISSION = "presubmission"
+    PRE_REVIEW = "pre-review"
+    UNDER_REVIEW = "under-review"
+    ACCEPTED = "accepted"
+
+
+LIFECYCLE_LABELS: dict[str, ReviewStatus] = {
+    "0/presubmission": ReviewStatus.PRESUBMISSION,
+    "presubmission": ReviewStatus.PRESUBMISSION,
+    "0/pre-review-checks": ReviewStatus.PRE_REVIEW,
+    "1/editor-assigned": ReviewStatus.UNDER_REVIEW,
+    "2/seeking-reviewers": ReviewStatus.UNDER_REVIEW,
+    "3/reviewers-assigned": ReviewStatus.UNDER_REVIEW,
+    "4/reviews-in-awaiting-changes": ReviewStatus.UNDER_REVIEW,
+    "5/awaiting-reviewer-response": ReviewStatus.UNDER_REVIEW,
+    "6/pyOS-approved": ReviewStatus.ACCEPTED,
+}
+"""
+The review status each lifecycle label marks.
+
+Only ``6/pyOS-approved`` marks a review as accepted, as in the default
+``update-reviews`` run, so that packages.yml is the same with or without
+``--under-review``. ``9/joss-approved`` is added alongside it after JOSS
+accepts the paper, and doesn't change the review status.
+"""
+
+_STATUS_BY_LABEL = {
+    label.lower(): status for label, status in LIFECYCLE_LABELS.items()
+}
+_STATUS_ORDER = list(ReviewStatus)
+
+UNDER_REVIEW_FIELDS = (
+    "package_name",
+    "package_description",
+    "submitting_author",
+    "editor",
+    "reviewers",
+    "repository_link",
+    "issue_link",
+    "created_at",
+    "updated_at",
+)
+"""The fields of a review exported to under_review.yml"""
+
+
+def review_status(issue: Issue) -> Optional[ReviewStatus]:
+    """Return the latest review status an issue's labels mark, or None if
+    it has no lifecycle label."""
+    statuses = [
+        _STATUS_BY_LABEL.get(
+            (label.name if isinstance(label, Labels) else label).lower()
+        )
+        for label in issue.labels
+    ]
+    statuses = [status for status in statuses if status is not None]
+    if not statuses:
+        return None
+    return max(statuses, key=_STATUS_ORDER.index)
+
+
+def classify_issues(issues: list[Issue]) -> dict[ReviewStatus, list[Issue]]:
+    """Group review issues by their review status.
+
+    Accepted reviews are kept whether their issue is open or closed. The
+    other issues are only kept while they're open, since a closed issue
+    that was never accepted was withdrawn or declined.
+
+    Parameters
+    ----------
+    issues : list[Issue]
+        The review issues, e.g. from ``ProcessIssues.get_issues``.
+
+    Returns
+    -------
+    dict
+        The issues of each review status, in their original order.
+    """
+    groups: dict[ReviewStatus, list[Issue]] = {
+        status: [] for status in ReviewStatus
+    }
+    for issue in issues:
+        status = review_status(issue)
+        if status is None:
+            continue
+        if status == ReviewStatus.ACCEPTED or issue.state != "closed":
+            groups[status].append(issue)
+    return groups
+
+
+def under_review_entry(
+    review: ReviewModel, status: ReviewStatus
+) -> dict[str, Any]:
+    """Return a review's entry in under_review.yml."""
+    entry = review.model_dump(include=set(UNDER_REVIEW_FIELDS))
+    entry = {field: entry[field] for field in UNDER_REVIEW_FIELDS}
+    entry["review_status"] = status.value
+    return entry
+
+
+def build_under_review(
+    process_issues: ProcessIssues, groups: dict[ReviewStatus, list[Issue]]
+) -> list[dict[str, Any]]:
+    """Parse the open, not yet accepted review issues into under_review.yml
+    entries.
+
+    Reviews in progress often have unfinished headers, so an issue that
+    can't be parsed is logged and left out rather than failing the run.
+
+    Parameters
+    ----------
+    process_issues : ProcessIssues
+        Parses the issues.
+    groups : dict
+        The issues of each review status, from :func:`classify_issues`.
+
+    Returns
+    -------
+    list[dict]
+        The entries, most advanced reviews first.
+    """
+    entries = []
+    for status in reversed(_STATUS_ORDER):
+        if status == ReviewStatus.ACCEPTED:
+            continue
+        for issue in groups[status]:
+            try:
+                review = process_issues.parse_issue(issue)
+            except ValidationError:
+                logger.warning(
+                    f"Couldn't parse the review in progress {issue.title}. "
+                    "Leaving it out of under_review.yml.",
+                    exc_info=True,
+                )
+                continue
+            entries.append(under_review_entry(review, status))
+    return entries
@@ -4,16 +4,18 @@ We use these helpers to clean various markdown elements found in issue review te
 """
 
 import re
-from datetime import datetime
-from typing import Any
+from datetime import date
+from functools import lru_cache
 
-import requests
 import unidecode
 from requests.exceptions import HTTPError
 
+from .instrumentation import http_get, instrumented
+from .link_probe import probe_url
 from .logging import logger
 
 
+@lru_cache(maxsize=4096)
 def get_clean_user(username: str) -> str:
     """Cleans a GitHub username provided in a review issue by removing any
     additional text after a space and converting to lowercase.
@@ -21,7 +23,8 @@ def get_clean_user(username: str) -> str:
     This function assumes that a valid username should not contain spaces. If a
     space is detected, only the part before the first space is considered the
     username. The resulting string is then trimmed of whitespace and converted
-    to lowercase.
+    to lowercase. Results are memoized as the same users are cleaned for
+    every review they took part in.
 
     Parameters
     ----------
@@ -42,13 +45,50 @@ def get_clean_user(username: str) -> str:
     'githubusername'
     """
 
-    if len(username.split()) > 1:
-        username = username.split()[0]
+    parts = username.split()
+    if len(parts) > 1:
+        username = parts[0]
     return username.lower().strip()
 
 
-def clean_date(source_date: str | None) -> datetime | str:
-    """Cleans up a date string to a consistent datetime format.
+MISSING_DATE_VALUES = {"missing", "tbd"}
+"""Placeholder values used in reviews and packages.yml for an unknown date"""
+
+DATE_PATTERNS = (
+    # GitHub timestamps, YYYY-MM-DD and YYYY/MM/DD
+    re.compile(
+        r"^(?P<year>\d{4})[-/](?P<month>\d{1,2})[-/](?P<day>\d{1,2})"
+        r"(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?$"
+    ),
+    # Manually entered month-day-year or month/day/year (review templates)
+    re.compile(r"^(?P<month>\d{1,2})[-/](?P<day>\d{1,2})[-/](?P<year>\d{4})$"),
+)
+"""Date formats that clean_date understands, tried in order"""
+
+
+@lru_cache(maxsize=4096)
+def _normalize_date(source_date: str) -> str | None:
+    """Normalize a date string to ``YYYY-MM-DD``, or None if unparsable.
+
+    The same dates are re-cleaned every time packages.yml is reloaded,
+    so results are memoized.
+    """
+    for pattern in DATE_PATTERNS:
+        match = pattern.match(source_date)
+        if match is None:
+            continue
+        try:
+            return date(
+                int(match["year"]), int(match["month"]), int(match["day"])
+            ).isoformat()
+        except ValueError:
+            # eg. month 13: it matched a format but isn't a real date
+            return None
+    return None
+
+
+def clean_date(source_date: str | date | None) -> str:
+    """Cleans up a date string to a consistent ``YYYY-MM-DD`` format.
 
     The source date string may have been manually entered as month-day-year
     format, retrieved fresh from GitHub as a full timestamp, already cleaned
@@ -60,23 +100,33 @@ def clean_date(source_date: str | None) -> datetime | str:
     should return the same value, since we re-parse previously exported
     metrics as a fallback when a fresh GitHub API call fails (so the data aren't
     deleted).
+
+    Examples
+    --------
+    >>> clean_date("2024-03-07T12:34:56Z")
+    '2024-03-07'
+
+    >>> clean_date("01/18/2024")
+    '2024-01-18'
     """
 
-    if source_date is None or source_date == "missing":
+    if source_date is None:
         return "missing"
+    if isinstance(source_date, date):
+        # YAML loaders return unquoted dates as date objects
+        return source_date.strftime("%Y-%m-%d")
 
-    for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d"):
-        try:
-            return (
-                datetime.strptime(source_date, fmt).date().strftime("%Y-%m-%d")
-            )
-        except (TypeError, ValueError):
-            continue
+    source_date = str(source_date).strip()
+    if source_date.lower() in MISSING_DATE_VALUES:
+        return "missing"
 
-    logger.error(
-        f"Oops - couldn't parse date '{source_date}'. Setting date to 'missing'"
-    )
-    return "missing"
+    cleaned = _normalize_date(source_date)
+    if cleaned is None:
+        logger.error(
+            f"Oops - couldn't parse date '{source_date}'. Setting date to 'missing'"
+        )
+        return "missing"
+    return cleaned
 
 
 def clean_name(source_name: str) -> str:
@@ -113,38 +163,12 @@ def clean_markdown(source_text: str) -> str:
     return cleaned
 
 
-def clean_date_accepted_key(review_dict: dict[str, Any]) -> dict[str, str]:
-    """
-    Normalize date_accepted keys in our review dictionary.
-
-    In our reviews we have various templates that have evolved over the past
-    5 years (since 2019). Some used date accepted, some have date accepted
-    (month/day/year) and some have month-day-year. Rather than try to
-    account for all of these this is a helper that simply updates the key
-    to be date_accepted regardless of what is found after that text.
-
-    Parameters
-    ----------
-    review_dict : dict
-        Dictionary containing date_accepted key and other review data.
-
-    Returns
-    -------
-    dict
-        The modified review dictionary with normalized date_accepted key.
-    """
-    for key in list(review_dict.keys()):
-        if key.startswith("date_accepted"):
-            # Remove the old key
-            value = review_dict.pop(key)
-            # Add the new key with the value
-            review_dict["date_accepted"] = value
-            break
-    return review_dict
-
-
+@instrumented("check_url")
 def check_url(url: str) -> bool:
-    """Test url. Return true if there's a valid response, False if not
+    """Test url. Return true if it resolves, False if not
+
+    The page isn't downloaded: the url is checked with a HEAD request (or
+    a GET request for its first byte), see :mod:`pyosmeta.link_probe`.
 
     Parameters
     ----------
@@ -153,14 +177,10 @@ def check_url(url: str) -> bool:
 
     """
 
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return True
-    except Exception:  # pragma: no cover
-        return False
+    return probe_url(url).ok
 
 
+@instrumented("is_doi")
 def is_doi(archive) -> str | None:
     """Check if the DOI is valid and return the DOI link.
 
@@ -193,7 +213,7 @@ def is_doi(archive) -> str | None:
     url = f"https://doi.org/api/handles/{doi}"
 
     try:
-        response = requests.get(url, timeout=30)
+        response = http_get(url, timeout=30)
         response.raise_for_status()
         result = response.json()
     except HTTPError:
@@ -3,14 +3,20 @@ A small module containing functions that support parsing
 pyOpenSci review and contributor metadata.
 """
 
+from functools import lru_cache
+
 from pyosmeta.models import ReviewUser
 from pyosmeta.utils_clean import clean_name
 
 
+@lru_cache(maxsize=4096)
 def parse_user_names(username: str) -> ReviewUser | None:
     """Parses authors, contributors, editors and usernames from
     the requested issues.
 
+    The same editors and reviewers appear across many reviews, so results
+    are memoized and the (immutable) ``ReviewUser`` is shared between them.
+
     Parameters
     ----------
     username : str
@@ -18,8 +24,8 @@ def parse_user_names(username: str) -> ReviewUser | None:
 
     Returns
     -------
-    dict
-        ``{name: str, github_username: str}``
+    ReviewUser | None
+        The parsed user, or None if the line doesn't contain a user.
 
     Notes
     -----
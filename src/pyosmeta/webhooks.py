@@ -0,0 +1,298 @@
+"""
+Update reviews from GitHub ``issues`` webhooks, one issue at a time.
+
+``update-reviews`` re-parses every review issue, so fixing one review header
+means a full batch run. :class:`WebhookService` instead receives GitHub
+``issues`` webhook deliveries, re-parses only the issue that changed with
+:meth:`pyosmeta.parse_issues.ProcessIssues.parse_issue`, and updates that
+package in a :class:`ReviewStore`. The store is ``all_reviews.pickle``, the
+file ``update-reviews`` writes for ``update-review-teams``.
+
+Regenerating packages.yml takes much longer than parsing an issue, so it's
+debounced: it runs once no webhook has changed the store for ``debounce``
+seconds.
+
+The ``serve-webhooks`` script serves the webhook endpoint over HTTP. It can
+be tested by posting a payload to it locally::
+
+    curl -X POST localhost:8080 -H "X-GitHub-Event: issues" \\
+        --data @issue_edited.json
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import requests
+from pydantic import ValidationError
+
+from .logging import logger
+from .models import ReviewModel
+from .models.github import Issue
+from .parse_issues import ProcessIssues
+
+REVIEWS_PICKLE = "all_reviews.pickle"
+"""The review store written by update-reviews"""
+
+DEFAULT_DEBOUNCE = 30.0
+"""Seconds without changes to wait before regenerating packages.yml"""
+
+# Actions after which an issue is re-parsed (or removed, if it no longer
+# has a review label)
+REPARSE_ACTIONS = {
+    "opened",
+    "edited",
+    "reopened",
+    "closed",
+    "labeled",
+    "unlabeled",
+}
+# Actions after which an issue's review is removed
+REMOVE_ACTIONS = {"deleted", "transferred"}
+
+
+class ReviewStore:
+    """Reviews keyed by package name, saved to a pickle.
+
+    Parameters
+    ----------
+    path : str or Path
+        The pickle file. It's loaded if it exists.
+    """
+
+    def __init__(self, path: str | Path = REVIEWS_PICKLE) -> None:
+        self.path = Path(path)
+        self.reviews: dict[str, ReviewModel] = {}
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                self.reviews = pickle.load(f)
+
+    def __len__(self) -> int:
+        return len(self.reviews)
+
+    def upsert(self, review: ReviewModel) -> None:
+        """Add or replace a package's review.
+
+        The package keeps its GitHub metrics, since they don't come from the
+        issue. If the review's package was renamed, the review under the old
+        name is removed and its metrics are kept under the new name.
+        """
+        previous = next(
+            (
+                old
+                for old in self.reviews.values()
+                if old.issue_link == review.issue_link
+            ),
+            self.reviews.get(review.package_name),
+        )
+        self.remove_issue(review.issue_link)
+        if previous is not None and review.gh_meta is None:
+            review.gh_meta = previous.gh_meta
+        self.reviews[review.package_name] = review
+
+    def remove_issue(self, issue_link: str) -> list[str]:
+        """Remove the reviews from an issue and return their package names."""
+        removed = [
+            name
+            for name, review in self.reviews.items()
+            if review.issue_link == issue_link
+        ]
+        for name in removed:
+            del self.reviews[name]
+        return removed
+
+    def save(self) -> None:
+        """Write the store, replacing the file atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self.reviews, f)
+        os.replace(tmp_path, self.path)
+
+
+def _issue_link(issue: dict[str, Any]) -> str:
+    """Return the review's issue_link for an issue payload."""
+    return str(issue["url"]).replace(
+        "https://api.github.com/repos/", "https://github.com/"
+    )
+
+
+class WebhookService:
+    """Apply GitHub ``issues`` webhooks to a review store.
+
+    Parameters
+    ----------
+    process_issues : ProcessIssues
+        Parses the issues. Its GitHub client's org, repo and labels select
+        the review issues, as in ``update-reviews``.
+    store : ReviewStore
+        The reviews to update.
+    regenerate : callable
+        Called with the reviews to regenerate packages.yml from, in a
+        background thread.
+    secret : str, Optional
+        The webhook secret. If given, deliveries without a valid
+        ``X-Hub-Signature-256`` are rejected.
+    debounce : float
+        Seconds without changes to wait before calling ``regenerate``.
+    """
+
+    def __init__(
+        self,
+        process_issues: ProcessIssues,
+        store: ReviewStore,
+        regenerate: Callable[[dict[str, ReviewModel]], None],
+        secret: Optional[str] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        self.process_issues = process_issues
+        self.store = store
+        self.regenerate = regenerate
+        self.secret = secret
+        self.debounce = debounce
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    @property
+    def repository(self) -> str:
+        github_api = self.process_issues.github_api
+        return f"{github_api.org}/{github_api.repo}".lower()
+
+    def verify_signature(self, body: bytes, signature: Optional[str]) -> bool:
+        """Check a delivery's ``X-Hub-Signature-256`` header."""
+        if self.secret is None:
+            return True
+        expected = hmac.new(
+            self.secret.encode(), body, hashlib.sha256
+        ).hexdigest()
+        return hmac.compare_digest(f"sha256={expected}", signature or "")
+
+    def _is_review(self, issue: dict[str, Any]) -> bool:
+        labels = self.process_issues.github_api.labels or []
+        return any(label["name"] in labels for label in issue["labels"])
+
+    def handle(
+        self, event: str, body: bytes, signature: Optional[str] = None
+    ) -> tuple[int, str]:
+        """Handle a webhook delivery.
+
+        Parameters
+        ----------
+        event : str
+            The ``X-GitHub-Event`` header.
+        body : bytes
+            The JSON payload.
+        signature : str, Optional
+            The ``X-Hub-Signature-256`` header.
+
+        Returns
+        -------
+        tuple[int, str]
+            The HTTP status and a message to respond with. If the review's
+            links couldn't be checked, the status is 503 so that GitHub
+            records a failed delivery, which can be redelivered.
+        """
+        if not self.verify_signature(body, signature):
+            return 401, "Invalid signature"
+        if event == "ping":
+            return 200, "pong"
+        if event != "issues":
+            return 202, f"Ignored {event} event"
+
+        try:
+            payload = json.loads(body)
+            action = payload["action"]
+            issue = payload["issue"]
+            repository = payload["repository"]["full_name"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return 400, "Not an issues event payload"
+        if repository.lower() != self.repository:
+            return 202, f"Ignored issue in {repository}"
+
+        if action in REMOVE_ACTIONS or (
+            action in REPARSE_ACTIONS and not self._is_review(issue)
+        ):
+            with self._lock:
+                removed = self.store.remove_issue(_issue_link(issue))
+                if removed:
+                    self.store.save()
+                    self._schedule_regenerate()
+            return 200, f"Removed {', '.join(removed) or 'nothing'}"
+        if action not in REPARSE_ACTIONS:
+            return 202, f"Ignored {action} action"
+
+        try:
+            review = self.process_issues.parse_issue(Issue(**issue))
+        except ValidationError as err:
+            logger.error(
+                f"Error processing review {issue.get('title')}",
+                exc_info=True,
+            )
+            return 422, str(err)
+        except requests.RequestException as err:
+            # Link and DOI checks failed; GitHub can redeliver the event
+            logger.error(
+                f"Network error processing review {issue.get('title')}: {err}"
+            )
+            return 503, "Couldn't check the review's links, try again later"
+
+        with self._lock:
+            self.store.upsert(review)
+            self.store.save()
+            self._schedule_regenerate()
+        logger.info(f"Updated the review of {review.package_name}")
+        return 200, f"Updated {review.package_name}"
+
+    def _schedule_regenerate(self) -> None:
+        """(Re)start the debounce timer. Called with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.debounce, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        """Regenerate packages.yml now if there are pending changes."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+            reviews = dict(self.store.reviews)
+        logger.info(f"Regenerating from {len(reviews)} reviews")
+        try:
+            self.regenerate(reviews)
+        except Exception:
+            logger.error("Couldn't regenerate packages.yml", exc_info=True)
+
+    def make_server(
+        self, host: str = "localhost", port: int = 8080
+    ) -> ThreadingHTTPServer:
+        """Return an HTTP server that passes POSTed webhooks to
+        :meth:`handle`. Call its ``serve_forever`` method to run it."""
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                status, message = service.handle(
+                    self.headers.get("X-GitHub-Event", ""),
+                    self.rfile.read(length),
+                    self.headers.get("X-Hub-Signature-256"),
+                )
+                body = message.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.info(format % args)
+
+        return ThreadingHTTPServer((host, port), Handler)
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 from typing import Callable, Literal, Optional, Union, overload
 
@@ -40,6 +41,25 @@ def process_contribs(contrib_github_api):
     return ProcessContributors(contrib_github_api)
 
 
+@pytest.fixture
+def no_link_checks(mocker):
+    """Resolve DOIs and check links without the network.
+
+    DOIs (bare or doi.org links) resolve to a record URL and every link
+    resolves, so that unit tests can build ReviewModels offline.
+    """
+
+    def is_doi(archive: str) -> str | None:
+        doi = re.sub(r"^https?://(dx\.)?doi\.org/", "", archive)
+        if not doi.startswith("10."):
+            return None
+        return f"https://records.example.org/{doi}"
+
+    mocker.patch("pyosmeta.utils_clean.is_doi", side_effect=is_doi)
+    mocker.patch("pyosmeta.utils_clean.check_url", return_value=True)
+    mocker.patch("pyosmeta.models.base.check_url", return_value=True)
+
+
 @pytest.fixture
 def github_api():
     """A fixture that instantiates an instance of the GitHubAPI object"""
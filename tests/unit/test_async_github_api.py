@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from pyosmeta.async_github_api import AsyncGitHubAPI
+from pyosmeta.checkpoint import CheckpointJournal
+from pyosmeta.github_api import GitHubAPIError
+from pyosmeta.models import ReviewModel
+
+REPO = {"owner": "pyopensci", "repo_name": "pyosmeta"}
+
+
+def make_response(status=200, json=None, links=None, headers=None):
+    response = Mock(status_code=status, links=links or {}, text="")
+    response.json.return_value = json
+    response.headers = headers or {"X-RateLimit-Remaining": "10"}
+    return response
+
+
+@pytest.fixture
+def api():
+    return AsyncGitHubAPI(token="token", max_concurrency=2)
+
+
+def test_get_response_rest_pagination(api, mocker):
+    get = mocker.patch(
+        "requests.get",
+        side_effect=[
+            make_response(
+                json=[{"id": 1}],
+                links={"next": {"url": "https://api.github.com/x?page=2"}},
+            ),
+            make_response(json=[{"id": 2}]),
+        ],
+    )
+    result = asyncio.run(api._get_response_rest("https://api.github.com/x"))
+    assert result == [{"id": 1}, {"id": 2}]
+    assert get.call_count == 2
+
+
+def test_get_repo_meta_github(api, mocker):
+    def fake_get(url, **kwargs):
+        if url.endswith("/contributors"):
+            return make_response(json=[{"login": "a"}, {"login": "b"}])
+        return make_response(
+            json={"name": "pyosmeta", "stargazers_count": 5, "homepage": ""}
+        )
+
+    mocker.patch("requests.get", side_effect=fake_get)
+    metrics = asyncio.run(api.get_repo_meta_github(REPO))
+    assert metrics["name"] == "pyosmeta"
+    assert metrics["stargazers_count"] == 5
+    assert metrics["documentation"] is None
+    assert metrics["contrib_count"] == 2
+
+
+def test_missing_repo_skips_contributors(api, mocker):
+    get = mocker.patch("requests.get", return_value=make_response(404))
+    assert asyncio.run(api.get_repo_meta_github(REPO)) is None
+    assert get.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "status, headers",
+    [
+        (401, {}),
+        (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+    ],
+)
+def test_run_errors(api, mocker, status, headers):
+    mocker.patch(
+        "requests.get", return_value=make_response(status, headers=headers)
+    )
+    with pytest.raises(GitHubAPIError):
+        asyncio.run(api._get_metrics_rest(REPO))
+    with pytest.raises(GitHubAPIError):
+        asyncio.run(api._get_response_rest("https://api.github.com/x"))
+
+
+def test_get_user_info(api, mocker):
+    mocker.patch(
+        "requests.get", return_value=make_response(json={"login": "user"})
+    )
+    assert asyncio.run(api.get_user_info("user")) == {"login": "user"}
+
+    mocker.patch("requests.get", return_value=make_response(401))
+    with pytest.raises(ValueError):
+        asyncio.run(api.get_user_info("user"))
+
+
+def test_requests_are_concurrent_up_to_the_limit(api, mocker):
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def slow_get(url, **kwargs):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(url)
+        return make_response(json={"login": url})
+
+    mocker.patch("requests.get", side_effect=slow_get)
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *(api.get_user_info(f"user{i}") for i in range(6))
+        )
+
+    users = asyncio.run(fetch_all())
+    assert len(users) == 6
+    assert max(peak) == 2
+
+
+def test_exhausted_rate_limit_is_shared(api, mocker):
+    sleep = mocker.patch("asyncio.sleep")
+    reset = int(time.time()) + 30
+    mocker.patch(
+        "requests.get",
+        return_value=make_response(
+            json=[],
+            headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset),
+            },
+        ),
+    )
+    asyncio.run(api._get_response_rest("https://api.github.com/x"))
+    sleep.assert_not_called()
+
+    # The next request waits for the reset
+    asyncio.run(api._get_response_rest("https://api.github.com/x"))
+    assert 29 <= sleep.call_args.args[0] <= 31
+
+
+def make_reviews(names):
+    return {
+        name: ReviewModel(
+            package_name=name,
+            repository_link=f"https://github.com/pyopensci/{name}",
+        )
+        for name in names
+    }
+
+
+def test_get_metrics(api, mocker, tmp_path):
+    async def fake_meta(repo_info):
+        if repo_info["repo_name"] == "missing":
+            return None
+        return {
+            "name": repo_info["repo_name"],
+            "description": "",
+            "created_at": "2020-01-01",
+            "stargazers_count": 5,
+            "watchers_count": 5,
+            "open_issues_count": 1,
+            "forks_count": 1,
+            "documentation": None,
+            "contrib_count": 2,
+            "last_commit": "2026-01-01",
+        }
+
+    fetch = mocker.patch.object(
+        api, "get_repo_meta_github", side_effect=fake_meta
+    )
+    checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+    reviews = make_reviews(["pyosmeta", "missing"])
+    endpoints = {
+        name: {"owner": "pyopensci", "repo_name": name} for name in reviews
+    }
+
+    reviews = asyncio.run(
+        api.get_metrics(endpoints, reviews, checkpoint=checkpoint)
+    )
+
+    assert reviews["pyosmeta"].gh_meta.stargazers_count == 5
+    assert reviews["pyosmeta"].gh_meta.fetched_at
+    assert reviews["missing"].gh_meta is None
+    assert "pyosmeta" in checkpoint
+    assert fetch.call_count == 2
+
+
+def test_get_metrics_stops_after_run_error(mocker):
+    api = AsyncGitHubAPI(token="token", max_concurrency=1)
+    fetch = mocker.patch.object(
+        api, "get_repo_meta_github", side_effect=GitHubAPIError("401")
+    )
+    reviews = make_reviews(["a", "b", "c"])
+    endpoints = {
+        name: {"owner": "pyopensci", "repo_name": name} for name in reviews
+    }
+
+    reviews = asyncio.run(api.get_metrics(endpoints, reviews))
+
+    assert fetch.call_count == 1
+    assert all(review.gh_meta is None for review in reviews.values())
@@ -0,0 +1,49 @@
+"""Tests for the checkpoint journal used to resume long API runs."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from pyosmeta.checkpoint import CheckpointJournal
+
+
+def test_record_and_resume(tmp_path):
+    """Recorded fetches are available to a resumed journal."""
+    path = tmp_path / "checkpoint.jsonl"
+    journal = CheckpointJournal(path)
+    journal.record("sunpy", {"stargazers_count": 999})
+
+    resumed = CheckpointJournal(path, resume=True)
+
+    assert "sunpy" in resumed
+    assert resumed.get("sunpy") == {"stargazers_count": 999}
+
+
+def test_new_run_starts_empty(tmp_path):
+    """Without resume, a new journal replaces the previous one."""
+    path = tmp_path / "checkpoint.jsonl"
+    CheckpointJournal(path).record("sunpy", {})
+
+    journal = CheckpointJournal(path)
+
+    assert len(journal) == 0
+    assert len(CheckpointJournal(path, resume=True)) == 0
+
+
+def test_resume_skips_stale_and_broken_entries(tmp_path):
+    """Entries outside the refresh window or partially written are ignored."""
+    path = tmp_path / "checkpoint.jsonl"
+    stale = datetime.now(timezone.utc) - timedelta(days=2)
+    path.write_text(
+        json.dumps({"key": "old", "fetched_at": stale.isoformat(), "data": {}})
+        + "\n"
+        + '{"key": "broken", "fetch'
+    )
+
+    journal = CheckpointJournal(path, resume=True)
+
+    assert len(journal) == 0
+
+
+def test_resume_missing_file(tmp_path):
+    journal = CheckpointJournal(tmp_path / "missing.jsonl", resume=True)
+    assert len(journal) == 0
@@ -2,8 +2,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+import pyosmeta.contributors
 from pyosmeta.constants import REPO_CONTRIB_TYPES
 from pyosmeta.contributors import ProcessContributors
+from pyosmeta.data_sources import CachedHTTPSource
 from pyosmeta.file_io import create_paths
 from pyosmeta.github_api import GitHubAPI
 
@@ -23,6 +25,12 @@ def process_contributors(github_api_mock, json_files):
     return ProcessContributors(github_api_mock, json_files)
 
 
+@pytest.fixture(autouse=True)
+def clear_combined_json_data(monkeypatch):
+    """Don't share combined json data between tests."""
+    monkeypatch.setattr(pyosmeta.contributors, "_combined_json_data", {})
+
+
 def test_check_contrib_type(process_contributors):
     assert (
         process_contributors.check_contrib_type("software-peer-review")
@@ -82,6 +90,84 @@ def test_combine_json_data(mock_process_json_file, process_contributors):
     assert combined_data == {"type1": ["user1"], "type2": ["user2"]}
 
 
+def test_load_json_uses_timeout(mocker, process_contributors):
+    mock_get = mocker.patch("requests.get")
+    mock_get.return_value.text = "{}"
+
+    process_contributors.load_json("https://example.com/test.json")
+
+    assert mock_get.call_args.kwargs["timeout"] == 30
+
+
+def test_load_json_through_cache(mocker, tmp_path, github_api_mock):
+    process_contributors = ProcessContributors(
+        github_api_mock, [], http_cache=CachedHTTPSource(cache_dir=tmp_path)
+    )
+    response = Mock(status_code=200, text='{"contributors": []}')
+    response.headers = {"ETag": '"v1"'}
+    mocker.patch("requests.get", return_value=response)
+    process_contributors.load_json("https://example.com/.all-contributorsrc")
+
+    mock_get = mocker.patch("requests.get", return_value=Mock(status_code=304))
+    result = process_contributors.load_json(
+        "https://example.com/.all-contributorsrc"
+    )
+
+    assert result == {"contributors": []}
+    assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+@patch.object(ProcessContributors, "process_json_file")
+def test_combine_json_data_skips_failures(
+    mock_process_json_file, process_contributors
+):
+    def process(json_file):
+        if json_file.endswith("file1.json"):
+            raise ValueError("bad json")
+        return "type2", ["user2"]
+
+    mock_process_json_file.side_effect = process
+
+    assert process_contributors.combine_json_data() == {"type2": ["user2"]}
+
+
+@patch.object(ProcessContributors, "process_json_file")
+def test_combine_json_data_is_reused(
+    mock_process_json_file, github_api_mock, json_files
+):
+    mock_process_json_file.return_value = ("type1", ["user1"])
+
+    first = ProcessContributors(github_api_mock, json_files)
+    first.combine_json_data()["type1"].append("mutated")
+    second = ProcessContributors(github_api_mock, json_files)
+
+    assert second.combine_json_data() == {"type1": ["user1"]}
+    assert mock_process_json_file.call_count == len(json_files)
+
+    second.combine_json_data(refresh=True)
+    assert mock_process_json_file.call_count == 2 * len(json_files)
+
+
+@patch.object(ProcessContributors, "process_json_file")
+def test_combine_json_data_expires(
+    mock_process_json_file, github_api_mock, json_files, mocker
+):
+    mock_process_json_file.return_value = ("type1", ["user1"])
+    monotonic = mocker.patch("time.monotonic", return_value=1000.0)
+    process_contributors = ProcessContributors(
+        github_api_mock, json_files, max_age=60
+    )
+
+    process_contributors.combine_json_data()
+    monotonic.return_value = 1059.0
+    process_contributors.combine_json_data()
+    assert mock_process_json_file.call_count == len(json_files)
+
+    monotonic.return_value = 1061.0
+    process_contributors.combine_json_data()
+    assert mock_process_json_file.call_count == 2 * len(json_files)
+
+
 def test_return_user_info(process_contributors, github_api_mock):
     github_api_mock.get_user_info.return_value = {
         "name": "Test User",
@@ -0,0 +1,157 @@
+import subprocess
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from pyosmeta.data_sources import (
+    CachedHTTPSource,
+    LocalCheckoutSource,
+    get_data_source,
+)
+
+PACKAGES_YML = "- package_name: SunPy\n  repository_link: x\n"
+
+
+@pytest.fixture
+def website_clone(tmp_path):
+    """A minimal git clone of the website repo."""
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "packages.yml").write_text(PACKAGES_YML)
+    git = [
+        "git",
+        "-C",
+        str(tmp_path),
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t",
+    ]
+    subprocess.run([*git, "init", "-q"], check=True)
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-qm", "data"], check=True)
+    return tmp_path
+
+
+def _response(status_code=200, text="", headers=None):
+    response = Mock(status_code=status_code, text=text)
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError()
+    return response
+
+
+class TestLocalCheckoutSource:
+    def test_read_yml_dict(self, website_clone):
+        source = LocalCheckoutSource(website_clone, check_freshness=False)
+
+        packages = source.read_yml_dict("data/packages.yml", "package_name")
+
+        assert list(packages) == ["sunpy"]
+
+    def test_missing_checkout(self, tmp_path):
+        with pytest.raises(ValueError, match="not found"):
+            LocalCheckoutSource(tmp_path / "missing")
+
+    def test_is_stale(self, website_clone, mocker):
+        source = LocalCheckoutSource(website_clone)
+        head = source.local_head()
+
+        mocker.patch.object(source, "remote_head", return_value=head)
+        assert source.is_stale() is False
+
+        mocker.patch.object(source, "remote_head", return_value="abc123")
+        assert source.is_stale() is True
+
+    def test_clone_ahead_of_remote_is_not_stale(self, website_clone, mocker):
+        source = LocalCheckoutSource(website_clone)
+        remote = source.local_head()
+        (website_clone / "local.txt").write_text("local change")
+        git = ["git", "-C", str(website_clone), "-c", "user.name=t"]
+        subprocess.run([*git, "-c", "user.email=t", "add", "."], check=True)
+        subprocess.run(
+            [*git, "-c", "user.email=t", "commit", "-qm", "local"], check=True
+        )
+
+        mocker.patch.object(source, "remote_head", return_value=remote)
+        assert source.is_stale() is False
+
+        # Behind: the remote's commit isn't in the checked out history
+        ahead = source.local_head()
+        subprocess.run([*git, "checkout", "-q", remote], check=True)
+        mocker.patch.object(source, "remote_head", return_value=ahead)
+        assert source.is_stale() is True
+
+    def test_stale_checkout_warns_once(self, website_clone, mocker, caplog):
+        source = LocalCheckoutSource(website_clone)
+        mocker.patch.object(source, "is_stale", return_value=True)
+
+        source.read_yml("data/packages.yml")
+        source.read_yml("data/packages.yml")
+
+        assert source.is_stale.call_count == 1
+        assert "isn't up to date" in caplog.text
+
+    def test_unknown_remote_is_not_stale(self, website_clone):
+        # The test clone has no "origin" remote to compare against
+        source = LocalCheckoutSource(website_clone)
+
+        assert source.is_stale() is None
+
+
+class TestCachedHTTPSource:
+    @pytest.fixture
+    def source(self, tmp_path):
+        return CachedHTTPSource(
+            base_url="https://example.org/", cache_dir=tmp_path
+        )
+
+    def test_downloads_and_caches(self, source, mocker):
+        mock_get = mocker.patch(
+            "requests.get",
+            return_value=_response(
+                text=PACKAGES_YML, headers={"ETag": '"v1"'}
+            ),
+        )
+
+        data = source.read_yml("data/packages.yml")
+
+        assert data[0]["package_name"] == "SunPy"
+        assert mock_get.call_args.args[0] == "https://example.org/packages.yml"
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+    def test_not_modified_uses_cache(self, source, mocker):
+        mocker.patch(
+            "requests.get",
+            return_value=_response(
+                text=PACKAGES_YML, headers={"ETag": '"v1"'}
+            ),
+        )
+        source.read_text("data/packages.yml")
+
+        mock_get = mocker.patch("requests.get", return_value=_response(304))
+        text = source.read_text("data/packages.yml")
+
+        assert text == PACKAGES_YML
+        assert mock_get.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"'
+        }
+
+    def test_download_failure_falls_back_to_cache(self, source, mocker):
+        mocker.patch("requests.get", return_value=_response(text=PACKAGES_YML))
+        source.read_text("data/packages.yml")
+
+        mocker.patch("requests.get", side_effect=requests.ConnectionError())
+
+        assert source.read_text("data/packages.yml") == PACKAGES_YML
+
+    def test_download_failure_without_cache_raises(self, source, mocker):
+        mocker.patch("requests.get", return_value=_response(500))
+
+        with pytest.raises(requests.HTTPError):
+            source.read_text("data/packages.yml")
+
+
+def test_get_data_source(tmp_path):
+    assert isinstance(get_data_source(), CachedHTTPSource)
+    assert isinstance(get_data_source(tmp_path), LocalCheckoutSource)
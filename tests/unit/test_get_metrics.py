@@ -1,9 +1,17 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
+from pyosmeta.checkpoint import CheckpointJournal
 from pyosmeta.cli.process_reviews import update_gh_meta
-from pyosmeta.github_api import GitHubAPI, GitHubAPIError
+from pyosmeta.github_api import (
+    GitHubAPI,
+    GitHubAPIError,
+    MetricsRefreshPolicy,
+)
 from pyosmeta.models import ReviewModel
-from pyosmeta.models.base import GhMeta
+from pyosmeta.models.base import GhMeta, RepositoryHost
+from pyosmeta.repository_hosts import GitLabBackend, HostRateLimiter
 
 
 @pytest.fixture
@@ -67,6 +75,7 @@ class TestGetMetrics:
         reviews = github_api.get_metrics(endpoints, {"sunpy": review})
 
         assert reviews["sunpy"].gh_meta.stargazers_count == 999
+        assert reviews["sunpy"].gh_meta.fetched_at is not None
 
     def test_leaves_none_when_fetch_fails(self, mocker, review, endpoints):
         """Failed fetch leaves gh_meta empty; gap-fill is update_gh_meta's job."""
@@ -135,22 +144,77 @@ class TestGetMetrics:
         assert reviews["sunpy"].gh_meta is None
         assert reviews["other-pkg"].gh_meta is None
 
-    def test_skips_non_github_hosts(self, mocker):
+    def test_fetches_other_hosts_with_their_backend(self, mocker, new_meta):
         review = ReviewModel(
             package_name="example",
             repository_link="https://gitlab.com/example/example",
         )
         github_api = GitHubAPI()
-        mock_fetch = mocker.patch.object(github_api, "get_repo_meta_github")
+        mock_github = mocker.patch.object(github_api, "get_repo_meta_github")
+        gitlab = mocker.Mock(spec=GitLabBackend)
+        gitlab.rate_limiter = HostRateLimiter(max_concurrency=2)
+        gitlab.get_repo_meta.return_value = new_meta
 
         reviews = github_api.get_metrics(
             {"example": {"owner": "example", "repo_name": "example"}},
             {"example": review},
+            backends={RepositoryHost.gitlab: gitlab},
         )
 
-        mock_fetch.assert_not_called()
+        mock_github.assert_not_called()
+        gitlab.get_repo_meta.assert_called_once_with(
+            {"owner": "example", "repo_name": "example"}
+        )
+        assert reviews["example"].gh_meta.stargazers_count == 999
+        assert reviews["example"].gh_meta.fetched_at is not None
+
+    def test_skips_hosts_without_a_backend(self, mocker):
+        review = ReviewModel(
+            package_name="example",
+            repository_link="https://codeberg.org/example/example",
+        )
+        github_api = GitHubAPI()
+        mock_github = mocker.patch.object(github_api, "get_repo_meta_github")
+
+        reviews = github_api.get_metrics(
+            {"example": {"owner": "example", "repo_name": "example"}},
+            {"example": review},
+            backends={},
+        )
+
+        mock_github.assert_not_called()
         assert reviews["example"].gh_meta is None
 
+    def test_records_fetches_in_checkpoint(
+        self, mocker, review, endpoints, new_meta, tmp_path
+    ):
+        github_api = GitHubAPI()
+        mocker.patch.object(
+            github_api, "get_repo_meta_github", return_value=new_meta
+        )
+        checkpoint = CheckpointJournal(tmp_path / "checkpoint.jsonl")
+
+        github_api.get_metrics(endpoints, {"sunpy": review}, checkpoint)
+
+        assert checkpoint.get("sunpy") == new_meta
+
+    def test_resume_skips_checkpointed_packages(
+        self, mocker, review, endpoints, new_meta, tmp_path
+    ):
+        path = tmp_path / "checkpoint.jsonl"
+        CheckpointJournal(path).record("sunpy", new_meta)
+        github_api = GitHubAPI()
+        mock_fetch = mocker.patch.object(github_api, "get_repo_meta_github")
+
+        reviews = github_api.get_metrics(
+            endpoints,
+            {"sunpy": review},
+            CheckpointJournal(path, resume=True),
+        )
+
+        mock_fetch.assert_not_called()
+        assert reviews["sunpy"].gh_meta.stargazers_count == 999
+
 
 class TestUpdateGhMeta:
     """Gap-fill from previously published packages.yml after a fetch."""
@@ -203,3 +267,92 @@ class TestUpdateGhMeta:
 
         assert reviews["sunpy"].gh_meta.stargazers_count == 500
         assert reviews["other-pkg"].gh_meta is None
+
+
+NOW = datetime(2026, 10, 19, 12, tzinfo=timezone.utc)
+
+
+def _fetched(meta: GhMeta, ago: timedelta) -> GhMeta:
+    return meta.model_copy(update={"fetched_at": (NOW - ago).isoformat()})
+
+
+class TestMetricsRefreshPolicy:
+    """Only stale metrics are refreshed, stalest first."""
+
+    @pytest.fixture
+    def reviews(self):
+        return {
+            name: ReviewModel(
+                package_name=name,
+                repository_link=f"https://github.com/{name}/{name}",
+            )
+            for name in ("fresh", "stale", "staler", "new")
+        }
+
+    @pytest.fixture
+    def endpoints(self, reviews):
+        return {name: {"owner": name, "repo_name": name} for name in reviews}
+
+    def test_skips_fresh_and_orders_stalest_first(
+        self, reviews, endpoints, old_meta
+    ):
+        existing = {
+            "fresh": _fetched(old_meta, timedelta(hours=1)),
+            "stale": _fetched(old_meta, timedelta(days=2)),
+            "staler": _fetched(old_meta, timedelta(days=5)),
+        }
+
+        to_refresh = MetricsRefreshPolicy().plan(
+            endpoints, reviews, existing, now=NOW
+        )
+
+        # Never-fetched packages are the stalest of all
+        assert list(to_refresh) == ["new", "staler", "stale"]
+        assert reviews["fresh"].gh_meta == existing["fresh"]
+        assert reviews["stale"].gh_meta is None
+
+    def test_metrics_without_timestamp_are_stale(
+        self, reviews, endpoints, old_meta
+    ):
+        to_refresh = MetricsRefreshPolicy().plan(
+            endpoints, reviews, {"fresh": old_meta}, now=NOW
+        )
+
+        assert "fresh" in to_refresh
+
+    def test_archived_packages_use_longer_ttl(
+        self, reviews, endpoints, old_meta
+    ):
+        reviews["stale"].active = False
+        existing = {"stale": _fetched(old_meta, timedelta(days=2))}
+
+        to_refresh = MetricsRefreshPolicy().plan(
+            endpoints, reviews, existing, now=NOW
+        )
+
+        assert "stale" not in to_refresh
+
+    def test_nightly_runs_refresh_every_package(
+        self, reviews, endpoints, old_meta
+    ):
+        """Metrics fetched partway through one nightly run are refreshed by
+        the next night's run."""
+        policy = MetricsRefreshPolicy()
+        existing = {}
+
+        for night in range(3):
+            started = datetime(2026, 10, 19 + night, 3, tzinfo=timezone.utc)
+            to_refresh = policy.plan(endpoints, reviews, existing, started)
+
+            assert list(to_refresh) == list(reviews)
+            # Each package is fetched up to an hour into the run
+            existing = {
+                name: old_meta.model_copy(
+                    update={
+                        "fetched_at": (
+                            started + timedelta(minutes=15 * i)
+                        ).isoformat()
+                    }
+                )
+                for i, name in enumerate(reviews)
+            }
@@ -1,6 +1,7 @@
 import logging
 import os
 import secrets
+import time
 
 import pytest
 
@@ -50,6 +51,29 @@ def test_missing_token(mock_missing_github_token, tmpdir):
         github_api.get_token()
 
 
+def test_get_token_injected(mock_missing_github_token):
+    """A token passed to the client is used without reading the env."""
+    github_api = GitHubAPI(token="injected-token")
+
+    assert github_api.get_token() == "injected-token"
+    assert github_api.auth_headers == {
+        "Authorization": "Bearer injected-token"
+    }
+
+
+def test_get_token_resolved_once(mock_github_token, mocker):
+    """The .env file is only loaded the first time the token is needed."""
+    mock_load = mocker.patch.object(github_api, "load_dotenv")
+    api = GitHubAPI()
+
+    api.get_token()
+    api.get_token()
+    headers = api.auth_headers
+
+    mock_load.assert_called_once()
+    assert api.auth_headers is headers
+
+
 @pytest.mark.parametrize(
     "org, repo, endpoint_type, labels, expected_url",
     [
@@ -183,10 +207,11 @@ def test_gh_meta_field_mapping_matches_model_fields():
     mapping = GitHubAPI.get_gh_meta_field_mapping()
 
     required_fields = set(mapping["required_fields"])
+    local_fields = set(mapping["local_fields"])
     model_fields = set(GhMeta.model_fields.keys())
     mapped_fields = set(mapping["rest_field_map"].keys())
 
-    assert required_fields == model_fields
+    assert required_fields.union(local_fields) == model_fields
     assert required_fields == mapped_fields.union({"contrib_count"})
     assert mapping["last_commit_source"] == "pushed_at"
     assert (
@@ -422,3 +447,72 @@ def test_get_repo_meta_github_returns_none_when_rest_fails(mocker):
 
     assert metrics is None
     mock_contrib.assert_not_called()
+
+
+def _rate_limited_response(mocker, status_code, remaining, payload=None):
+    """A mock GitHub response reporting the given rate limit budget."""
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    response.links = {}
+    response.text = ""
+    response.headers = {
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + 3600),
+    }
+    return response
+
+
+def test_token_pool_fails_over_when_exhausted(mocker):
+    """A request that exhausts one token is retried with the next token."""
+    mock_get = mocker.patch(
+        "requests.get",
+        side_effect=[
+            _rate_limited_response(mocker, 403, 0),
+            _rate_limited_response(mocker, 200, 4999, [{"id": 1}]),
+        ],
+    )
+    api = GitHubAPI(tokens=["token-a", "token-b"])
+
+    assert api._get_response_rest("https://api.github.com/test") == [{"id": 1}]
+    used = [call.kwargs["headers"] for call in mock_get.call_args_list]
+    assert used == [
+        {"Authorization": "Bearer token-a"},
+        {"Authorization": "Bearer token-b"},
+    ]
+    # token-b now has the most headroom
+    assert api.get_token() == "token-b"
+
+
+def test_token_pool_routes_to_most_headroom(mocker):
+    """Requests go to the token with the most remaining budget."""
+    api = GitHubAPI(tokens=["token-a", "token-b"])
+    budget_a, budget_b = api._get_token_pool()
+    budget_a.update(_rate_limited_response(mocker, 200, 10))
+    budget_b.update(_rate_limited_response(mocker, 200, 500))
+
+    assert api.get_token() == "token-b"
+
+
+def test_token_pool_all_exhausted(mocker):
+    """GitHubAPIError is only raised once every token is exhausted."""
+    mocker.patch(
+        "requests.get",
+        side_effect=[
+            _rate_limited_response(mocker, 403, 0),
+            _rate_limited_response(mocker, 403, 0),
+        ],
+    )
+    api = GitHubAPI(tokens=["token-a", "token-b"])
+
+    with pytest.raises(GitHubAPIError, match="rate limit exhausted"):
+        api._get_response_rest("https://api.github.com/test")
+
+
+def test_token_pool_from_env(mock_missing_github_token, monkeypatch):
+    """GITHUB_TOKEN and GITHUB_TOKENS are combined into one pool."""
+    monkeypatch.setenv("GITHUB_TOKEN", "token-a")
+    monkeypatch.setenv("GITHUB_TOKENS", "token-b, token-a,")
+    api = GitHubAPI()
+
+    assert [b.token for b in api._get_token_pool()] == ["token-a", "token-b"]
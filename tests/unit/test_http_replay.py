@@ -0,0 +1,89 @@
+import pytest
+import requests
+
+from pyosmeta.http_replay import (
+    HTTPCassette,
+    ReplayMissError,
+    http_cassette,
+)
+from pyosmeta.instrumentation import http_get, http_head
+from pyosmeta.utils_clean import check_url
+
+
+def offline(*args, **kwargs):
+    raise AssertionError("A replayed run shouldn't use the network")
+
+
+def test_record_and_replay(tmp_path, httpserver, monkeypatch):
+    httpserver.serve_content('{"name": "pyosmeta"}', code=200)
+    url = httpserver.url + "/repos/pyosmeta"
+
+    with http_cassette(record=tmp_path):
+        recorded = http_get(url, params={"page": 2}, timeout=5)
+    assert recorded.json() == {"name": "pyosmeta"}
+
+    monkeypatch.setattr(requests, "get", offline)
+    with http_cassette(replay=tmp_path):
+        replayed = http_get(url, params={"page": 2}, timeout=5)
+        with pytest.raises(ReplayMissError):
+            http_get(url)
+
+    assert replayed.status_code == 200
+    assert replayed.json() == {"name": "pyosmeta"}
+    assert replayed.url == url + "?page=2"
+
+
+def test_replay_repeated_requests_in_order(tmp_path, mocker):
+    responses = []
+    for status in (500, 200):
+        response = requests.Response()
+        response.status_code = status
+        response._content = str(status).encode()
+        responses.append(response)
+    get = mocker.patch("requests.get", side_effect=responses)
+
+    with http_cassette(record=tmp_path):
+        http_get("https://example.org", headers={"If-None-Match": "abc"})
+        http_get("https://example.org")
+    # Conditional requests are recorded as full requests
+    assert get.call_args_list[0].kwargs["headers"] == {}
+
+    with http_cassette(replay=tmp_path):
+        statuses = [
+            http_get("https://example.org").status_code for _ in range(3)
+        ]
+    assert statuses == [500, 200, 200]
+
+
+def test_replay_recorded_errors(tmp_path, mocker):
+    mocker.patch("requests.get", side_effect=requests.ConnectTimeout)
+    with http_cassette(record=tmp_path):
+        with pytest.raises(requests.ConnectTimeout):
+            http_get("https://example.org/down")
+
+    mocker.patch("requests.get", side_effect=offline)
+    with http_cassette(replay=tmp_path):
+        assert check_url("https://example.org/down") is False
+
+
+def test_replay_needs_a_recording(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        HTTPCassette(tmp_path, "replay")
+    with pytest.raises(ValueError):
+        http_cassette(record=tmp_path, replay=tmp_path)
+
+
+def test_record_and_replay_head_requests(tmp_path, mocker):
+    response = requests.Response()
+    response.status_code = 405
+    response._content = b""
+    mocker.patch("requests.head", return_value=response)
+    with http_cassette(record=tmp_path):
+        http_head("https://example.org")
+
+    mocker.patch("requests.head", side_effect=offline)
+    with http_cassette(replay=tmp_path):
+        assert http_head("https://example.org").status_code == 405
+        # A HEAD request isn't replayed for a GET request
+        with pytest.raises(ReplayMissError):
+            http_get("https://example.org")
@@ -0,0 +1,62 @@
+"""Guard the cold-start time of the console scripts.
+
+Each script module is imported in a fresh interpreter, which must not load
+heavy dependencies the script doesn't need, and must import within a
+(generous) time budget.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Seconds. Generous, so that only a large regression (e.g. importing the
+# whole package eagerly again) fails on a slow CI machine.
+IMPORT_BUDGET = 3.0
+
+HEAVY_MODULES = ("pydantic", "requests", "tqdm", "ruamel", "dotenv", "git")
+
+# Console script module -> heavy modules it may import
+SCRIPTS = {
+    "pyosmeta": (),
+    "pyosmeta.cli.fetch_rss_feed": ("requests",),
+    "pyosmeta.cli.parse_history": ("requests", "ruamel"),
+    "pyosmeta.cli.report_metrics": ("ruamel",),
+    "pyosmeta.cli.process_reviews": HEAVY_MODULES[:-1],
+    "pyosmeta.cli.update_contributors": HEAVY_MODULES[:-1],
+    "pyosmeta.cli.update_review_teams": HEAVY_MODULES[:-1],
+    "pyosmeta.cli.run": HEAVY_MODULES[:-1],
+    "pyosmeta.cli.serve_webhooks": HEAVY_MODULES[:-1],
+}
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps([time.perf_counter() - start, sorted(sys.modules)]))
+"""
+
+
+def cold_import(module: str) -> tuple[float, set[str]]:
+    """Import a module in a new interpreter and return the time it took
+    and the top-level modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    seconds, modules = json.loads(result.stdout.splitlines()[-1])
+    return seconds, {name.partition(".")[0] for name in modules}
+
+
+@pytest.mark.parametrize("module", SCRIPTS)
+def test_console_script_import(module):
+    if module == "pyosmeta.cli.report_metrics":
+        pytest.importorskip("numpy")
+    seconds, loaded = cold_import(module)
+
+    unexpected = set(HEAVY_MODULES) - set(SCRIPTS[module])
+    assert not loaded & unexpected
+    assert seconds < IMPORT_BUDGET
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from pyosmeta.instrumentation import (
+    http_get,
+    instrumented,
+    recorder,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    recorder.reset()
+    yield
+    recorder.reset()
+
+
+@pytest.fixture
+def mock_get(mocker):
+    response = Mock(status_code=200, content=b"12345")
+    response.headers = {"X-RateLimit-Remaining": "10"}
+    return mocker.patch("requests.get", return_value=response)
+
+
+@instrumented("fetch")
+def fetch(url, fail=False):
+    http_get(url, timeout=1)
+    if fail:
+        raise ValueError("boom")
+
+
+@instrumented("outer")
+def outer(url):
+    fetch(url)
+
+
+def test_records_calls_and_requests(mock_get):
+    fetch("https://example.org")
+    with pytest.raises(ValueError):
+        fetch("https://example.org", fail=True)
+
+    stats = recorder.report()["endpoints"]["fetch"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["requests"] == 2
+    assert stats["bytes"] == 10
+    assert stats["rate_limit_units"] == 2
+    assert stats["status_codes"] == {"200": 2}
+    assert sum(stats["latency_histogram"].values()) == 2
+    mock_get.assert_called_with("https://example.org", timeout=1)
+
+
+def test_failed_request(mocker):
+    mocker.patch("requests.get", side_effect=ConnectionError())
+
+    with pytest.raises(ConnectionError):
+        fetch("https://example.org")
+
+    assert recorder.report()["endpoints"]["fetch"]["status_codes"] == {
+        "error": 1
+    }
+
+
+def test_nested_requests_count_towards_outer_endpoint(mock_get):
+    outer("https://example.org")
+
+    endpoints = recorder.report()["endpoints"]
+    assert endpoints["outer"]["requests"] == 1
+    assert endpoints["fetch"]["calls"] == 1
+    assert endpoints["fetch"]["requests"] == 0
+
+
+def test_stages(mock_get):
+    with recorder.stage("get-metrics"):
+        fetch("https://example.org")
+        recorder.record_sleep(2.0)
+    with recorder.stage("save"):
+        pass
+
+    stages = recorder.report()["stages"]
+    assert list(stages) == ["get-metrics", "save"]
+    assert stages["get-metrics"]["requests"] == 1
+    assert stages["get-metrics"]["sleep_seconds"] == 2.0
+    assert stages["save"]["requests"] == 0
+    assert stages["save"]["runs"] == 1
+
+
+def test_requests_outside_a_stage(mock_get):
+    http_get("https://example.org")
+
+    report = recorder.report()
+    assert report["stages"] == {}
+    assert report["endpoints"]["other"]["requests"] == 1
+
+
+def test_thread_safety(mock_get):
+    threads = [
+        threading.Thread(target=fetch, args=("https://example.org",))
+        for _ in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert recorder.report()["endpoints"]["fetch"]["requests"] == 20
+
+
+def test_write_report(tmp_path, mock_get):
+    fetch("https://example.org")
+    report_path = tmp_path / "run_report.json"
+
+    recorder.write_report(report_path)
+
+    report = json.loads(report_path.read_text())
+    assert report["endpoints"]["fetch"]["calls"] == 1
+    assert "wall_seconds" in report
+
+
+def test_github_token_failover_counts_as_retry(mocker, monkeypatch):
+    from pyosmeta.github_api import GitHubAPI
+
+    exhausted = Mock(status_code=403, text="rate limited")
+    exhausted.headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "9999999999",
+    }
+    ok = Mock(status_code=200)
+    ok.headers = {"X-RateLimit-Remaining": "10"}
+    ok.json.return_value = {"login": "user"}
+    mocker.patch("requests.get", side_effect=[exhausted, ok])
+
+    api = GitHubAPI(tokens=["a", "b"])
+    api.get_user_info("user")
+
+    stats = recorder.report()["endpoints"]["GitHubAPI.get_user_info"]
+    assert stats["requests"] == 2
+    assert stats["retries"] == 1
+
+
+def test_records_coroutine_calls(mock_get):
+    @instrumented("async_fetch")
+    async def async_fetch(url):
+        await asyncio.to_thread(http_get, url)
+        await asyncio.sleep(0.01)
+
+    asyncio.run(async_fetch("https://example.org"))
+
+    stats = recorder.report()["endpoints"]["async_fetch"]
+    assert stats["calls"] == 1
+    assert stats["requests"] == 1
+    assert stats["seconds"] >= 0.01
@@ -0,0 +1,108 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from pyosmeta.link_probe import LinkProber, ProbeResult
+from pyosmeta.utils_clean import check_url
+
+
+class Handler(BaseHTTPRequestHandler):
+    # (method, path, Range header) of each request
+    requests = []
+
+    def _respond(self, body: bytes = b"") -> None:
+        self.requests.append(
+            (self.command, self.path, self.headers.get("Range"))
+        )
+        if self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/docs")
+        elif self.path == "/no-head" and self.command == "HEAD":
+            self.send_response(405)
+        elif self.path in ("/docs", "/no-head"):
+            self.send_response(206 if self.headers.get("Range") else 200)
+        else:
+            self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond()
+
+    def do_GET(self):
+        self._respond(b"x" * 100_000)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    Handler.requests = []
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_with_head(server_url):
+    result = LinkProber().probe(server_url + "/docs")
+
+    assert result
+    assert result.status == 200
+    assert result.method == "HEAD"
+    assert Handler.requests == [("HEAD", "/docs", None)]
+
+
+def test_probe_follows_redirects(server_url):
+    result = LinkProber().probe(server_url + "/moved")
+
+    assert result.ok
+    assert result.final_url == server_url + "/docs"
+    assert result.redirects == (server_url + "/moved",)
+
+
+def test_probe_falls_back_to_ranged_get(server_url):
+    result = LinkProber().probe(server_url + "/no-head")
+
+    assert result.ok
+    assert result.status == 206
+    assert result.method == "GET"
+    assert Handler.requests[-1] == ("GET", "/no-head", "bytes=0-0")
+
+
+def test_probe_broken_link(server_url):
+    result = LinkProber().probe(server_url + "/missing")
+
+    assert not result
+    assert result.status == 404
+    assert check_url(server_url + "/missing") is False
+
+
+def test_probe_connection_error(mocker):
+    mocker.patch("requests.head", side_effect=requests.ConnectTimeout)
+
+    result = LinkProber().probe("https://example.org")
+
+    assert result == ProbeResult(
+        "https://example.org",
+        ok=False,
+        latency=result.latency,
+        error="ConnectTimeout",
+    )
+
+
+def test_probe_many_checks_each_link_once(server_url):
+    urls = [server_url + "/docs", server_url + "/missing"] * 3
+
+    results = LinkProber(max_per_host=1).probe_many(urls)
+
+    assert {url: bool(result) for url, result in results.items()} == {
+        server_url + "/docs": True,
+        server_url + "/missing": False,
+    }
+    assert len(Handler.requests) == 3  # HEAD /docs, HEAD + GET /missing
@@ -0,0 +1,137 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from pyosmeta.metrics_store import MetricsStore
+from pyosmeta.models import GhMeta
+
+
+def gh_meta(stars, fetched_at, contrib_count=5):
+    return GhMeta(
+        name="pkg",
+        description="",
+        created_at="2020-01-01",
+        stargazers_count=stars,
+        watchers_count=stars,
+        open_issues_count=2,
+        forks_count=3,
+        documentation=None,
+        contrib_count=contrib_count,
+        last_commit="2026-10-01",
+        fetched_at=fetched_at,
+    )
+
+
+def at(day):
+    return datetime(2026, 10, day, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(tmp_path / "history")
+    store.append(
+        {
+            "SunPy": gh_meta(100, at(1).isoformat()),
+            "pandera": gh_meta(50, at(1).isoformat(), contrib_count=None),
+            "no-metrics": None,
+        }
+    )
+    store.append(
+        {
+            "SunPy": gh_meta(110, at(8).isoformat()),
+            "pandera": gh_meta(60, at(8).isoformat()),
+        }
+    )
+    return store
+
+
+def test_append(store):
+    assert len(store) == 4
+    assert store.packages() == ["sunpy", "pandera"]
+
+
+def test_query_package(store):
+    snapshots = store.query("sunpy")
+
+    assert [s.stargazers_count for s in snapshots] == [100, 110]
+    assert snapshots[0].snapshot_at == at(1)
+    assert snapshots[0].last_commit == date(2026, 10, 1)
+
+
+def test_query_range_across_packages(store):
+    snapshots = store.query(start=at(5), end=at(9))
+
+    assert [(s.package_name, s.stargazers_count) for s in snapshots] == [
+        ("sunpy", 110),
+        ("pandera", 60),
+    ]
+
+
+def test_missing_values(store):
+    assert store.query("pandera")[0].contrib_count is None
+    assert store.query("unknown") == []
+
+
+def test_unchanged_metrics_are_not_appended_again(store):
+    assert store.append({"sunpy": gh_meta(110, at(8).isoformat())}) == 0
+    assert len(store) == 4
+
+
+def test_metrics_without_fetch_time_use_snapshot_time(tmp_path):
+    store = MetricsStore(tmp_path)
+
+    store.append({"sunpy": gh_meta(1, None)}, snapshot_at=at(3))
+
+    assert store.last_snapshot_at("SunPy") == at(3)
+
+
+@pytest.mark.parametrize("fetched_at", ["yesterday", "2026-13-45"])
+def test_unparseable_fetch_time_uses_snapshot_time(tmp_path, fetched_at):
+    store = MetricsStore(tmp_path)
+
+    assert store.append({"sunpy": gh_meta(1, fetched_at)}, at(3)) == 1
+    assert store.last_snapshot_at("sunpy") == at(3)
+
+
+def test_metrics_without_fetch_time_are_only_stored_once(tmp_path):
+    store = MetricsStore(tmp_path)
+
+    store.append({"sunpy": gh_meta(1, None)}, snapshot_at=at(3))
+    assert store.append({"sunpy": gh_meta(1, None)}, snapshot_at=at(4)) == 0
+    assert store.append({"sunpy": gh_meta(1, "yesterday")}, at(5)) == 0
+
+    assert len(store) == 1
+
+
+def test_naive_fetch_time_is_utc(tmp_path):
+    store = MetricsStore(tmp_path)
+
+    store.append({"sunpy": gh_meta(1, "2026-10-03T00:00:00")})
+
+    assert store.last_snapshot_at("sunpy") == at(3)
+
+
+def test_query_range_within_package(store):
+    store.append({"sunpy": gh_meta(120, at(15).isoformat())})
+
+    snapshots = store.query("sunpy", start=at(2), end=at(15))
+
+    assert [s.stargazers_count for s in snapshots] == [110]
+
+
+def test_reopen(store):
+    reopened = MetricsStore(store.path)
+
+    assert reopened.query("pandera") == store.query("pandera")
+
+
+def test_interrupted_append_is_dropped(store):
+    # Simulate a crash after writing only some columns of a new row
+    with open(store.path / "snapshot_at.bin", "ab") as f:
+        f.write(b"\x00" * 12)
+
+    reopened = MetricsStore(store.path)
+
+    assert len(reopened) == 4
+    reopened.append({"sunpy": gh_meta(120, at(15).isoformat())})
+    assert MetricsStore(store.path).query("sunpy")[-1].stargazers_count == 120
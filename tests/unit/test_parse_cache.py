@@ -0,0 +1,99 @@
+import pickle
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pyosmeta.models.github import Labels
+from pyosmeta.parse_cache import ParseCache, issue_key, parser_version
+
+pytestmark = pytest.mark.usefixtures("no_link_checks")
+
+
+@pytest.fixture
+def cached_process_issues(process_issues, tmp_path):
+    process_issues.parse_cache = ParseCache(tmp_path / "parsed.pickle")
+    return process_issues
+
+
+def test_reuses_review_of_unchanged_issue(
+    cached_process_issues, issue_list, mocker
+):
+    parse = mocker.spy(cached_process_issues, "_parse_issue")
+
+    first = cached_process_issues.parse_issue(issue_list[0])
+    second = cached_process_issues.parse_issue(issue_list[0])
+
+    assert parse.call_count == 1
+    assert second == first
+    # Each hit is a new copy, so updating gh_meta doesn't change the cache
+    assert second is not first
+
+
+def test_hit_takes_dates_from_the_issue(cached_process_issues, issue_list):
+    cached_process_issues.parse_issue(issue_list[0])
+    closed_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    commented = issue_list[0].model_copy(
+        update={"updated_at": closed_at, "closed_at": closed_at}
+    )
+
+    review = cached_process_issues.parse_issue(commented)
+
+    assert cached_process_issues.parse_cache.hits == 1
+    assert review.updated_at == closed_at
+    assert review.closed_at == closed_at
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"body": "Package Name: edited\r\n"},
+        {"labels": [Labels(name="6/pyOS-approved"), Labels(name="archived")]},
+    ],
+)
+def test_key_changes_with_body_and_labels(issue_list, update):
+    assert issue_key(issue_list[0]) != issue_key(
+        issue_list[0].model_copy(update=update)
+    )
+
+
+def test_saved_cache_is_reloaded(cached_process_issues, issue_list, tmp_path):
+    review = cached_process_issues.parse_issue(issue_list[0])
+    cached_process_issues.parse_cache.save()
+
+    cache = ParseCache(tmp_path / "parsed.pickle")
+
+    assert len(cache) == 1
+    assert cache.get(issue_list[0]) == review
+
+
+def test_cache_from_another_parser_is_ignored(issue_list, tmp_path):
+    path = tmp_path / "parsed.pickle"
+    with open(path, "wb") as f:
+        pickle.dump(
+            {"version": "old", "entries": {issue_key(issue_list[0]): b""}}, f
+        )
+
+    assert len(ParseCache(path)) == 0
+    assert len(parser_version()) == 64
+
+
+def test_unresolved_doi_is_not_cached(
+    cached_process_issues, issue_list, mocker
+):
+    # doi.org is down, so the archive is left as the doi.org link
+    mocker.patch("pyosmeta.utils_clean.is_doi", return_value=None)
+
+    review = cached_process_issues.parse_issue(issue_list[0])
+
+    assert review.archive == "https://doi.org/10.5281/zenodo.8384174"
+    assert len(cached_process_issues.parse_cache) == 0
+
+
+def test_entries_expire(cached_process_issues, issue_list, mocker):
+    clock = mocker.patch("time.time", return_value=1_000_000.0)
+    cached_process_issues.parse_cache.max_age = timedelta(days=1)
+    cached_process_issues.parse_issue(issue_list[0])
+
+    clock.return_value += timedelta(days=2).total_seconds()
+
+    assert cached_process_issues.parse_cache.get(issue_list[0]) is None
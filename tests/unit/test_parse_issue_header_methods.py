@@ -81,3 +81,54 @@ def test_keyed_string(text, expected):
         assert matched == expected
     else:
         assert matched is None
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        pytest.param(
+            "Package Name: sunpy", {"package_name": "sunpy"}, id="base"
+        ),
+        pytest.param(
+            "**Package Name:** sunpy", {"package_name": "sunpy"}, id="bolded"
+        ),
+        pytest.param(
+            "Repository Link: https://github.com/sunpy/sunpy",
+            {"repository_link": "https://github.com/sunpy/sunpy"},
+            id="url-colon",
+        ),
+        pytest.param(
+            "JOSS DOI: 10.21105/joss.01832",
+            {"joss": "10.21105/joss.01832"},
+            id="alias",
+        ),
+        pytest.param(
+            "Date accepted (month/day/year): 01/18/2024",
+            {"date_accepted": "01/18/2024"},
+            id="prefix-alias",
+        ),
+        pytest.param(
+            "Date accepted (month-day-year): 01-18-2024",
+            {"date_accepted": "01-18-2024"},
+            id="prefix-alias-dashes",
+        ),
+        pytest.param("\n---\nnot a field", {}, id="no-fields"),
+    ],
+)
+def test_header_as_dict_keys(process_issues, header, expected):
+    """Header keys are put in canonical form, including template aliases"""
+    assert process_issues._header_as_dict(header) == expected
+
+
+def test_parse_field_dispatch(process_issues):
+    """Role fields parse to users, other fields have markdown removed,
+    and the parser for a new key is resolved once and then cached."""
+    editor = process_issues._parse_field("editor", "@cmarmo")
+    assert editor.github_username == "cmarmo"
+
+    assert process_issues._parse_field("version_accepted", "**1.0**") == "1.0"
+    assert "version_accepted" in process_issues._field_parsers
+
+    # Role fields from older templates are still recognized as users
+    reviewer = process_issues._parse_field("reviewer_(lead)", "@someone")
+    assert reviewer.github_username == "someone"
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from pyosmeta.cli import run as run_cli
+from pyosmeta.pipeline import PipelineError, PipelineStage, run_pipeline
+
+
+def test_run_pipeline_in_dependency_order():
+    # The two independent stages wait for each other, so they only finish
+    # if they run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch(value):
+        def run(inputs):
+            barrier.wait()
+            return value
+
+        return run
+
+    stages = [
+        PipelineStage(
+            "merge",
+            lambda inputs: inputs["a"] + inputs["b"],
+            depends_on=("a", "b"),
+        ),
+        PipelineStage("a", fetch(1)),
+        PipelineStage("b", fetch(2)),
+    ]
+    assert run_pipeline(stages) == {"a": 1, "b": 2, "merge": 3}
+
+
+def test_run_pipeline_subset():
+    stages = [
+        PipelineStage("a", lambda inputs: 1),
+        PipelineStage("b", lambda inputs: inputs, depends_on=("a",)),
+    ]
+    assert run_pipeline(stages, selected=["b"]) == {"b": {}}
+    with pytest.raises(ValueError, match="Unknown"):
+        run_pipeline(stages, selected=["c"])
+
+
+def test_run_pipeline_failure_skips_dependents():
+    ran = []
+
+    def fail(inputs):
+        raise ValueError("boom")
+
+    stages = [
+        PipelineStage("a", fail),
+        PipelineStage("b", lambda inputs: ran.append("b")),
+        PipelineStage("c", lambda inputs: ran.append("c"), depends_on=("a",)),
+    ]
+    with pytest.raises(PipelineError, match="a, c") as err:
+        run_pipeline(stages)
+    assert isinstance(err.value.__cause__, ValueError)
+    assert ran == ["b"]
+
+
+def test_run_pipeline_rejects_cycles():
+    stages = [
+        PipelineStage("a", lambda inputs: 1, depends_on=("b",)),
+        PipelineStage("b", lambda inputs: 2, depends_on=("a",)),
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+        run_pipeline(stages)
+
+
+def test_run_cli_hands_results_over_in_memory(mocker):
+    reviews = mocker.patch.object(
+        run_cli, "update_reviews", return_value={"pkg": "review"}
+    )
+    contribs = mocker.patch.object(
+        run_cli, "update_contributors", return_value={"user": "person"}
+    )
+    teams = mocker.patch.object(run_cli, "update_review_teams")
+
+    run_cli.main(["run"])
+
+    assert reviews.call_args.kwargs == {"save": False}
+    assert contribs.call_args.kwargs == {"save": False}
+    teams.assert_called_once_with(
+        contribs={"user": "person"}, packages={"pkg": "review"}
+    )
+
+
+def test_run_cli_subset_saves_pickles(mocker):
+    reviews = mocker.patch.object(run_cli, "update_reviews")
+    contribs = mocker.patch.object(run_cli, "update_contributors")
+    teams = mocker.patch.object(run_cli, "update_review_teams")
+
+    run_cli.main(["run", "--stages", "reviews"])
+
+    assert reviews.call_args.kwargs == {"save": True}
+    contribs.assert_not_called()
+    teams.assert_not_called()
@@ -0,0 +1,63 @@
+import json
+import pstats
+import socket
+import time
+
+import pytest
+
+from pyosmeta.instrumentation import recorder
+from pyosmeta.profiling import profile_run
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    recorder.reset()
+    yield
+    recorder.reset()
+
+
+def busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def wait_on_socket(seconds):
+    """Block in socket.py, like a request waiting on a slow server."""
+    left, right = socket.socketpair()
+    with left, right:
+        left.settimeout(seconds)
+        with pytest.raises(TimeoutError):
+            left.makefile("rb").read(1)
+
+
+def test_profile_run(tmp_path):
+    with profile_run(tmp_path):
+        with recorder.stage("parse"):
+            busy(0.1)
+        with recorder.stage("fetch"):
+            wait_on_socket(0.1)
+
+    assert {"main.pstats", "parse.pstats", "fetch.pstats"} <= {
+        path.name for path in tmp_path.iterdir()
+    }
+    parse_stats = pstats.Stats(str(tmp_path / "parse.pstats"))
+    assert any(func[2] == "busy" for func in parse_stats.stats)
+
+    folded = (tmp_path / "profile.folded").read_text().splitlines()
+    assert any(line.startswith("parse;cpu;") for line in folded)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+
+    summary = json.loads((tmp_path / "profile_summary.json").read_text())
+    assert summary["parse"]["sampled_cpu_seconds"] > 0
+    assert summary["fetch"]["sampled_network_wait_seconds"] > 0
+    assert summary["fetch"]["wall_seconds"] >= 0.1
+
+
+def test_profile_run_disabled(tmp_path):
+    with profile_run(None):
+        with recorder.stage("parse"):
+            pass
+
+    assert recorder._stage_listeners == []
+    assert list(tmp_path.iterdir()) == []
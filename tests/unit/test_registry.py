@@ -0,0 +1,138 @@
+from unittest.mock import Mock
+
+import pytest
+
+from pyosmeta.contributors import ProcessContributors
+from pyosmeta.models import PersonModel, ReviewModel, ReviewUser
+from pyosmeta.registry import ContributorRegistry
+
+
+@pytest.fixture
+def people():
+    return [
+        PersonModel(
+            github_username="Alice",
+            name="Alice A",
+            contributor_type=["reviewer", "peer-review"],
+            packages_reviewed=["sunpy"],
+            date_added="2026-01-15",
+        ),
+        PersonModel(
+            github_username="bob",
+            contributor_type=["editor", "peer-review"],
+            packages_editor=["sunpy", "pandera"],
+            date_added="2026-10-02",
+        ),
+        PersonModel(github_username="carol", contributor_type=["community"]),
+    ]
+
+
+@pytest.fixture
+def registry(people):
+    return ContributorRegistry(people)
+
+
+@pytest.fixture
+def contrib_types():
+    return ProcessContributors(Mock(), []).contrib_types
+
+
+def usernames(people):
+    return [person.github_username for person in people]
+
+
+def test_lookup_is_case_insensitive(registry):
+    assert "ALICE" in registry
+    assert registry["alice"].name == "Alice A"
+    assert registry.get("dave") is None
+    assert len(registry) == 3
+
+
+def test_people_for_package(registry):
+    assert usernames(registry.people_for_package("SunPy")) == ["Alice", "bob"]
+    assert usernames(registry.people_for_package("sunpy", "reviewer")) == [
+        "Alice"
+    ]
+    assert registry.people_for_package("unknown") == []
+    assert registry.roles_for_package("sunpy") == {
+        "reviewer": ["alice"],
+        "editor": ["bob"],
+    }
+
+
+def test_people_by_type(registry):
+    assert usernames(registry.people_by_type("peer-review")) == [
+        "Alice",
+        "bob",
+    ]
+
+
+def test_added_since(registry):
+    assert usernames(registry.added_since("2026-10-01")) == ["bob"]
+    assert usernames(registry.added_since("2020-01-01")) == ["Alice", "bob"]
+
+
+def test_upsert_replaces_index_entries(registry):
+    registry.upsert(
+        PersonModel(github_username="bob", packages_reviewed=["pygmt"])
+    )
+
+    assert registry.roles_for_package("sunpy") == {"reviewer": ["alice"]}
+    assert usernames(registry.people_for_package("pygmt")) == ["bob"]
+    assert registry.added_since("2026-10-01") == []
+
+
+def test_add_contribution(registry):
+    registry.add_contribution(
+        "carol", "PyGMT", "packages_submitted", ["maintainer", "peer-review"]
+    )
+
+    assert registry["carol"].packages_submitted == {"pygmt"}
+    assert usernames(registry.people_for_package("pygmt", "maintainer")) == [
+        "carol"
+    ]
+    assert "carol" in usernames(registry.people_by_type("peer-review"))
+
+
+def test_upsert_review_teams(registry, contrib_types):
+    review = ReviewModel(
+        package_name="PyGMT",
+        repository_link="https://github.com/GenericMappingTools/pygmt",
+        editor=ReviewUser(github_username="bob", name=""),
+        reviewers=[
+            ReviewUser(github_username="alice", name=""),
+            ReviewUser(github_username="dave", name="Dave D"),
+        ],
+    )
+
+    def new_person(gh_user):
+        return PersonModel(github_username=gh_user, date_added="2026-10-19")
+
+    reviews = registry.upsert_review_teams(
+        {"PyGMT": review}, contrib_types, new_person
+    )
+
+    assert registry.roles_for_package("pygmt") == {
+        "editor": ["bob"],
+        "reviewer": ["alice", "dave"],
+    }
+    assert "reviewer" in registry["dave"].contributor_type
+    assert usernames(registry.added_since("2026-10-19")) == ["dave"]
+    # Names are filled in from the registry
+    assert reviews["PyGMT"].reviewers[0].name == "Alice A"
+    assert reviews["PyGMT"].reviewers[1].name == "Dave D"
+
+
+def test_upsert_review_teams_skips_invalid_new_people(registry, contrib_types):
+    review = ReviewModel(
+        package_name="pygmt",
+        repository_link="https://github.com/GenericMappingTools/pygmt",
+        reviewers=[ReviewUser(github_username="dave", name="")],
+    )
+
+    registry.upsert_review_teams(
+        {"pygmt": review}, contrib_types, lambda gh_user: None
+    )
+
+    assert "dave" not in registry
+    assert review.reviewers[0].github_username == "dave"
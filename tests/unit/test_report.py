@@ -0,0 +1,157 @@
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pyosmeta.cli.report_metrics import main  # noqa: E402
+from pyosmeta.report import (  # noqa: E402
+    PackageTable,
+    build_report,
+    describe,
+    report_to_csv,
+)
+
+AS_OF = date(2026, 10, 19)
+
+
+def gh_meta(stars, forks, contribs, last_commit):
+    return {
+        "name": "pkg",
+        "stargazers_count": stars,
+        "forks_count": forks,
+        "watchers_count": stars,
+        "open_issues_count": 1,
+        "contrib_count": contribs,
+        "last_commit": last_commit,
+        "created_at": "2020-01-01",
+    }
+
+
+@pytest.fixture
+def packages():
+    return [
+        {
+            "package_name": "sunpy",
+            "categories": ["data-processing-munging"],
+            "partners": ["astropy"],
+            "gh_meta": gh_meta(900, 500, 150, "2026-10-01"),
+        },
+        {
+            "package_name": "pandera",
+            "categories": [
+                "data-validation-testing",
+                "data-processing-munging",
+            ],
+            "gh_meta": gh_meta(3000, 300, 50, "2025-01-01"),
+        },
+        {
+            "package_name": "old-pkg",
+            "categories": ["data-validation-testing"],
+            "active": False,
+            "gh_meta": gh_meta(10, 1, None, "2022-10-19"),
+        },
+        # Not fetched yet
+        {"package_name": "new-pkg", "gh_meta": None},
+    ]
+
+
+@pytest.fixture
+def report(packages):
+    return build_report(PackageTable.from_packages(packages), as_of=AS_OF)
+
+
+def test_table_columns(packages):
+    table = PackageTable.from_packages(packages)
+
+    assert len(table) == 4
+    assert table.active.tolist() == [True, True, False, True]
+    assert np.isnan(table.counts["contrib_count"][2])
+    assert np.isnat(table.last_commit[3])
+    assert table.category_rows.tolist() == [0, 1, 1, 2]
+
+
+def test_describe_ignores_missing():
+    summary = describe(np.array([1.0, np.nan, 3.0]))
+
+    assert summary["count"] == 2
+    assert summary["total"] == 4.0
+    assert summary["p50"] == 2.0
+
+
+def test_describe_without_values():
+    summary = describe(np.array([np.nan]))
+
+    assert summary["count"] == 0
+    assert summary["mean"] is None
+
+
+def test_package_counts(report):
+    assert report["packages"] == {
+        "total": 4,
+        "active": 3,
+        "archived": 1,
+        "with_gh_meta": 3,
+    }
+
+
+def test_distributions(report):
+    stars = report["distributions"]["stargazers_count"]
+    assert stars["count"] == 3
+    assert stars["max"] == 3000.0
+    assert stars["p50"] == 900.0
+    assert report["distributions"]["contrib_count"]["total"] == 200.0
+
+    days = report["distributions"]["days_since_last_commit"]
+    assert days["min"] == 18.0
+    assert days["max"] == 1461.0
+
+
+def test_group_totals(report):
+    assert report["by_category"]["data-processing-munging"] == {
+        "packages": 2,
+        "stargazers_count": 3900.0,
+        "contrib_count": 200.0,
+    }
+    assert report["by_category"]["data-validation-testing"]["packages"] == 2
+    assert report["by_partner"] == {
+        "astropy": {
+            "packages": 1,
+            "stargazers_count": 900.0,
+            "contrib_count": 150.0,
+        }
+    }
+
+
+def test_stale_packages_are_stalest_first(report):
+    assert [pkg["package_name"] for pkg in report["stale_packages"]] == [
+        "old-pkg",
+        "pandera",
+    ]
+
+
+def test_report_to_csv(report):
+    rows = list(csv.DictReader(io.StringIO(report_to_csv(report))))
+
+    assert {
+        "section": "stale_packages",
+        "name": "old-pkg",
+        "metric": "days_since_last_commit",
+        "value": "1461",
+    } in rows
+
+
+def test_cli_json(tmp_path, packages, capsys):
+    from ruamel.yaml import YAML
+
+    packages_file = tmp_path / "packages.yml"
+    YAML(typ="safe").dump(packages, packages_file)
+
+    main(["--packages", str(packages_file), "--as-of", "2026-10-19"])
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["packages"]["total"] == 4
+    assert report["as_of"] == "2026-10-19"
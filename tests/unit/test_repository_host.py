@@ -0,0 +1,89 @@
+"""Tests for repository URL parsing used by RepositoryHost."""
+
+import pytest
+
+from pyosmeta.models.base import (
+    RepositoryHost,
+    RepositoryUrl,
+    parse_repository_url,
+)
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        (
+            "https://github.com/sunpy/sunpy",
+            RepositoryUrl(RepositoryHost.github, "sunpy", "sunpy"),
+        ),
+        (
+            "https://github.com/sunpy/sunpy.git",
+            RepositoryUrl(RepositoryHost.github, "sunpy", "sunpy"),
+        ),
+        (
+            "https://github.com/sunpy/sunpy/tree/main/docs",
+            RepositoryUrl(RepositoryHost.github, "sunpy", "sunpy"),
+        ),
+        (
+            "http://www.github.com/sunpy/sunpy/",
+            RepositoryUrl(RepositoryHost.github, "sunpy", "sunpy"),
+        ),
+        (
+            "git@github.com:sunpy/sunpy.git",
+            RepositoryUrl(RepositoryHost.github, "sunpy", "sunpy"),
+        ),
+        (
+            "https://gitlab.com/group/subgroup/project",
+            RepositoryUrl(RepositoryHost.gitlab, "group/subgroup", "project"),
+        ),
+        (
+            "https://gitlab.com/group/project/-/tree/main",
+            RepositoryUrl(RepositoryHost.gitlab, "group", "project"),
+        ),
+        (
+            "https://gitlab.com/group/repo/tree/main",
+            RepositoryUrl(RepositoryHost.gitlab, "group", "repo"),
+        ),
+        (
+            "https://gitlab.com/group/subgroup/repo/merge_requests/12",
+            RepositoryUrl(RepositoryHost.gitlab, "group/subgroup", "repo"),
+        ),
+        (
+            "https://gitlab.com/group/repo/blob/main/README.md",
+            RepositoryUrl(RepositoryHost.gitlab, "group", "repo"),
+        ),
+        (
+            "https://codeberg.org/owner/repo",
+            RepositoryUrl(RepositoryHost.codeberg, "owner", "repo"),
+        ),
+        (
+            "https://bitbucket.org/owner/repo/src/main/",
+            RepositoryUrl(RepositoryHost.bitbucket, "owner", "repo"),
+        ),
+        (
+            "https://example.org/owner/repo",
+            RepositoryUrl(RepositoryHost.other, "owner", "repo"),
+        ),
+        (
+            "https://github.com/sunpy",
+            RepositoryUrl(RepositoryHost.github, None, None),
+        ),
+        ("not a url", RepositoryUrl(RepositoryHost.other, None, None)),
+    ],
+)
+def test_parse_repository_url(url, expected):
+    assert parse_repository_url(url) == expected
+
+
+def test_repository_host_from_url():
+    assert (
+        RepositoryHost.from_url("https://gitlab.com/a/b")
+        == RepositoryHost.gitlab
+    )
+    assert RepositoryHost.from_url("") == RepositoryHost.other
+
+
+def test_parse_url_unparseable():
+    """parse_url raises if there's no owner/repo to build an endpoint from"""
+    with pytest.raises(ValueError, match="Could not parse owner/repo"):
+        RepositoryHost.github.parse_url("https://github.com/sunpy")
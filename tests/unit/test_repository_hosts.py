@@ -0,0 +1,266 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+import pytest
+
+from pyosmeta.models.base import GhMeta, RepositoryHost
+from pyosmeta.repository_hosts import (
+    BACKENDS,
+    BitbucketBackend,
+    CodebergBackend,
+    GitHubBackend,
+    GitLabBackend,
+    HostRateLimiter,
+    RepositoryBackend,
+    fetch_repo_metas,
+)
+
+
+class FakeHost:
+    """A local HTTP server answering GETs from a dict of routes.
+
+    Routes map a path (with its query string, if any) to a status and JSON
+    body, and optionally headers. Requests are recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.requests.append((self.path, dict(self.headers)))
+                path = unquote(self.path)
+                route = fake.routes.get(path)
+                if route is None:
+                    route = fake.routes.get(urlsplit(path).path, (404, {}))
+                status, body, *headers = route
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                for name, value in (headers[0] if headers else {}).items():
+                    self.send_header(name, value.format(url=fake.url))
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("localhost", 0), Handler)
+        self.url = f"http://localhost:{self.server.server_port}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True
+        )
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def fake_host():
+    host = FakeHost()
+    yield host
+    host.close()
+
+
+REPO_INFO = {"owner": "group/subgroup", "repo_name": "project"}
+
+
+def test_registry_covers_every_supported_host():
+    assert set(BACKENDS) == {
+        RepositoryHost.github,
+        RepositoryHost.gitlab,
+        RepositoryHost.codeberg,
+        RepositoryHost.bitbucket,
+    }
+
+
+def test_gitlab_backend(fake_host):
+    project = "/api/v4/projects/group/subgroup/project"
+    fake_host.routes[project] = (
+        200,
+        {
+            "name": "project",
+            "description": "A GitLab project",
+            "created_at": "2020-01-02T03:04:05.000Z",
+            "star_count": 12,
+            "forks_count": 3,
+            "open_issues_count": 4,
+            "last_activity_at": "2024-05-06T07:08:09.000Z",
+        },
+    )
+    contributors = f"{project}/repository/contributors"
+    fake_host.routes[f"{contributors}?per_page=100"] = (
+        200,
+        [{"name": "a"}, {"name": "b"}],
+        {"Link": "<{url}" + contributors + '?page=2>; rel="next"'},
+    )
+    fake_host.routes[f"{contributors}?page=2"] = (200, [{"name": "c"}])
+    backend = GitLabBackend(api_url=fake_host.url + "/api/v4", token="abc")
+
+    metrics = backend.get_repo_meta(REPO_INFO)
+
+    assert metrics["stargazers_count"] == metrics["watchers_count"] == 12
+    assert metrics["contrib_count"] == 3
+    assert metrics["documentation"] is None
+    gh_meta = GhMeta(**metrics)
+    assert gh_meta.created_at == "2020-01-02"
+    assert gh_meta.last_commit == "2024-05-06"
+    # The project path is URL-encoded, and the token sent
+    path, headers = fake_host.requests[0]
+    assert path == "/api/v4/projects/group%2Fsubgroup%2Fproject"
+    assert headers["PRIVATE-TOKEN"] == "abc"
+
+
+def test_gitlab_backend_not_found(fake_host):
+    backend = GitLabBackend(api_url=fake_host.url, token="")
+
+    assert backend.get_repo_meta(REPO_INFO) is None
+    assert "PRIVATE-TOKEN" not in fake_host.requests[0][1]
+
+
+def test_codeberg_backend(fake_host):
+    fake_host.routes["/api/v1/repos/owner/repo"] = (
+        200,
+        {
+            "name": "repo",
+            "description": "A Codeberg repo",
+            "created_at": "2021-01-01T00:00:00Z",
+            "updated_at": "2024-02-02T00:00:00Z",
+            "stars_count": 5,
+            "watchers_count": 2,
+            "open_issues_count": 1,
+            "forks_count": 0,
+            "website": "",
+        },
+    )
+    backend = CodebergBackend(api_url=fake_host.url + "/api/v1")
+
+    metrics = backend.get_repo_meta({"owner": "owner", "repo_name": "repo"})
+
+    gh_meta = GhMeta(**metrics)
+    assert gh_meta.stargazers_count == 5
+    assert gh_meta.watchers_count == 2
+    assert gh_meta.documentation is None
+    assert gh_meta.contrib_count is None
+    assert gh_meta.last_commit == "2024-02-02"
+
+
+def test_bitbucket_backend(fake_host):
+    repo = "/2.0/repositories/workspace/repo"
+    fake_host.routes[repo] = (
+        200,
+        {
+            "name": "repo",
+            "description": "A Bitbucket repo",
+            "created_on": "2013-05-21T17:27:40.491373+00:00",
+            "updated_on": "2024-03-03T00:00:00.000000+00:00",
+            "website": "https://repo.example.org",
+            "has_issues": True,
+        },
+    )
+    fake_host.routes[f"{repo}/watchers"] = (200, {"size": 7, "values": []})
+    fake_host.routes[f"{repo}/forks"] = (200, {"size": 2, "values": []})
+    fake_host.routes[f"{repo}/issues"] = (200, {"size": 4, "values": []})
+    backend = BitbucketBackend(api_url=fake_host.url + "/2.0")
+
+    metrics = backend.get_repo_meta(
+        {"owner": "workspace", "repo_name": "repo"}
+    )
+
+    gh_meta = GhMeta(**metrics)
+    assert gh_meta.stargazers_count == gh_meta.watchers_count == 7
+    assert gh_meta.forks_count == 2
+    assert gh_meta.open_issues_count == 4
+    assert gh_meta.created_at == "2013-05-21"
+    issues_query = [
+        unquote(path) for path, _ in fake_host.requests if "issues" in path
+    ]
+    assert 'state="open"' in issues_query[0]
+
+
+def test_retries_after_rate_limit(fake_host):
+    route = "/api/v1/repos/owner/repo"
+    responses = [
+        (429, {}, {"Retry-After": "0"}),
+        (200, {"name": "repo"}),
+    ]
+
+    class Routes(dict):
+        def get(self, path, default=None):
+            if path == route:
+                return responses.pop(0)
+            return default
+
+    fake_host.routes = Routes()
+    backend = CodebergBackend(api_url=fake_host.url + "/api/v1")
+
+    response = backend._get("/repos/owner/repo")
+
+    assert response.status_code == 200
+    assert len(fake_host.requests) == 2
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = HostRateLimiter(max_concurrency=2, min_interval=0.05)
+    starts = []
+
+    def request():
+        with limiter.slot():
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    assert starts[2] - starts[0] >= 0.09
+
+
+def test_fetch_repo_metas_limits_each_host():
+    class SlowBackend(RepositoryBackend):
+        host = RepositoryHost.codeberg
+        max_concurrency = 1
+
+        def get_repo_meta(self, repo_info):
+            time.sleep(0.2)
+            return {"name": repo_info["repo_name"]}
+
+    class FailingBackend(SlowBackend):
+        host = RepositoryHost.bitbucket
+
+        def get_repo_meta(self, repo_info):
+            raise ValueError("broken")
+
+    slow, failing = SlowBackend(), FailingBackend()
+    jobs = {
+        "a": (slow, {"owner": "o", "repo_name": "a"}),
+        "b": (slow, {"owner": "o", "repo_name": "b"}),
+        "c": (failing, {"owner": "o", "repo_name": "c"}),
+    }
+
+    start = time.monotonic()
+    results = fetch_repo_metas(jobs)
+
+    assert results == {"a": {"name": "a"}, "b": {"name": "b"}, "c": None}
+    # One host's requests are made one at a time
+    assert time.monotonic() - start >= 0.4
+
+
+def test_github_backend_uses_github_api(mocker):
+    github_api = mocker.Mock()
+    github_api.get_repo_meta_github.return_value = {"name": "sunpy"}
+
+    backend = GitHubBackend(github_api=github_api)
+
+    assert backend.get_repo_meta(REPO_INFO) == {"name": "sunpy"}
+    github_api.get_repo_meta_github.assert_called_once_with(REPO_INFO)
@@ -0,0 +1,156 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from pyosmeta.github_api import GitHubAPI
+from pyosmeta.parse_issues import ProcessIssues
+from pyosmeta.review_sources import (
+    IssueStore,
+    ReviewSource,
+    fetch_source_issues,
+    repository_url,
+)
+
+pytestmark = pytest.mark.usefixtures("no_link_checks")
+
+
+def make_issue(number, updated_at, repo="software-submission"):
+    return {
+        "number": number,
+        "updated_at": updated_at,
+        "repository_url": repository_url("pyopensci", repo),
+        "labels": [],
+    }
+
+
+@pytest.mark.parametrize(
+    "spec, expected",
+    [
+        (
+            "pyopensci/software-submission",
+            ("pyopensci", "software-submission"),
+        ),
+        ("pyopensci", ("pyopensci", None)),
+        ("pyopensci/", ("pyopensci", None)),
+    ],
+)
+def test_parse_review_source(spec, expected):
+    source = ReviewSource.parse(spec)
+    assert (source.org, source.repo) == expected
+
+
+def test_parse_invalid_review_source():
+    with pytest.raises(ValueError, match="Invalid review source"):
+        ReviewSource.parse("a/b/c")
+
+
+def test_issue_store_watermark(tmp_path):
+    store = IssueStore(tmp_path)
+    assert store.watermark("pyopensci", "software-submission") is None
+
+    store.update(
+        "pyopensci",
+        "software-submission",
+        [
+            make_issue(1, "2024-01-01T00:00:00Z"),
+            make_issue(2, "2024-03-01T00:00:00Z"),
+        ],
+    )
+    issues = store.update(
+        "pyopensci",
+        "software-submission",
+        [make_issue(1, "2024-02-01T00:00:00Z")],
+    )
+
+    assert len(issues) == 2
+    reloaded = IssueStore(tmp_path)
+    assert (
+        reloaded.watermark("pyopensci", "software-submission")
+        == "2024-03-01T00:00:00Z"
+    )
+    assert {
+        issue["updated_at"]
+        for issue in reloaded.issues("pyopensci", "software-submission")
+    } == {"2024-02-01T00:00:00Z", "2024-03-01T00:00:00Z"}
+
+
+def test_fetch_source_issues(mocker, tmp_path):
+    github_api = GitHubAPI()
+    responses = {
+        "https://api.github.com/orgs/partner/repos?per_page=100": [
+            {"name": "reviews", "has_issues": True},
+            {"name": "website", "has_issues": False},
+        ],
+    }
+
+    def get_response_rest(url):
+        if url in responses:
+            return responses[url]
+        repo = url.split("/")[5]
+        return [make_issue(len(url), "2024-01-01T00:00:00Z", repo)]
+
+    get = mocker.patch.object(
+        github_api, "_get_response_rest", side_effect=get_response_rest
+    )
+    sources = [
+        ReviewSource("pyopensci", "software-submission"),
+        ReviewSource("partner"),
+    ]
+    store = IssueStore(tmp_path)
+
+    issues, ranks = fetch_source_issues(github_api, sources, store)
+
+    assert len(issues) == 2
+    assert ranks == {
+        "https://api.github.com/repos/pyopensci/software-submission": 0,
+        "https://api.github.com/repos/partner/reviews": 1,
+    }
+
+    # The next run only asks for the issues updated since
+    get.reset_mock()
+    fetch_source_issues(github_api, sources[:1], store)
+    get.assert_called_once_with(
+        "https://api.github.com/repos/pyopensci/software-submission/issues"
+        "?state=all&per_page=100&since=2024-01-01T00:00:00Z"
+    )
+
+
+def test_duplicate_reviews_keep_first_source(issue_list):
+    sunpy = issue_list[0]
+    partner_sunpy = sunpy.model_copy(
+        update={
+            "url": "https://api.github.com/repos/partner/reviews/issues/1",
+            "repository_url": "https://api.github.com/repos/partner/reviews",
+            "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        }
+    )
+    process_issues = ProcessIssues(
+        GitHubAPI(),
+        sources=[
+            ReviewSource("pyOpenSci", "software-submission"),
+            ReviewSource("partner", "reviews"),
+        ],
+    )
+    process_issues._source_ranks = {
+        "https://api.github.com/repos/pyopensci/software-submission": 0,
+        "https://api.github.com/repos/partner/reviews": 1,
+    }
+
+    for issues in ([sunpy, partner_sunpy], [partner_sunpy, sunpy]):
+        reviews, _ = process_issues.parse_issues(issues)
+        assert "software-submission" in reviews["sunpy"].issue_link
+
+
+def test_duplicate_reviews_keep_latest_issue(issue_list):
+    sunpy = issue_list[0]
+    newer_sunpy = sunpy.model_copy(
+        update={
+            "url": "https://api.github.com/repos/pyOpenSci/software-submission/issues/200",
+            "updated_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        }
+    )
+    process_issues = ProcessIssues(GitHubAPI())
+
+    for issues in ([sunpy, newer_sunpy], [newer_sunpy, sunpy]):
+        reviews, _ = process_issues.parse_issues(issues)
+        assert reviews["sunpy"].issue_link.endswith("/200")
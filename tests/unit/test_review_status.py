@@ -0,0 +1,92 @@
+import pytest
+
+from pyosmeta.models.github import Labels
+from pyosmeta.review_status import (
+    ReviewStatus,
+    build_under_review,
+    classify_issues,
+    review_status,
+)
+
+pytestmark = pytest.mark.usefixtures("no_link_checks")
+
+
+def with_labels(issue, *names, state="open"):
+    return issue.model_copy(
+        update={
+            "labels": [Labels(name=name) for name in names],
+            "state": state,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "labels, expected",
+    [
+        (["0/presubmission"], ReviewStatus.PRESUBMISSION),
+        (["0/pre-review-checks", "bug"], ReviewStatus.PRE_REVIEW),
+        (["3/reviewers-assigned"], ReviewStatus.UNDER_REVIEW),
+        (
+            ["4/reviews-in-awaiting-changes", "6/pyOS-approved"],
+            ReviewStatus.ACCEPTED,
+        ),
+        (["6/pyos-approved"], ReviewStatus.ACCEPTED),
+        (["question"], None),
+        # JOSS approval alone doesn't mark a pyOpenSci review as accepted
+        (["9/joss-approved"], None),
+        (
+            ["4/reviews-in-awaiting-changes", "9/joss-approved"],
+            ReviewStatus.UNDER_REVIEW,
+        ),
+    ],
+)
+def test_review_status(issue_list, labels, expected):
+    assert review_status(with_labels(issue_list[0], *labels)) == expected
+
+
+def test_classify_issues_drops_closed_reviews_in_progress(issue_list):
+    sunpy, ncompare = issue_list
+    accepted = with_labels(sunpy, "6/pyOS-approved", state="closed")
+    in_review = with_labels(ncompare, "2/seeking-reviewers")
+    withdrawn = with_labels(ncompare, "2/seeking-reviewers", state="closed")
+
+    groups = classify_issues([accepted, in_review, withdrawn])
+
+    assert groups[ReviewStatus.ACCEPTED] == [accepted]
+    assert groups[ReviewStatus.UNDER_REVIEW] == [in_review]
+    assert groups[ReviewStatus.PRESUBMISSION] == []
+
+
+def test_build_under_review(process_issues, issue_list):
+    sunpy, ncompare = issue_list
+    groups = classify_issues(
+        [
+            with_labels(sunpy, "0/presubmission"),
+            with_labels(ncompare, "3/reviewers-assigned"),
+        ]
+    )
+
+    entries = build_under_review(process_issues, groups)
+
+    assert [entry["package_name"] for entry in entries] == [
+        "ncompare",
+        "sunpy",
+    ]
+    assert entries[0]["review_status"] == "under-review"
+    assert entries[0]["editor"]["github_username"] == "tomalrussell"
+    assert "gh_meta" not in entries[0]
+
+
+def test_build_under_review_skips_unparseable_issues(
+    process_issues, issue_list
+):
+    broken = issue_list[1].model_copy(
+        update={
+            "body": "Package Name: broken\r\n",
+            "labels": [Labels(name="2/seeking-reviewers")],
+        }
+    )
+
+    entries = build_under_review(process_issues, classify_issues([broken]))
+
+    assert entries == []
@@ -1,10 +1,11 @@
 """Tests for the clean helper functions located in the utils_clean module."""
 
+from datetime import date
+
 import pytest
 
 from pyosmeta.utils_clean import (
     clean_date,
-    clean_date_accepted_key,
     clean_markdown,
     clean_name,
     get_clean_user,
@@ -21,9 +22,18 @@ from pyosmeta.utils_clean import (
         # packages.yml export) must round-trip unchanged.
         ("2024-03-07", "2024-03-07"),
         ("2024-02-28", "2024-02-28"),
+        # Legacy month-day-year dates entered manually in reviews
+        ("01/18/2024", "2024-01-18"),
+        ("1-8-2024", "2024-01-08"),
+        ("2024/1/8", "2024-01-08"),
+        # Unquoted dates are loaded from YAML as date objects
+        (date(2024, 3, 7), "2024-03-07"),
         # Test cases for missing dates
         (None, "missing"),
         ("missing", "missing"),
+        ("TBD", "missing"),
+        # Matches a date format but isn't a real date
+        ("2024-13-01", "missing"),
         # Unparsable input shouldn't raise, just fall back to "missing"
         ("not-a-date", "missing"),
     ],
@@ -69,30 +79,6 @@ def test_clean_name(input_name, expected_output):
     assert clean_name(input_name) == expected_output
 
 
-@pytest.mark.parametrize(
-    "input_dict, expected_output",
-    [
-        # Test case where key starts with "date_accepted"
-        (
-            {"date_accepted_(month-day-year)": "2024-03-07"},
-            {"date_accepted": "2024-03-07"},
-        ),
-        (
-            {"date_accepted_(month/day/year)": "2024/03/07"},
-            {"date_accepted": "2024/03/07"},
-        ),
-        # Test where key does not start with "date_accepted"
-        ({"other_key": "value"}, {"other_key": "value"}),
-        (
-            {"date_accepted": "2024-03-07"},
-            {"date_accepted": "2024-03-07"},
-        ),
-    ],
-)
-def test_clean_date_accepted_key(input_dict, expected_output):
-    assert clean_date_accepted_key(input_dict) == expected_output
-
-
 @pytest.mark.parametrize(
     "input_username, expected_output",
     [
@@ -1,6 +1,7 @@
 """Tests for parse helper functions located in utils_parse module."""
 
 import pytest
+from pydantic import ValidationError
 
 from pyosmeta.models import ReviewUser
 from pyosmeta.utils_parse import parse_user_names
@@ -23,3 +24,12 @@ from pyosmeta.utils_parse import parse_user_names
 )
 def test_parse_user_names(name, expected_result):
     assert parse_user_names(name) == expected_result
+
+
+def test_parse_user_names_memoized():
+    """Repeated user strings are parsed once and share one immutable user"""
+    first = parse_user_names("Test User (@test5user)")
+    assert parse_user_names("Test User (@test5user)") is first
+
+    with pytest.raises(ValidationError):
+        first.name = "Someone Else"
@@ -0,0 +1,178 @@
+import hashlib
+import hmac
+import json
+import threading
+
+import pytest
+import requests
+
+from pyosmeta.github_api import GitHubAPI
+from pyosmeta.models import GhMeta
+from pyosmeta.parse_issues import ProcessIssues
+from pyosmeta.webhooks import ReviewStore, WebhookService
+
+pytestmark = pytest.mark.usefixtures("no_link_checks")
+
+ISSUE_URL = (
+    "https://api.github.com/repos/pyOpenSci/software-submission/issues/147"
+)
+
+
+@pytest.fixture
+def payload(data_file):
+    def make(action="edited", labels=("6/pyOS-approved",), body=None):
+        return {
+            "action": action,
+            "repository": {"full_name": "pyOpenSci/software-submission"},
+            "issue": {
+                "url": ISSUE_URL,
+                "repository_url": "https://api.github.com/repos/pyOpenSci/software-submission",
+                "number": 147,
+                "title": "`fake_package` Review",
+                "comments": 0,
+                "created_at": "2024-01-01T00:00:00Z",
+                "updated_at": "2024-06-30T00:00:00Z",
+                "labels": [{"name": label} for label in labels],
+                "body": body
+                or data_file("reviews/github_submission.txt", True),
+            },
+        }
+
+    return make
+
+
+@pytest.fixture
+def regenerated():
+    return []
+
+
+@pytest.fixture
+def service(tmp_path, regenerated):
+    github_api = GitHubAPI(
+        org="pyopensci",
+        repo="software-submission",
+        labels=["6/pyOS-approved"],
+    )
+    return WebhookService(
+        ProcessIssues(github_api),
+        ReviewStore(tmp_path / "all_reviews.pickle"),
+        regenerated.append,
+        debounce=60,
+    )
+
+
+def post(service, event, payload):
+    return service.handle(event, json.dumps(payload).encode())
+
+
+def test_edited_issue_updates_the_store(service, payload, regenerated):
+    assert post(service, "issues", payload()) == (200, "Updated fake_package")
+    assert list(service.store.reviews) == ["fake_package"]
+    # The store is saved, so it can be reloaded
+    assert list(ReviewStore(service.store.path).reviews) == ["fake_package"]
+
+    # packages.yml is only regenerated once changes stop
+    assert regenerated == []
+    service.flush()
+    assert list(regenerated[0]) == ["fake_package"]
+    service.flush()
+    assert len(regenerated) == 1
+
+
+@pytest.fixture
+def gh_meta(service, payload):
+    post(service, "issues", payload())
+    gh_meta = GhMeta.model_construct(stargazers_count=3)
+    reviews = service.store.reviews
+    reviews["fake_package"] = reviews["fake_package"].model_copy(
+        update={"gh_meta": gh_meta}
+    )
+    return gh_meta
+
+
+def test_edit_keeps_gh_meta(service, payload, gh_meta):
+    post(service, "issues", payload())
+
+    assert service.store.reviews["fake_package"].gh_meta is gh_meta
+
+
+def test_rename_keeps_gh_meta(service, payload, data_file, gh_meta):
+    renamed = data_file("reviews/github_submission.txt", True).replace(
+        "Package Name: fake_package", "Package Name: real_package"
+    )
+
+    post(service, "issues", payload(body=renamed))
+
+    assert list(service.store.reviews) == ["real_package"]
+    assert service.store.reviews["real_package"].gh_meta is gh_meta
+
+
+def test_unlabeled_or_deleted_issue_is_removed(service, payload):
+    post(service, "issues", payload())
+    status, message = post(service, "issues", payload("unlabeled", ()))
+    assert (status, message) == (200, "Removed fake_package")
+    assert len(service.store) == 0
+
+    post(service, "issues", payload())
+    post(service, "issues", payload("deleted"))
+    assert len(service.store) == 0
+
+
+def test_network_error_fails_the_delivery(service, payload, mocker):
+    mocker.patch(
+        "pyosmeta.utils_clean.is_doi", side_effect=requests.ConnectionError
+    )
+
+    status, _ = post(service, "issues", payload())
+
+    assert status == 503
+    assert len(service.store) == 0
+
+
+def test_ignored_deliveries(service, payload):
+    assert service.handle("ping", b"{}") == (200, "pong")
+    assert post(service, "push", {})[0] == 202
+    assert post(service, "issues", payload("assigned"))[0] == 202
+    other_repo = payload() | {"repository": {"full_name": "a/b"}}
+    assert post(service, "issues", other_repo)[0] == 202
+    assert service.handle("issues", b"not json")[0] == 400
+    assert len(service.store) == 0
+
+
+def test_signature(service, payload):
+    service.secret = "secret"
+    body = json.dumps(payload()).encode()
+    signature = (
+        "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    )
+    assert service.handle("issues", body, "sha256=bad")[0] == 401
+    assert service.handle("issues", body)[0] == 401
+    assert service.handle("issues", body, signature)[0] == 200
+
+
+def test_posted_payloads_are_debounced(service, payload, regenerated):
+    service.debounce = 0.1
+    done = threading.Event()
+    service.regenerate = lambda reviews: (
+        regenerated.append(reviews),
+        done.set(),
+    )
+    server = service.make_server("localhost", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://localhost:{server.server_address[1]}"
+    try:
+        for _ in range(3):
+            response = requests.post(
+                url,
+                data=json.dumps(payload()),
+                headers={"X-GitHub-Event": "issues"},
+                timeout=10,
+            )
+            assert response.status_code == 200
+            assert response.text == "Updated fake_package"
+        assert done.wait(5)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert len(regenerated) == 1